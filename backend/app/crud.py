@@ -76,6 +76,41 @@ def delete_button_group(db: Session, group_id: int) -> bool:
     db.delete(grp); db.commit()
     return True
 
+def get_screensaver_items(db: Session):
+    return (
+        db.query(models.ScreensaverItem)
+        .order_by(models.ScreensaverItem.order_index, models.ScreensaverItem.id)
+        .all()
+    )
+
+def create_screensaver_item(db: Session, data: dict) -> models.ScreensaverItem:
+    item = models.ScreensaverItem(**data)
+    db.add(item); db.commit(); db.refresh(item)
+    return item
+
+def update_screensaver_item(db: Session, item_id: int, data: dict) -> models.ScreensaverItem | None:
+    item = db.get(models.ScreensaverItem, item_id)
+    if not item: return None
+    for k, v in data.items():
+        if v is not None:
+            setattr(item, k, v)
+    db.commit(); db.refresh(item)
+    return item
+
+def delete_screensaver_item(db: Session, item_id: int) -> bool:
+    item = db.get(models.ScreensaverItem, item_id)
+    if not item: return False
+    db.delete(item); db.commit()
+    return True
+
+def screensaver_payload(db: Session, s: models.Settings) -> dict:
+    """Screensaver block of /config: the legacy single path plus the ordered playlist."""
+    return {
+        "path": getattr(s, 'screensaver_path', None),
+        "timeout": int(getattr(s, 'screensaver_timeout', 0) or 0),
+        "items": [{"path": it.path, "duration": int(it.duration or 0)} for it in get_screensaver_items(db)],
+    }
+
 def get_menu_tree(db: Session):
     groups = get_button_groups(db)
     out = []
@@ -173,6 +208,9 @@ def ensure_theme_columns(db: Session):
     if 'bg_image_path' not in names:
         db.execute(text("ALTER TABLE themes ADD COLUMN bg_image_path VARCHAR(255)"))
         db.commit()
+    if 'bg_image_fit' not in names:
+        db.execute(text("ALTER TABLE themes ADD COLUMN bg_image_fit VARCHAR(10) DEFAULT 'cover'"))
+        db.commit()
 
 def list_pages(db: Session):
     return db.query(models.Page).all()
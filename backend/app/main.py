@@ -2,6 +2,7 @@
 
 import os
 import shutil
+import threading
 import time
 import json
 import jwt
@@ -28,8 +29,11 @@ from .schemas import (
     UserCreate, UserOut,
     SettingsUpdate, ThemeUpdate, ScreensaverUpdate,
     ButtonGroupCreate, ButtonGroupUpdate, ButtonGroupOut,
+    ScreensaverItemCreate, ScreensaverItemUpdate, ScreensaverItemOut, ScreensaverReorderPayload,
+    WeatherOut,
 )
 from .crud import get_user_by_username, verify_password, ensure_admin_user
+from .weather import WeatherProxy
 
 # helpers
 def _next_button_order(db):
@@ -67,16 +71,33 @@ templates = Jinja2Templates(directory=TEMPLATES_DIR)
 
 # -------------------- Simple in-process event bus (SSE) --------------------
 _event_subs: set[asyncio.Queue] = set()
+_event_loop: Optional[asyncio.AbstractEventLoop] = None
 
-def _publish_event(data: dict):
+def _deliver_event(data: dict):
     for q in list(_event_subs):
         try:
             q.put_nowait(data)
         except Exception:
             pass
 
+def _publish_event(data: dict):
+    # sync endpoints and background threads hand the event over to the loop
+    try:
+        running = asyncio.get_running_loop()
+    except RuntimeError:
+        running = None
+    if _event_loop is not None and running is not _event_loop:
+        try:
+            _event_loop.call_soon_threadsafe(_deliver_event, data)
+            return
+        except RuntimeError:
+            pass
+    _deliver_event(data)
+
 @app.get("/events")
 async def events(request: Request):
+    global _event_loop
+    _event_loop = asyncio.get_running_loop()
     q: asyncio.Queue = asyncio.Queue(maxsize=32)
     _event_subs.add(q)
     async def gen():
@@ -275,13 +296,37 @@ def get_config(db=Depends(get_db)):
         "footer_qr_text": s.footer_qr_text,
         "footer_clock_format": s.footer_clock_format,
         "theme": s.theme,
-        "screensaver": {"path": getattr(s, 'screensaver_path', None), "timeout": int(getattr(s, 'screensaver_timeout', 0) or 0)},
+        "screensaver": crud.screensaver_payload(db, s),
         "show_weather": bool(getattr(s, 'show_weather', False)),
         "weather_city": getattr(s, 'weather_city', None),
     }
     return payload
 
 
+# -------------------- Weather (shared by all kiosks) --------------------
+weather_proxy = WeatherProxy(SessionLocal, publish=_publish_event)
+
+def _weather_city(db) -> Optional[str]:
+    s = crud.get_settings(db)
+    if not getattr(s, 'show_weather', False):
+        return None
+    return getattr(s, 'weather_city', None)
+
+def _weather_refresh_loop():
+    while True:
+        try:
+            with SessionLocal() as db:
+                city = _weather_city(db)
+            weather_proxy.get(city)
+        except Exception:
+            pass
+        time.sleep(min(60, weather_proxy.ttl))
+
+@app.get("/weather", response_model=WeatherOut)
+def get_weather(db=Depends(get_db)):
+    return weather_proxy.get(_weather_city(db)) or {}
+
+
 @app.get("/home/buttons", response_model=List[ButtonOut])
 def get_home_buttons(db=Depends(get_db)):
     return crud.get_home_buttons(db)
@@ -628,6 +673,8 @@ def update_theme(payload: ThemeUpdate, db=Depends(get_db), user=Depends(require_
             setattr(theme, field, data[field])
     if "bg_image_path" in data:
         theme.bg_image_path = (data.get("bg_image_path") or None)
+    if data.get("bg_image_fit"):
+        theme.bg_image_fit = data["bg_image_fit"]
     db.commit(); db.refresh(theme)
     try:
         _publish_event({"type": "config_updated"})
@@ -639,7 +686,7 @@ def update_theme(payload: ThemeUpdate, db=Depends(get_db), user=Depends(require_
 @app.get("/admin/screensaver", response_model=ScreensaverOut)
 def get_screensaver(db=Depends(get_db), user=Depends(require_user)):
     s = crud.get_settings(db)
-    return {"path": getattr(s, 'screensaver_path', None), "timeout": int(getattr(s, 'screensaver_timeout', 0) or 0)}
+    return crud.screensaver_payload(db, s)
 
 @app.put("/admin/screensaver", response_model=ScreensaverOut)
 def update_screensaver(payload: ScreensaverUpdate, db=Depends(get_db), user=Depends(require_user)):
@@ -660,7 +707,70 @@ def update_screensaver(payload: ScreensaverUpdate, db=Depends(get_db), user=Depe
         _publish_event({"type": "config_updated"})
     except Exception:
         pass
-    return {"path": s.screensaver_path, "timeout": int(getattr(s, 'screensaver_timeout', 0) or 0)}
+    return crud.screensaver_payload(db, s)
+
+
+# Screensaver playlist: shown in order_index order, each item for `duration` seconds
+def _screensaver_changed() -> None:
+    try:
+        _publish_event({"type": "config_updated"})
+    except Exception:
+        pass
+
+
+@app.get("/admin/screensaver/items", response_model=List[ScreensaverItemOut])
+def list_screensaver_items(db=Depends(get_db), user=Depends(require_user)):
+    return crud.get_screensaver_items(db)
+
+
+@app.post("/admin/screensaver/items", response_model=ScreensaverItemOut)
+def create_screensaver_item(payload: ScreensaverItemCreate, db=Depends(get_db), user=Depends(require_user)):
+    data = payload.model_dump()
+    if not data.get("path"):
+        raise HTTPException(400, "Не указан файл")
+    data["duration"] = max(0, int(data.get("duration") or 0))
+    if not data.get("order_index"):
+        items = crud.get_screensaver_items(db)
+        data["order_index"] = (max((it.order_index or 0) for it in items) + 1) if items else 1
+    item = crud.create_screensaver_item(db, data)
+    _screensaver_changed()
+    return item
+
+
+@app.put("/admin/screensaver/items/{item_id}", response_model=ScreensaverItemOut)
+def update_screensaver_item(item_id: int, payload: ScreensaverItemUpdate, db=Depends(get_db), user=Depends(require_user)):
+    data = payload.model_dump(exclude_unset=True)
+    if data.get("duration") is not None:
+        data["duration"] = max(0, int(data["duration"]))
+    item = crud.update_screensaver_item(db, item_id, data)
+    if not item:
+        raise HTTPException(404, "Элемент не найден")
+    _screensaver_changed()
+    return item
+
+
+@app.post("/admin/screensaver/items/reorder")
+def reorder_screensaver_items(payload: ScreensaverReorderPayload, db=Depends(get_db), user=Depends(require_user)):
+    by_id = {it.id: it for it in crud.get_screensaver_items(db)}
+    updated = 0
+    for it in payload.items:
+        item = by_id.get(it.id)
+        if not item:
+            continue
+        item.order_index = it.order_index
+        updated += 1
+    db.commit()
+    if updated:
+        _screensaver_changed()
+    return {"ok": True, "updated": updated}
+
+
+@app.delete("/admin/screensaver/items/{item_id}")
+def delete_screensaver_item(item_id: int, db=Depends(get_db), user=Depends(require_user)):
+    if not crud.delete_screensaver_item(db, item_id):
+        raise HTTPException(404, "Элемент не найден")
+    _screensaver_changed()
+    return {"ok": True}
 
 
 class ExitCheck(BaseModel):
@@ -730,3 +840,4 @@ def _startup():
             ensure_admin_user(db)
     except Exception:
         pass
+    threading.Thread(target=_weather_refresh_loop, name="weather-refresh", daemon=True).start()
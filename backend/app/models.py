@@ -1,6 +1,6 @@
 from typing import Optional
 
-from sqlalchemy import Column, Integer, String, Boolean, ForeignKey, Text
+from sqlalchemy import Column, Integer, String, Boolean, ForeignKey, Text, Float
 from sqlalchemy.orm import relationship, Mapped, mapped_column
 
 from .db import Base
@@ -22,6 +22,7 @@ class Theme(Base):
     text: Mapped[str] = mapped_column(String(20), default="#0f1419")
     logo_path: Mapped[str | None] = mapped_column(String(255), nullable=True)
     bg_image_path: Mapped[str | None] = mapped_column(String(255), nullable=True)
+    bg_image_fit: Mapped[str] = mapped_column(String(10), default="cover")
 
 class Settings(Base):
     __tablename__ = "settings"
@@ -41,6 +42,21 @@ class Settings(Base):
     screensaver_path: Mapped[str | None] = mapped_column(String(255), nullable=True)
     screensaver_timeout: Mapped[int] = mapped_column(Integer, default=0)
 
+class ScreensaverItem(Base):
+    __tablename__ = "screensaver_items"
+    id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
+    path: Mapped[str] = mapped_column(String(255))
+    # seconds on screen; 0 = a video plays to its end, an image uses the kiosk default
+    duration: Mapped[int] = mapped_column(Integer, default=0)
+    order_index: Mapped[int] = mapped_column(Integer, default=0)
+
+class GeocodeCache(Base):
+    __tablename__ = "geocode_cache"
+    city_key: Mapped[str] = mapped_column(String(120), primary_key=True)
+    name: Mapped[str] = mapped_column(String(120))
+    latitude: Mapped[float] = mapped_column(Float)
+    longitude: Mapped[float] = mapped_column(Float)
+
 class Page(Base):
     __tablename__ = "pages"
     id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
@@ -1,6 +1,6 @@
 # backend/app/schemas.py
 from pydantic import BaseModel
-from typing import Optional, List, Dict
+from typing import Optional, List, Dict, Literal
 
 class ThemeOut(BaseModel):
     id: int
@@ -10,11 +10,17 @@ class ThemeOut(BaseModel):
     text: str
     logo_path: Optional[str] = None
     bg_image_path: Optional[str] = None
+    bg_image_fit: Optional[str] = "cover"
     class Config: from_attributes = True
 
+class ScreensaverPlaylistItem(BaseModel):
+    path: str
+    duration: int = 0
+
 class ScreensaverOut(BaseModel):
     path: Optional[str] = None
     timeout: int = 0
+    items: List[ScreensaverPlaylistItem] = []
 
 class ConfigOut(BaseModel):
     org_name: str
@@ -25,6 +31,12 @@ class ConfigOut(BaseModel):
     show_weather: bool | None = None
     weather_city: Optional[str] = None
 
+class WeatherOut(BaseModel):
+    city: Optional[str] = None
+    temperature: Optional[float] = None
+    code: Optional[int] = None
+    fetched_at: Optional[float] = None
+
 class SettingsUpdate(BaseModel):
     org_name: Optional[str] = None
     logo_path: Optional[str] = None
@@ -37,6 +49,7 @@ class ThemeUpdate(BaseModel):
     bg: Optional[str] = None
     text: Optional[str] = None
     bg_image_path: Optional[str] = None
+    bg_image_fit: Optional[Literal["cover", "contain"]] = None
 
 class ScreensaverUpdate(BaseModel):
     path: Optional[str] = None
@@ -120,3 +133,28 @@ class ButtonGroupUpdate(BaseModel):
 class ButtonGroupOut(ButtonGroupBase):
     id: int
     class Config: from_attributes = True
+
+# -------- Screensaver playlist --------
+class ScreensaverItemBase(BaseModel):
+    path: str
+    duration: int = 0
+    order_index: int = 0
+
+class ScreensaverItemCreate(ScreensaverItemBase):
+    pass
+
+class ScreensaverItemUpdate(BaseModel):
+    path: Optional[str] = None
+    duration: Optional[int] = None
+    order_index: Optional[int] = None
+
+class ScreensaverItemOut(ScreensaverItemBase):
+    id: int
+    class Config: from_attributes = True
+
+class ScreensaverItemOrder(BaseModel):
+    id: int
+    order_index: int
+
+class ScreensaverReorderPayload(BaseModel):
+    items: List[ScreensaverItemOrder]
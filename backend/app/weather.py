@@ -0,0 +1,157 @@
+from __future__ import annotations
+
+import json
+import os
+import threading
+import time
+import urllib.parse
+import urllib.request
+from typing import Callable, Dict, Optional
+
+from . import models
+
+GEOCODE_URL = os.getenv("WEATHER_GEOCODE_URL", "https://geocoding-api.open-meteo.com/v1/search")
+FORECAST_URL = os.getenv("WEATHER_FORECAST_URL", "https://api.open-meteo.com/v1/forecast")
+FORECAST_TTL = int(os.getenv("WEATHER_TTL", "600"))
+RETRY_AFTER = 60
+
+
+def _get_json(url: str, params: dict, timeout: float) -> dict:
+    query = urllib.parse.urlencode(params)
+    with urllib.request.urlopen(f"{url}?{query}", timeout=timeout) as response:
+        return json.loads(response.read().decode("utf-8") or "{}")
+
+
+class WeatherProxy:
+    """Shared weather cache for every kiosk.
+
+    The city is geocoded once and kept in the ``geocode_cache`` table; the
+    forecast is kept in memory for ``ttl`` seconds. Concurrent misses wait for
+    a single upstream request and a failed request is not retried for
+    ``RETRY_AFTER`` seconds. ``publish`` is called with the new reading
+    whenever the displayed value changes.
+    """
+
+    def __init__(
+        self,
+        session_factory,
+        *,
+        geocode_url: str = GEOCODE_URL,
+        forecast_url: str = FORECAST_URL,
+        ttl: float = FORECAST_TTL,
+        timeout: float = 6,
+        publish: Optional[Callable[[dict], None]] = None,
+    ):
+        self.session_factory = session_factory
+        self.geocode_url = geocode_url
+        self.forecast_url = forecast_url
+        self.ttl = ttl
+        self.timeout = timeout
+        self.publish = publish
+        self.upstream_calls = 0
+        self._readings: Dict[str, dict] = {}
+        self._retry_at: Dict[str, float] = {}
+        self._refresh_lock = threading.Lock()
+
+    def get(self, city: Optional[str]) -> Optional[dict]:
+        """Return ``{city, temperature, code, fetched_at}`` for *city* or ``None``.
+
+        An expired reading is still returned when the upstream is unavailable.
+        """
+        city = (city or "").strip()
+        if not city:
+            return None
+        key = city.casefold()
+        reading = self._fresh(key)
+        if reading is not None:
+            return reading
+        with self._refresh_lock:
+            reading = self._fresh(key)
+            if reading is not None:
+                return reading
+            previous = self._readings.get(key)
+            if time.time() < self._retry_at.get(key, 0):
+                return previous
+            try:
+                reading = self._fetch(city)
+            except Exception:
+                reading = None
+            if reading is None:
+                self._retry_at[key] = time.time() + RETRY_AFTER
+                return previous
+            self._retry_at.pop(key, None)
+            self._readings[key] = reading
+        if self.publish is not None and _shown(reading) != _shown(previous):
+            try:
+                self.publish({"type": "weather_updated", "weather": reading})
+            except Exception:
+                pass
+        return reading
+
+    def _fresh(self, key: str) -> Optional[dict]:
+        reading = self._readings.get(key)
+        if reading is not None and time.time() - reading["fetched_at"] < self.ttl:
+            return reading
+        return None
+
+    def _fetch(self, city: str) -> Optional[dict]:
+        location = self._geocode(city)
+        if location is None:
+            return None
+        self.upstream_calls += 1
+        forecast = _get_json(
+            self.forecast_url,
+            {
+                "latitude": location.latitude,
+                "longitude": location.longitude,
+                "current_weather": "true",
+                "timezone": "auto",
+            },
+            self.timeout,
+        )
+        current = forecast.get("current_weather") or {}
+        temp = current.get("temperature")
+        code = current.get("weathercode")
+        return {
+            "city": location.name,
+            "temperature": float(temp) if isinstance(temp, (int, float)) else None,
+            "code": int(code) if isinstance(code, (int, float)) else None,
+            "fetched_at": time.time(),
+        }
+
+    def _geocode(self, city: str) -> Optional[models.GeocodeCache]:
+        key = city.casefold()
+        db = self.session_factory()
+        try:
+            row = db.get(models.GeocodeCache, key)
+            if row is not None:
+                db.expunge(row)
+                return row
+            self.upstream_calls += 1
+            geo = _get_json(
+                self.geocode_url,
+                {"name": city, "count": 1, "language": "ru", "format": "json"},
+                self.timeout,
+            )
+            results = geo.get("results") or []
+            if not results or results[0].get("latitude") is None or results[0].get("longitude") is None:
+                return None
+            row = models.GeocodeCache(
+                city_key=key,
+                name=results[0].get("name") or city,
+                latitude=float(results[0]["latitude"]),
+                longitude=float(results[0]["longitude"]),
+            )
+            db.add(row)
+            db.commit()
+            db.refresh(row)
+            db.expunge(row)
+            return row
+        finally:
+            db.close()
+
+
+def _shown(reading: Optional[dict]) -> Optional[tuple]:
+    if reading is None:
+        return None
+    return reading.get("city"), reading.get("temperature"), reading.get("code")
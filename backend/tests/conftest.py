@@ -1,11 +1,15 @@
 ﻿import os
 import tempfile
+from types import SimpleNamespace
 import pytest
 from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
 
 os.environ.setdefault('SECURE_COOKIES', '0')
 
-from app.main import app, SessionLocal, Base, engine
+from app.main import app, SessionLocal, Base, engine, get_db, require_user
+from .open_meteo import open_meteo  # noqa: F401
 
 @pytest.fixture(scope='session', autouse=True)
 def _prepare_db():
@@ -19,3 +23,23 @@ def _prepare_db():
 @pytest.fixture()
 def client():
     return TestClient(app)
+
+@pytest.fixture()
+def admin_client(tmp_path):
+    # signed-in admin against a throwaway database, so tests can write
+    test_engine = create_engine(f'sqlite:///{tmp_path / "kiosk.db"}', connect_args={'check_same_thread': False})
+    Base.metadata.create_all(bind=test_engine)
+    Session = sessionmaker(autocommit=False, autoflush=False, bind=test_engine)
+
+    def _get_db():
+        db = Session()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    app.dependency_overrides[get_db] = _get_db
+    app.dependency_overrides[require_user] = lambda: SimpleNamespace(username='admin')
+    yield TestClient(app)
+    app.dependency_overrides.clear()
+    test_engine.dispose()
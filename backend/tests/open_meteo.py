@@ -0,0 +1,56 @@
+import http.server
+import json
+import threading
+import time
+from urllib.parse import urlsplit
+
+import pytest
+
+
+class OpenMeteoHandler(http.server.BaseHTTPRequestHandler):
+    """Stand-in for the open-meteo geocoding (``/search``) and forecast APIs."""
+
+    calls = []
+    fail = False
+    delay = 0.0
+    temperature = 3.4
+    code = 2
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        cls = type(self)
+        route = urlsplit(self.path).path
+        cls.calls.append(route)
+        if cls.delay:
+            time.sleep(cls.delay)
+        if cls.fail:
+            self.send_error(503)
+            return
+        if route == "/search":
+            payload = {"results": [{"name": "Минск", "latitude": 53.9, "longitude": 27.56}]}
+        else:
+            payload = {"current_weather": {"temperature": cls.temperature, "weathercode": cls.code}}
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+@pytest.fixture()
+def open_meteo():
+    """Yield ``({"geocode_url", "forecast_url"}, handler)``; handler attributes shape the replies."""
+    OpenMeteoHandler.calls = []
+    OpenMeteoHandler.fail = False
+    OpenMeteoHandler.delay = 0.0
+    OpenMeteoHandler.temperature = 3.4
+    OpenMeteoHandler.code = 2
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), OpenMeteoHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base = f"http://127.0.0.1:{server.server_address[1]}"
+    yield {"geocode_url": f"{base}/search", "forecast_url": f"{base}/forecast"}, OpenMeteoHandler
+    server.shutdown()
+    server.server_close()
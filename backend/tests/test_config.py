@@ -11,3 +11,12 @@ def test_config_fields(client: TestClient):
     # weather fields present
     assert 'show_weather' in j
     assert 'weather_city' in j
+
+
+def test_config_shape_on_current_schema(admin_client: TestClient):
+    # the committed kiosk.db may predate newer columns; check them on a fresh schema
+    r = admin_client.get('/config')
+    assert r.status_code == 200
+    j = r.json()
+    assert j['theme']['bg_image_fit'] in ('cover', 'contain')
+    assert isinstance(j['screensaver']['items'], list)
@@ -0,0 +1,36 @@
+from fastapi.testclient import TestClient
+
+
+def _playlist(client: TestClient):
+    r = client.get('/config')
+    assert r.status_code == 200
+    return [(it['path'], it['duration']) for it in r.json()['screensaver']['items']]
+
+
+def test_screensaver_items_crud_and_order(admin_client: TestClient):
+    a = admin_client.post('/admin/screensaver/items', json={'path': '/media/a.jpg', 'duration': 8}).json()
+    b = admin_client.post('/admin/screensaver/items', json={'path': '/media/b.mp4'}).json()
+    c = admin_client.post('/admin/screensaver/items', json={'path': '/media/c.gif', 'duration': -5}).json()
+    assert [a['order_index'], b['order_index'], c['order_index']] == [1, 2, 3]
+    assert c['duration'] == 0
+    assert admin_client.post('/admin/screensaver/items', json={'path': ''}).status_code == 400
+    assert _playlist(admin_client) == [('/media/a.jpg', 8), ('/media/b.mp4', 0), ('/media/c.gif', 0)]
+
+    r = admin_client.put(f"/admin/screensaver/items/{b['id']}", json={'duration': 15})
+    assert r.status_code == 200 and r.json()['duration'] == 15 and r.json()['path'] == '/media/b.mp4'
+    assert admin_client.put('/admin/screensaver/items/9999', json={'duration': 1}).status_code == 404
+
+    r = admin_client.post('/admin/screensaver/items/reorder', json={'items': [
+        {'id': c['id'], 'order_index': 1},
+        {'id': a['id'], 'order_index': 2},
+        {'id': b['id'], 'order_index': 3},
+        {'id': 9999, 'order_index': 4},
+    ]})
+    assert r.json() == {'ok': True, 'updated': 3}
+    assert _playlist(admin_client) == [('/media/c.gif', 0), ('/media/a.jpg', 8), ('/media/b.mp4', 15)]
+
+    assert admin_client.delete(f"/admin/screensaver/items/{a['id']}").json() == {'ok': True}
+    assert admin_client.delete(f"/admin/screensaver/items/{a['id']}").status_code == 404
+    listed = admin_client.get('/admin/screensaver/items').json()
+    assert [it['path'] for it in listed] == ['/media/c.gif', '/media/b.mp4']
+    assert _playlist(admin_client) == [('/media/c.gif', 0), ('/media/b.mp4', 15)]
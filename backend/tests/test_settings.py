@@ -9,3 +9,8 @@ def test_update_settings_weather(client: TestClient):
 def test_update_theme_requires_auth(client: TestClient):
     r = client.put('/admin/theme', json={'bg': '#ffffff'})
     assert r.status_code in (401, 403)
+
+
+def test_screensaver_items_require_auth(client: TestClient):
+    r = client.post('/admin/screensaver/items', json={'path': '/media/promo.jpg', 'duration': 8})
+    assert r.status_code in (401, 403)
@@ -0,0 +1,46 @@
+import threading
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.db import Base
+from app.weather import WeatherProxy
+
+
+@pytest.fixture()
+def session_factory(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'weather.db'}", connect_args={"check_same_thread": False})
+    Base.metadata.create_all(bind=engine)
+    return sessionmaker(bind=engine)
+
+
+def test_concurrent_misses_share_one_upstream_request(open_meteo, session_factory):
+    urls, handler = open_meteo
+    handler.delay = 0.1
+    events = []
+    proxy = WeatherProxy(session_factory, publish=events.append, **urls)
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(proxy.get("Minsk"))) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(5)
+    assert len(results) == 8 and all(r["temperature"] == 3.4 for r in results)
+    assert handler.calls == ["/search", "/forecast"]
+    assert [e["type"] for e in events] == ["weather_updated"]
+
+
+def test_geocode_is_kept_and_changes_are_published(open_meteo, session_factory):
+    urls, handler = open_meteo
+    WeatherProxy(session_factory, **urls).get("Minsk")
+
+    events = []
+    proxy = WeatherProxy(session_factory, ttl=0, publish=events.append, **urls)
+    proxy.get("Minsk")
+    proxy.get("Minsk")
+    handler.temperature = -2.0
+    assert proxy.get("Minsk")["temperature"] == -2.0
+    assert handler.calls.count("/search") == 1
+    assert handler.calls.count("/forecast") == 4
+    assert [e["weather"]["temperature"] for e in events] == [3.4, -2.0]
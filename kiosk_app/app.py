@@ -1,9 +1,10 @@
 from __future__ import annotations
 
+import os
 import threading
-from typing import Dict, Optional
+from typing import Dict, Iterable, List, Optional
 
-from PySide6.QtCore import QEvent, QTimer, Qt
+from PySide6.QtCore import Qt, Signal
 from PySide6.QtGui import QAction, QFont
 from PySide6.QtWidgets import (
     QApplication,
@@ -16,53 +17,148 @@ from PySide6.QtWidgets import (
 
 from .backend.api import BackendAPI
 from .backend.media import MediaClient
+from .backend.store import ContentStore, content_revision
+from .backend.weather import WeatherReading, WeatherService
+from .config_diff import (
+    BACKGROUND,
+    CLOCK,
+    COLORS,
+    FULL,
+    LOGO,
+    ORG_NAME,
+    QR,
+    SCREENSAVER,
+    WEATHER,
+    config_changes,
+    screensaver_playlist,
+)
+from .idle_mode import IdleMode
+from .input_monitor import InputMonitor
+from .scheduler import TickScheduler
 from .theme import THEME_DEFAULT, build_background_qss, merge_theme
 from .ui import (
     AdminView,
+    BackgroundLayer,
     ExitPwdDialog,
     Footer,
     Header,
     HomePage,
+    PageCache,
     PageView,
+    PlayerPool,
     ScreensaverLayer,
+    VirtualHomePage,
     install_password_dialog_patch,
 )
 
+# the screensaver pipeline is built and pre-rolled this long before it shows
+SCREENSAVER_PREPARE_LEAD_MS = 5000
+CONFIG_POLL_MS = 5000
+# nothing on screen needs fresh config while the screensaver covers it
+IDLE_CONFIG_POLL_MS = 60000
+
+CONFIG_POLL_JOB = "config-poll"
+IDLE_JOB = "screensaver-idle"
+PREPARE_JOB = "screensaver-prepare"
+
+
+def _home_grid_mode() -> str:
+    return (os.getenv("KIOSK_HOME_GRID") or "widgets").strip().lower()
+
+
+def _open_store() -> Optional[ContentStore]:
+    try:
+        return ContentStore()
+    except Exception:
+        return None
+
+
+def _menu_slugs(menu: Iterable[dict]) -> List[str]:
+    slugs: List[str] = []
+    for node in menu or []:
+        items = node.get("items") if node.get("kind") == "group" else [node]
+        for item in items or []:
+            slug = (item or {}).get("target_slug")
+            if slug and slug not in slugs:
+                slugs.append(slug)
+    return slugs
+
+
+def _page_media(page: dict) -> List[str]:
+    paths: List[str] = []
+    blocks = page.get("blocks") if isinstance(page, dict) else None
+    for block in blocks or []:
+        if (block or {}).get("kind") in ("image", "pdf"):
+            path = (block.get("content") or {}).get("path")
+            if path:
+                paths.append(path)
+    return paths
+
 
 class App(QWidget):
+    config_synced = Signal(object)
+    menu_synced = Signal(object)
+    page_synced = Signal(str, object)
+    weather_synced = Signal(object)
+
     def __init__(self, backend: Optional[BackendAPI] = None) -> None:
         super().__init__()
         QApplication.setFont(QFont("Segoe UI", 10))
         self.setWindowTitle("Kiosk")
+        self.setObjectName("kioskRoot")
 
-        self.backend = backend or BackendAPI()
+        self.backend = backend or BackendAPI(store=_open_store())
         self.media = MediaClient(self.backend.base_url)
+        self.players = PlayerPool()
         install_password_dialog_patch(lambda: getattr(self, "theme", THEME_DEFAULT))
 
         self.theme = THEME_DEFAULT.copy()
+        self._config: Optional[dict] = None
         self._current_route = "home"
+        self._rendered_revisions: Dict[str, Optional[str]] = {"config": None, "menu": None}
+        self._sync_lock = threading.Lock()
+        self.config_synced.connect(self._apply_model)
+        self.menu_synced.connect(self._apply_menu)
+        self.page_synced.connect(self._apply_page)
+        self.weather = WeatherService(
+            store=self.backend.store,
+            fetcher=lambda _city: WeatherService.reading_from(self.backend.fetch_weather()),
+        )
+        self.weather.add_listener(self.weather_synced.emit)
+        self.weather_synced.connect(self._apply_weather)
+
+        # clocks, the config poll and the idle deadlines share one timer
+        self.ticks = TickScheduler(self)
+        # while the screensaver shows, the UI under it is hidden and its jobs slowed down
+        self.idle = IdleMode(
+            self.ticks,
+            lambda: (self.header, self.stack, self.footer),
+            paused=(Header.CLOCK_JOB, Footer.CLOCK_JOB),
+            slowed={CONFIG_POLL_JOB: (CONFIG_POLL_MS, IDLE_CONFIG_POLL_MS)},
+        )
 
         self.root_layout = QVBoxLayout(self)
         self.root_layout.setContentsMargins(0, 0, 0, 0)
         self.root_layout.setSpacing(0)
 
-        self.header = Header(self.theme, "Организация", self.media)
+        self.header = Header(self.theme, "Организация", self.media, ticks=self.ticks)
         self.stack = QStackedWidget()
-        self.footer = Footer(self.theme)
+        self._background = BackgroundLayer(self.stack, self.media)
+        self.footer = Footer(self.theme, ticks=self.ticks)
 
         self.root_layout.addWidget(self.header)
         self.root_layout.addWidget(self.stack, 1)
         self.root_layout.addWidget(self.footer)
 
-        self.home = HomePage(self.theme, self.route)
-        self.page = PageView(self.theme, self.route, self.media)
+        self.home = self._make_home()
         self.admin = AdminView(self.theme)
         self.stack.addWidget(self.home)
-        self.stack.addWidget(self.page)
         self.stack.addWidget(self.admin)
+        self.pages = PageCache(self.stack)
+        self.page: Optional[PageView] = None
 
-        self._screensaver_cfg: Dict[str, object] = {"path": None, "timeout": 0}
-        self._screensaver_layer = ScreensaverLayer(self.media, parent=self)
+        self._screensaver_cfg: Dict[str, object] = {"path": None, "timeout": 0, "items": []}
+        self._screensaver_layer = ScreensaverLayer(self.media, parent=self, players=self.players)
         self._screensaver_layer.set_exit_callback(self._on_screensaver_closed)
         self._screensaver_layer.hide()
         try:
@@ -70,12 +166,10 @@ class App(QWidget):
         except Exception:
             pass
 
-        self._idle_timer = QTimer(self)
-        self._idle_timer.setSingleShot(True)
-        self._idle_timer.timeout.connect(self._show_screensaver)
-
+        # input is observed on the top-level windows only, not app-wide
+        self.input = InputMonitor(self._on_input, self._ctx_menu_simple, self)
         try:
-            QApplication.instance().installEventFilter(self)
+            QApplication.instance().focusWindowChanged.connect(self.input.watch)
         except Exception:
             pass
         self.apply_global_styles()
@@ -89,32 +183,30 @@ class App(QWidget):
         except Exception:
             self._evt_thread = None
 
-        try:
-            cfg_timer = QTimer(self)
-            cfg_timer.setInterval(5000)
-            cfg_timer.timeout.connect(self._poll_config_changes)
-            cfg_timer.start()
-            self._cfg_timer = cfg_timer
-        except Exception:
-            self._cfg_timer = None
+        self.ticks.every(CONFIG_POLL_JOB, CONFIG_POLL_MS, self._poll_config_changes)
 
         try:
             self.setContextMenuPolicy(Qt.CustomContextMenu)
-            self.customContextMenuRequested.connect(self._ctx_menu_simple)
+            self.customContextMenuRequested.connect(lambda pos: self._ctx_menu_simple(self.mapToGlobal(pos)))
         except Exception:
             pass
 
     # ---------------------- Core behaviour ----------------------
     def apply_global_styles(self) -> None:
+        # Scoped to the window so it does not cascade over the application
+        # stylesheet that styles the tiles (see ui.styles.STYLES).
+        sheet = (
+            f"#kioskRoot {{ {build_background_qss(self.theme)} "
+            f"color:{self.theme['text']}; }}"
+        )
+        if sheet != self.styleSheet():
+            self.setStyleSheet(sheet)
         self._apply_home_background(self._current_route == "home")
 
     def _apply_home_background(self, enabled: bool) -> None:
-        include_image = enabled and bool(
-            self.theme.get("bg_image_local") or self.theme.get("bg_image_path")
-        )
-        self.setStyleSheet(
-            f"{build_background_qss(self.theme, include_image=include_image)} color:{self.theme['text']};"
-        )
+        """Show the home background layer; no stylesheet is touched."""
+        self._background.set_image(self.theme.get("bg_image_path"), self.theme.get("bg_image_fit"))
+        self._background.setVisible(enabled and self._background.has_image())
 
     def route(self, slug: str) -> None:
         self._handle_user_activity()
@@ -122,31 +214,68 @@ class App(QWidget):
         self._current_route = "home" if is_home else slug
         self._apply_home_background(is_home)
         if is_home:
-            self.stack.setCurrentIndex(0)
-            self.load_home()
+            # the grid on screen is current unless the menu revision moved on
+            self.stack.setCurrentWidget(self.home)
+            self._in_background(self._sync_menu)
             return
-        data = self.backend.fetch_page(slug)
+        data = self.backend.cached_page(slug)
+        fresh = data is None
+        if fresh:
+            data = self.backend.fetch_page(slug)
+        revision = content_revision(data)
+        view = self.pages.get(slug, revision)
+        if view is None:
+            view = self.pages.recycle(keep=self.page) or PageView(self.theme, self.route, self.media, self.players)
+            self._render_page(view, data)
+            self.pages.put(slug, revision, view)
+        self.page = view
+        self.stack.setCurrentWidget(view)
+        self.pages.trim(keep=view)
+        if not fresh:
+            self._in_background(lambda: self._sync_page(slug))
+
+    def _render_page(self, view: PageView, data: dict) -> None:
         try:
             blocks = data.get("blocks", []) if isinstance(data, dict) else []
-            self.page.render_blocks(blocks)
-            self.stack.setCurrentIndex(1)
+            view.render_blocks(blocks)
         except Exception as exc:
-            self.page.render_blocks([
+            view.render_blocks([
                 {
                     "kind": "text",
                     "content": {"html": f"<p>Ошибка загрузки страницы: {exc}</p>"},
                 }
             ])
-            self.stack.setCurrentIndex(1)
+
+    def _in_background(self, target) -> None:
+        try:
+            threading.Thread(target=target, daemon=True).start()
+        except Exception:
+            pass
 
     def load_model(self) -> None:
-        cfg = self.backend.fetch_config()
-        theme_payload = cfg.get("theme") if isinstance(cfg, dict) else {}
+        """Render the last-known content at once and reconcile it in the background."""
+        cfg = self.backend.cached_config()
+        if cfg is None:
+            self._apply_model(self.backend.fetch_config())
+            return
+        self._apply_model(cfg)
+        self._in_background(self._sync_model)
+
+    def _apply_model(self, cfg: dict) -> None:
+        """Bring the UI in line with *cfg*, touching only what changed."""
+        if not isinstance(cfg, dict):
+            return
+        changes = config_changes(self._config, cfg)
+        self._rendered_revisions["config"] = content_revision(cfg)
+        self._config = cfg
+        if FULL in changes:
+            self._build_model(cfg)
+        elif changes:
+            self._apply_config_changes(cfg, changes)
+
+    def _build_model(self, cfg: dict) -> None:
+        theme_payload = cfg.get("theme") if isinstance(cfg.get("theme"), dict) else {}
         self.theme = merge_theme(theme_payload)
-        bg_path = (theme_payload or {}).get("bg_image_path") if isinstance(theme_payload, dict) else None
-        local_bg = self.media.ensure_media(bg_path, limit_bytes=15 * 1024 * 1024) if bg_path else None
-        self.theme["bg_image_path"] = bg_path or None
-        self.theme["bg_image_local"] = local_bg
 
         # Header
         self.root_layout.removeWidget(self.header)
@@ -155,14 +284,15 @@ class App(QWidget):
             self.theme,
             cfg.get("org_name", "Организация"),
             self.media,
-            logo_path=(cfg.get("theme", {}) or {}).get("logo_path"),
+            logo_path=theme_payload.get("logo_path"),
             weather={"show_weather": cfg.get("show_weather"), "weather_city": cfg.get("weather_city")},
             clock_format=cfg.get("footer_clock_format", "%H:%M"),
+            ticks=self.ticks,
         )
         self.root_layout.insertWidget(0, self.header)
-        show_weather = bool(cfg.get("show_weather"))
-        city = (cfg.get("weather_city") or "").strip() or None
-        self._weather_state = {"show": show_weather, "city": city}
+        self._set_weather_city(cfg)
+        if self.weather.current() is not None:
+            self._apply_weather(self.weather.current())
 
         # Footer
         self.root_layout.removeWidget(self.footer)
@@ -171,67 +301,126 @@ class App(QWidget):
             self.theme,
             cfg.get("footer_clock_format", "%H:%M"),
             cfg.get("footer_qr_text", ""),
+            ticks=self.ticks,
         )
         self.root_layout.addWidget(self.footer)
 
-        # Stack
+        # Stack; the old pages hand their video players back to the pool first
+        self.pages.clear()
         self.stack.deleteLater()
         self.stack = QStackedWidget()
+        self._background = BackgroundLayer(self.stack, self.media)
         self.root_layout.insertWidget(1, self.stack, 1)
 
-        self.home = HomePage(self.theme, self.route)
-        self.page = PageView(self.theme, self.route, self.media)
+        self.home = self._make_home()
         self.admin = AdminView(self.theme)
         self.stack.addWidget(self.home)
-        self.stack.addWidget(self.page)
         self.stack.addWidget(self.admin)
+        self.pages = PageCache(self.stack)
+        self.page = None
 
-        self.apply_global_styles()
         self._current_route = "home"
-        self._apply_home_background(True)
+        self.apply_global_styles()
         self._update_screensaver_config(cfg.get("screensaver") or {})
-        self.load_home()
+        menu = self.backend.cached_menu()
+        if menu is None:
+            menu = self.backend.fetch_menu()
+        self._rendered_revisions["menu"] = content_revision(menu)
+        self.home.build(menu)
+        self.idle.refresh()
+
+    def _apply_config_changes(self, cfg: dict, changes: set) -> None:
+        theme_payload = cfg.get("theme") if isinstance(cfg.get("theme"), dict) else {}
+        if COLORS in changes or BACKGROUND in changes:
+            self.theme = merge_theme(theme_payload)
+        if COLORS in changes:
+            self.apply_global_styles()
+            for widget in (self.header, self.footer, self.home, *self.pages.views()):
+                widget.apply_theme(self.theme)
+        if ORG_NAME in changes:
+            self.header.set_title(cfg.get("org_name") or "Организация")
+        if LOGO in changes:
+            self.header.set_logo_path(theme_payload.get("logo_path"))
+        if CLOCK in changes:
+            clock_format = cfg.get("footer_clock_format") or "%H:%M"
+            self.header.set_clock_format(clock_format)
+            self.footer.set_clock_format(clock_format)
+        if QR in changes:
+            self.footer.set_qr(cfg.get("footer_qr_text") or "")
+        if WEATHER in changes:
+            self._set_weather_city(cfg)
+        if SCREENSAVER in changes:
+            self._update_screensaver_config(cfg.get("screensaver") or {})
+        if BACKGROUND in changes:
+            self._apply_home_background(self._current_route == "home")
+
+    def _sync_model(self) -> None:
+        """Fetch fresh content off the GUI thread and emit whatever changed."""
+        with self._sync_lock:
+            cfg = self.backend.fetch_config()
+            if content_revision(cfg) != self._rendered_revisions.get("config"):
+                self.config_synced.emit(cfg)
+            menu = self._sync_menu()
+            for slug in _menu_slugs(menu):
+                for path in _page_media(self.backend.fetch_page(slug)):
+                    self.media.prefetch(path)
+
+    def _sync_menu(self) -> List[dict]:
+        menu = self.backend.fetch_menu()
+        if content_revision(menu) != self._rendered_revisions.get("menu"):
+            self.menu_synced.emit(menu)
+        return menu
+
+    def _sync_page(self, slug: str) -> None:
+        """Fetch *slug* off the GUI thread and emit it if it differs from the built page."""
+        if not slug:
+            return
+        data = self.backend.fetch_page(slug)
+        if content_revision(data) != self.pages.revision(slug):
+            self.page_synced.emit(slug, data)
+
+    def _apply_page(self, slug: str, data: dict) -> None:
+        revision = content_revision(data)
+        if self.pages.revision(slug) == revision:
+            return
+        view = self.pages.get(slug)
+        if view is not None and view is self.page and self._current_route == slug:
+            self._render_page(view, data)
+            self.pages.put(slug, revision, view)
+        else:
+            self.pages.invalidate(slug)
+
+    def _apply_menu(self, menu: List[dict]) -> None:
+        revision = content_revision(menu)
+        if revision == self._rendered_revisions.get("menu"):
+            return
+        self._rendered_revisions["menu"] = revision
+        self.home.build(menu)
 
     def _poll_config_changes(self) -> None:
-        cfg = self.backend.fetch_config()
         try:
-            want_show = bool(cfg.get("show_weather"))
-            want_city = (cfg.get("weather_city") or "").strip() or None
-            cur_show = bool(self._weather_state.get("show"))
-            cur_city = self._weather_state.get("city")
-            if want_show != cur_show or want_city != cur_city:
-                if want_show and want_city:
-                    try:
-                        self.header._init_weather(want_city)
-                    except Exception:
-                        pass
-                    self._weather_state = {"show": True, "city": want_city}
-                else:
-                    try:
-                        self.header.weather_label.setText("")
-                    except Exception:
-                        pass
-                    self._weather_state = {"show": False, "city": None}
+            self._apply_model(self.backend.fetch_config())
         except Exception:
             pass
 
+    def _set_weather_city(self, cfg: dict) -> None:
+        show = bool(cfg.get("show_weather"))
+        city = (cfg.get("weather_city") or "").strip() or None
+        self._weather_state = {"show": show, "city": city}
+        self.weather.set_city(city if show else None)
+
+    def _apply_weather(self, reading: Optional[WeatherReading]) -> None:
+        if not self._weather_state.get("show"):
+            reading = None
         try:
-            screensaver_cfg = cfg.get("screensaver") or {}
-            new_path = screensaver_cfg.get("path") or None
-            try:
-                new_timeout = int(screensaver_cfg.get("timeout") or 0)
-            except Exception:
-                new_timeout = 0
-            current_path = self._screensaver_cfg.get("path")
-            current_timeout = int(self._screensaver_cfg.get("timeout") or 0)
-            if new_path != current_path or new_timeout != current_timeout:
-                self._update_screensaver_config({"path": new_path, "timeout": new_timeout})
+            self.header.set_weather(reading)
         except Exception:
             pass
 
-    def load_home(self) -> None:
-        menu = self.backend.fetch_menu()
-        self.home.build(menu)
+    def _make_home(self):
+        if _home_grid_mode() == "virtual":
+            return VirtualHomePage(self.theme, self.route, self.media)
+        return HomePage(self.theme, self.route)
 
     def open_admin(self) -> None:
         url = self.backend.build_url("/login")
@@ -240,26 +429,6 @@ class App(QWidget):
             self.stack.setCurrentWidget(self.admin)
 
     # ---------------------- Context menus ----------------------
-    def eventFilter(self, obj, event):  # type: ignore[override]
-        try:
-            if event and event.type() == QEvent.ContextMenu:
-                self._ctx_menu_simple(event.globalPos())
-                return True
-        except Exception:
-            pass
-        try:
-            if event and event.type() in (
-                QEvent.MouseButtonPress,
-                QEvent.KeyPress,
-                QEvent.TouchBegin,
-                QEvent.TouchUpdate,
-                QEvent.TouchEnd,
-            ):
-                self._handle_user_activity()
-        except Exception:
-            pass
-        return False
-
     def _ctx_menu_simple(self, global_pos) -> None:
         menu = QMenu(self)
         fs_text = "Открыть полноэкранный режим" if not self.isFullScreen() else "Выйти из полноэкранного режима"
@@ -282,25 +451,77 @@ class App(QWidget):
         menu.exec(global_pos)
 
     # ---------------------- Screensaver & idle handling ----------------------
+    def _on_input(self) -> None:
+        # the idle deadline reads input.last_input when it fires
+        if self._screensaver_layer.isVisible():
+            self._handle_user_activity()
+        elif self._screensaver_layer.prepared:
+            # touched within the pre-roll lead: free the player, pre-roll again next time
+            self._screensaver_layer.unprepare()
+            self._reset_idle_timer()
+
     def _handle_user_activity(self) -> None:
         try:
             if self._screensaver_layer and self._screensaver_layer.isVisible():
-                self._screensaver_layer.hide_media()
+                self._hide_screensaver()
         except Exception:
             pass
         self._reset_idle_timer()
 
-    def _reset_idle_timer(self) -> None:
+    def _hide_screensaver(self) -> None:
+        """Take the screensaver down and bring the suspended UI back in one repaint."""
+        self.setUpdatesEnabled(False)
+        try:
+            self._screensaver_layer.hide_media()
+        except Exception:
+            pass
+        self.idle.exit()
+        self.setUpdatesEnabled(True)
+
+    def _idle_delay(self) -> Optional[int]:
         try:
             timeout = int(self._screensaver_cfg.get("timeout") or 0)
         except Exception:
             timeout = 0
-        path = self._screensaver_cfg.get("path")
-        if timeout <= 0 or not path:
-            self._idle_timer.stop()
+        if timeout <= 0 or not self._screensaver_cfg.get("path"):
+            return None
+        return max(1000, timeout * 1000)
+
+    def _reset_idle_timer(self) -> None:
+        self.input.touch()
+        delay = self._idle_delay()
+        if delay is None:
+            self.ticks.cancel(IDLE_JOB, PREPARE_JOB)
+            return
+        self.ticks.once(IDLE_JOB, delay, self._idle_deadline)
+        self.ticks.once(PREPARE_JOB, max(0, delay - SCREENSAVER_PREPARE_LEAD_MS), self._prepare_deadline)
+
+    def _idle_deadline(self) -> None:
+        delay = self._idle_delay()
+        if delay is None:
+            return
+        remaining = self.input.remaining_ms(delay)
+        if remaining > 0:
+            # input since the deadline was set: wait out the rest
+            self.ticks.once(IDLE_JOB, int(remaining) + 1, self._idle_deadline)
+            return
+        self._show_screensaver()
+
+    def _prepare_deadline(self) -> None:
+        delay = self._idle_delay()
+        if delay is None:
             return
+        remaining = self.input.remaining_ms(delay - SCREENSAVER_PREPARE_LEAD_MS)
+        if remaining > 0:
+            self.ticks.once(PREPARE_JOB, int(remaining) + 1, self._prepare_deadline)
+            return
+        self._prepare_screensaver()
+
+    def _prepare_screensaver(self) -> None:
+        """Pre-roll the screensaver shortly before the idle timeout shows it."""
         try:
-            self._idle_timer.start(max(1000, timeout * 1000))
+            self._screensaver_layer.setGeometry(self.rect())
+            self._screensaver_layer.prepare()
         except Exception:
             pass
 
@@ -308,16 +529,13 @@ class App(QWidget):
         path = self._screensaver_cfg.get("path")
         if not path:
             return
-        try:
-            self._idle_timer.stop()
-        except Exception:
-            pass
+        self.ticks.cancel(IDLE_JOB)
         try:
             self._screensaver_layer.setGeometry(self.rect())
         except Exception:
             pass
         try:
-            showed = bool(self._screensaver_layer.show_media(path))
+            showed = bool(self._screensaver_layer.show_media())
         except Exception:
             showed = False
         if showed:
@@ -327,29 +545,37 @@ class App(QWidget):
                 pass
         else:
             self._reset_idle_timer()
+        if self._screensaver_layer.isVisible():
+            self.idle.enter()
 
     def _update_screensaver_config(self, data: dict) -> None:
         if not isinstance(data, dict):
             data = {}
-        path = data.get("path") or None
+        playlist = screensaver_playlist(data)
+        path = playlist[0][0] if playlist else None
         try:
             timeout = int(data.get("timeout") or 0)
         except Exception:
             timeout = 0
         if timeout < 0:
             timeout = 0
-        self._screensaver_cfg = {"path": path, "timeout": timeout}
-        if not path and self._screensaver_layer and self._screensaver_layer.isVisible():
-            try:
-                self._screensaver_layer.hide_media()
-            except Exception:
-                pass
+        self._screensaver_cfg = {"path": path, "timeout": timeout, "items": playlist}
+        try:
+            self._screensaver_layer.set_playlist(playlist)
+        except Exception:
+            pass
+        if not path:
+            self._hide_screensaver()
         self._reset_idle_timer()
-        self._apply_home_background(self._current_route == "home")
 
     def _on_screensaver_closed(self) -> None:
+        self.idle.exit()
         self._reset_idle_timer()
 
+    def showEvent(self, event):  # type: ignore[override]
+        super().showEvent(event)
+        self.input.watch(self.windowHandle())
+
     def resizeEvent(self, event):  # type: ignore[override]
         try:
             if self._screensaver_layer:
@@ -375,8 +601,12 @@ class App(QWidget):
             try:
                 event_type = (event or {}).get("type")
                 if event_type == "config_updated":
-                    QTimer.singleShot(0, self.load_model)
+                    self._sync_model()
                 elif event_type == "menu_updated":
-                    QTimer.singleShot(0, self.load_home)
+                    self._sync_menu()
+                elif event_type == "page_updated":
+                    self._sync_page(event.get("slug"))
+                elif event_type == "weather_updated":
+                    self.weather.push(WeatherService.reading_from(event.get("weather")))
             except Exception:
                 pass
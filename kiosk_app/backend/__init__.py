@@ -1,4 +1,5 @@
 from .api import BackendAPI
 from .media import MediaClient
+from .store import ContentStore
 
-__all__ = ["BackendAPI", "MediaClient"]
+__all__ = ["BackendAPI", "MediaClient", "ContentStore"]
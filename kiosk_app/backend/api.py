@@ -3,10 +3,12 @@ from __future__ import annotations
 import json
 import time
 from dataclasses import dataclass
-from typing import Dict, Iterator, List, Tuple
+from typing import Dict, Iterator, List, Optional, Tuple
 
 import requests
 
+from .store import ContentStore
+
 DEFAULT_CONFIG: Dict[str, object] = {
     "org_name": "Организация",
     "footer_qr_text": "",
@@ -14,10 +16,14 @@ DEFAULT_CONFIG: Dict[str, object] = {
     "theme": {},
 }
 
+# _get_json result for a document the backend no longer has
+NOT_FOUND = object()
+
 
 @dataclass(slots=True)
 class BackendAPI:
     base_url: str = "http://127.0.0.1:9000"
+    store: Optional[ContentStore] = None
 
     def __post_init__(self) -> None:
         self.base_url = self.base_url.rstrip("/")
@@ -27,33 +33,96 @@ class BackendAPI:
             path = "/" + path
         return f"{self.base_url}{path}"
 
-    # --------- High level REST helpers ---------
-    def fetch_config(self) -> Dict[str, object]:
+    def _get_json(self, path: str) -> object | None:
+        """Return the decoded body, ``NOT_FOUND`` for a 404/410, ``None`` if the backend failed.
+
+        Only ``None`` (connection errors, 5xx, unreadable bodies) lets callers
+        fall back to the offline snapshot.
+        """
         try:
-            response = requests.get(self.build_url("/config"), timeout=7)
+            response = requests.get(self.build_url(path), timeout=7)
+            if response.status_code in (404, 410):
+                return NOT_FOUND
+            if not response.ok:
+                return None
             return response.json()
         except Exception:
+            return None
+
+    def _remember(self, kind: str, key: str, payload: object) -> None:
+        if self.store is not None:
+            self.store.put(kind, key, payload)
+
+    def _forget(self, kind: str, key: str = "") -> None:
+        if self.store is not None:
+            self.store.delete(kind, key)
+
+    def _cached(self, kind: str, key: str = "") -> object | None:
+        if self.store is None:
+            return None
+        entry = self.store.get(kind, key)
+        return entry[0] if entry else None
+
+    # --------- High level REST helpers ---------
+    def fetch_config(self) -> Dict[str, object]:
+        data = self._get_json("/config")
+        if isinstance(data, dict):
+            self._remember("config", "", data)
+            return data
+        if data is NOT_FOUND:
+            self._forget("config")
             return DEFAULT_CONFIG.copy()
+        cached = self.cached_config()
+        return cached if cached is not None else DEFAULT_CONFIG.copy()
 
     def fetch_menu(self) -> List[dict]:
-        try:
-            response = requests.get(self.build_url("/home/menu"), timeout=7)
-            data = response.json()
-            if isinstance(data, list):
-                return data
-        except Exception:
-            pass
-        return []
+        data = self._get_json("/home/menu")
+        if isinstance(data, list):
+            self._remember("menu", "", data)
+            return data
+        if data is NOT_FOUND:
+            self._forget("menu")
+            return []
+        cached = self.cached_menu()
+        return cached if cached is not None else []
 
     def fetch_page(self, slug: str) -> Dict[str, object]:
-        try:
-            response = requests.get(self.build_url(f"/pages/{slug}"), timeout=7)
-            data = response.json()
-            if isinstance(data, dict):
-                return data
-        except Exception:
-            pass
-        return {"blocks": []}
+        data = self._get_json(f"/pages/{slug}")
+        if isinstance(data, dict):
+            self._remember("page", slug, data)
+            return data
+        if data is NOT_FOUND:
+            # deleted on the backend: the offline copy must not bring it back
+            self._forget("page", slug)
+            return {"blocks": []}
+        cached = self.cached_page(slug)
+        return cached if cached is not None else {"blocks": []}
+
+    def fetch_weather(self) -> Dict[str, object] | None:
+        """Return the backend's shared weather reading, ``None`` if unavailable."""
+        data = self._get_json("/weather")
+        if isinstance(data, dict) and data.get("city"):
+            return data
+        return None
+
+    # --------- Offline snapshot ---------
+    def cached_config(self) -> Dict[str, object] | None:
+        data = self._cached("config")
+        return data if isinstance(data, dict) else None
+
+    def cached_menu(self) -> List[dict] | None:
+        data = self._cached("menu")
+        return data if isinstance(data, list) else None
+
+    def cached_page(self, slug: str) -> Dict[str, object] | None:
+        data = self._cached("page", slug)
+        return data if isinstance(data, dict) else None
+
+    def revision(self, kind: str, key: str = "") -> str | None:
+        """Return the stored revision of a config/menu/page document."""
+        if self.store is None:
+            return None
+        return self.store.revision(kind, key)
 
     def verify_exit_password(self, password: str) -> Tuple[bool, str | None]:
         try:
@@ -0,0 +1,344 @@
+from __future__ import annotations
+
+import hashlib
+import os
+import sqlite3
+import sys
+import threading
+import time
+import uuid
+from typing import Callable, Optional
+
+import requests
+
+DEFAULT_MAX_BYTES = 1024 * 1024 * 1024
+DEFAULT_REVALIDATE_AFTER = 10 * 60
+INDEX_FILENAME = "index.sqlite3"
+
+USER_AGENT = (
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+    "AppleWebKit/537.36 (KHTML, like Gecko) Chrome/124 Safari/537.36"
+)
+
+
+def default_cache_root() -> str:
+    """Return the persistent cache directory (``KIOSK_CACHE_DIR`` overrides it)."""
+    override = os.environ.get("KIOSK_CACHE_DIR")
+    if override:
+        return os.path.abspath(os.path.expanduser(override))
+    if sys.platform == "win32":
+        base = os.environ.get("LOCALAPPDATA") or os.path.expanduser("~\\AppData\\Local")
+        return os.path.join(base, "KioskApp", "cache")
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache")
+    return os.path.join(base, "kiosk_app")
+
+
+def default_max_bytes() -> int:
+    """Return the cache byte budget (``KIOSK_CACHE_MAX_MB`` overrides it)."""
+    try:
+        value = int(os.environ.get("KIOSK_CACHE_MAX_MB") or 0)
+    except ValueError:
+        value = 0
+    return value * 1024 * 1024 if value > 0 else DEFAULT_MAX_BYTES
+
+
+def cache_key(url: str) -> str:
+    return hashlib.sha1(url.encode("utf-8")).hexdigest()
+
+
+def _extension_for(url: str) -> str:
+    ext = os.path.splitext(url.split("?")[0])[-1].lower()
+    if not ext or len(ext) > 5:
+        ext = ".bin"
+    return ext
+
+
+class DiskCache:
+    """Bounded, persistent cache of HTTP media files.
+
+    Files are streamed into a ``.part`` file and only renamed into place once
+    the download is complete. An SQLite index keeps the size, validators
+    (ETag/Last-Modified), SHA-256 and last access time of every entry; the
+    least recently used entries are evicted when the byte budget is exceeded.
+    A file that cannot be removed yet (e.g. held open by a player on Windows)
+    keeps its row, marked ``doomed``: it still counts toward the budget, is
+    never served and its removal is retried on eviction and at startup.
+    """
+
+    def __init__(
+        self,
+        root: Optional[str] = None,
+        *,
+        max_bytes: Optional[int] = None,
+        revalidate_after: float = DEFAULT_REVALIDATE_AFTER,
+    ) -> None:
+        self.root = root or os.path.join(default_cache_root(), "media")
+        self.max_bytes = max_bytes or default_max_bytes()
+        self.revalidate_after = revalidate_after
+        os.makedirs(self.root, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(os.path.join(self.root, INDEX_FILENAME), check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS entries (
+                    key TEXT PRIMARY KEY,
+                    url TEXT NOT NULL,
+                    filename TEXT NOT NULL,
+                    size INTEGER NOT NULL,
+                    etag TEXT,
+                    last_modified TEXT,
+                    sha256 TEXT,
+                    fetched_at REAL NOT NULL,
+                    last_access REAL NOT NULL,
+                    doomed INTEGER NOT NULL DEFAULT 0
+                )
+                """
+            )
+            try:
+                self._conn.execute("ALTER TABLE entries ADD COLUMN doomed INTEGER NOT NULL DEFAULT 0")
+            except sqlite3.OperationalError:
+                # created with the column, or already migrated
+                pass
+        self._cleanup()
+
+    # --------- Public API ---------
+    def lookup(self, url: str, *, fresh: bool = False) -> Optional[str]:
+        """Return the cached file for *url* without touching the network.
+
+        With ``fresh=True`` entries that are due for revalidation are ignored.
+        """
+        entry = self._entry(url)
+        if entry is None:
+            return None
+        if fresh and time.time() - entry["fetched_at"] >= self.revalidate_after:
+            return None
+        self._touch(entry)
+        return entry["path"]
+
+    def fetch(
+        self,
+        url: str,
+        *,
+        limit_bytes: Optional[int] = None,
+        timeout: int = 20,
+        revalidate: bool = True,
+        on_progress: Optional[Callable[[int, Optional[int]], None]] = None,
+    ) -> Optional[str]:
+        """Return a complete local copy of *url*, downloading it if needed.
+
+        A cached entry older than ``revalidate_after`` is revalidated with a
+        conditional request. If the network is unavailable the cached copy is
+        served as is; a download that exceeds *limit_bytes* or ends early is
+        discarded instead of being cached.
+        """
+        entry = self._entry(url)
+        if entry is not None:
+            fresh = time.time() - entry["fetched_at"] < self.revalidate_after
+            if fresh or not revalidate:
+                self._touch(entry)
+                return entry["path"]
+
+        headers = {"User-Agent": USER_AGENT}
+        if entry is not None:
+            if entry["etag"]:
+                headers["If-None-Match"] = entry["etag"]
+            if entry["last_modified"]:
+                headers["If-Modified-Since"] = entry["last_modified"]
+
+        tmp = None
+        try:
+            with requests.get(url, stream=True, headers=headers, timeout=timeout) as response:
+                if response.status_code == 304 and entry is not None:
+                    self._mark_revalidated(entry)
+                    return entry["path"]
+                response.raise_for_status()
+                try:
+                    expected = int(response.headers.get("Content-Length") or 0) or None
+                except ValueError:
+                    expected = None
+                if limit_bytes and expected and expected > limit_bytes:
+                    return None
+
+                key = cache_key(url)
+                filename = f"{key}{_extension_for(url)}"
+                tmp = os.path.join(self.root, f"{filename}.{uuid.uuid4().hex}.part")
+                digest = hashlib.sha256()
+                total = 0
+                with open(tmp, "wb") as handle:
+                    for chunk in response.iter_content(chunk_size=256 * 1024):
+                        if not chunk:
+                            continue
+                        total += len(chunk)
+                        if limit_bytes and total > limit_bytes:
+                            return None
+                        handle.write(chunk)
+                        digest.update(chunk)
+                        if on_progress is not None:
+                            on_progress(total, expected)
+                if total == 0 or (expected is not None and total != expected):
+                    return None
+
+                target = os.path.join(self.root, filename)
+                os.replace(tmp, target)
+                tmp = None
+                self._record(
+                    key,
+                    url,
+                    filename,
+                    total,
+                    etag=response.headers.get("ETag"),
+                    last_modified=response.headers.get("Last-Modified"),
+                    sha256=digest.hexdigest(),
+                )
+                self._evict(keep=key)
+                return target
+        except Exception:
+            return entry["path"] if entry is not None else None
+        finally:
+            if tmp and os.path.exists(tmp):
+                try:
+                    os.remove(tmp)
+                except OSError:
+                    pass
+
+    def verify(self, url: str) -> bool:
+        """Re-hash the cached file for *url* and drop it if it is corrupt."""
+        entry = self._entry(url)
+        if entry is None:
+            return False
+        digest = hashlib.sha256()
+        try:
+            with open(entry["path"], "rb") as handle:
+                for chunk in iter(lambda: handle.read(1024 * 1024), b""):
+                    digest.update(chunk)
+        except OSError:
+            self._drop(entry["key"], entry["path"])
+            return False
+        if entry["sha256"] and digest.hexdigest() != entry["sha256"]:
+            self._drop(entry["key"], entry["path"])
+            return False
+        return True
+
+    def total_bytes(self) -> int:
+        with self._lock:
+            row = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()
+        return int(row[0] or 0)
+
+    def clear(self) -> None:
+        with self._lock:
+            rows = self._conn.execute("SELECT key, filename FROM entries").fetchall()
+        for key, filename in rows:
+            self._drop(key, os.path.join(self.root, filename))
+
+    # --------- Internals ---------
+    def _entry(self, url: str) -> Optional[dict]:
+        key = cache_key(url)
+        try:
+            with self._lock:
+                row = self._conn.execute(
+                    "SELECT filename, size, etag, last_modified, sha256, fetched_at, last_access "
+                    "FROM entries WHERE key = ? AND doomed = 0",
+                    (key,),
+                ).fetchone()
+        except sqlite3.Error:
+            return None
+        if row is None:
+            return None
+        path = os.path.join(self.root, row[0])
+        try:
+            if os.path.getsize(path) != row[1]:
+                raise OSError("size mismatch")
+        except OSError:
+            self._drop(key, path)
+            return None
+        return {
+            "key": key,
+            "path": path,
+            "size": row[1],
+            "etag": row[2],
+            "last_modified": row[3],
+            "sha256": row[4],
+            "fetched_at": row[5],
+            "last_access": row[6],
+        }
+
+    def _touch(self, entry: dict) -> None:
+        now = time.time()
+        if now - entry["last_access"] < 60:
+            return
+        with self._lock, self._conn:
+            self._conn.execute("UPDATE entries SET last_access = ? WHERE key = ?", (now, entry["key"]))
+
+    def _mark_revalidated(self, entry: dict) -> None:
+        now = time.time()
+        with self._lock, self._conn:
+            self._conn.execute(
+                "UPDATE entries SET fetched_at = ?, last_access = ? WHERE key = ?",
+                (now, now, entry["key"]),
+            )
+
+    def _record(self, key: str, url: str, filename: str, size: int, **validators) -> None:
+        now = time.time()
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO entries "
+                "(key, url, filename, size, etag, last_modified, sha256, fetched_at, last_access) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    key,
+                    url,
+                    filename,
+                    size,
+                    validators.get("etag"),
+                    validators.get("last_modified"),
+                    validators.get("sha256"),
+                    now,
+                    now,
+                ),
+            )
+
+    def _drop(self, key: str, path: str) -> bool:
+        """Remove an entry's file and row; return ``False`` if the file is still there."""
+        try:
+            os.remove(path)
+        except OSError:
+            if os.path.exists(path):
+                with self._lock, self._conn:
+                    self._conn.execute("UPDATE entries SET doomed = 1 WHERE key = ?", (key,))
+                return False
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM entries WHERE key = ?", (key,))
+        return True
+
+    def _evict(self, keep: Optional[str] = None) -> None:
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT key, filename, size FROM entries ORDER BY last_access ASC"
+            ).fetchall()
+        total = sum(row[2] for row in rows)
+        for key, filename, size in rows:
+            if total <= self.max_bytes:
+                break
+            if key == keep:
+                continue
+            if self._drop(key, os.path.join(self.root, filename)):
+                total -= size
+
+    def _cleanup(self) -> None:
+        """Remove leftovers of interrupted downloads, orphaned index rows and doomed files."""
+        try:
+            for name in os.listdir(self.root):
+                if name.endswith(".part"):
+                    try:
+                        os.remove(os.path.join(self.root, name))
+                    except OSError:
+                        pass
+            with self._lock:
+                rows = self._conn.execute("SELECT key, filename, doomed FROM entries").fetchall()
+            for key, filename, doomed in rows:
+                path = os.path.join(self.root, filename)
+                if doomed or not os.path.exists(path):
+                    self._drop(key, path)
+        except Exception:
+            pass
@@ -0,0 +1,247 @@
+from __future__ import annotations
+
+import threading
+from typing import Callable, Dict, Hashable, List, Optional, Tuple
+
+from PySide6.QtCore import QObject, QRect, QRunnable, QSize, QThreadPool, Qt, Signal
+from PySide6.QtGui import QImage, QImageIOHandler, QImageReader, QPixmap
+
+from .downloads import PRIORITY_PAGE, PRIORITY_PREFETCH, PRIORITY_SCREENSAVER, PRIORITY_VISIBLE  # noqa: F401
+
+
+def fit_size(source: QSize, width: int = 0, height: int = 0) -> QSize:
+    """Return *source* scaled to fit ``width`` x ``height`` keeping the aspect ratio."""
+    if not source.isValid() or source.isEmpty() or not (width or height):
+        return QSize(source)
+    if width and height:
+        return source.scaled(width, height, Qt.KeepAspectRatio)
+    if width:
+        return QSize(width, max(1, round(source.height() * width / source.width())))
+    return QSize(max(1, round(source.width() * height / source.height())), height)
+
+
+def scale_image(image: QImage, width: int = 0, height: int = 0) -> QImage:
+    """Scale *image* to fit ``width`` x ``height``; ``0`` leaves a side unconstrained."""
+    if image.isNull():
+        return image
+    target = fit_size(image.size(), width, height)
+    if target == image.size():
+        return image
+    return image.scaled(target, Qt.IgnoreAspectRatio, Qt.SmoothTransformation)
+
+
+def cover_rect(source: QSize, target: QSize) -> QRect:
+    """Return the centred part of *source* that fills *target* when scaled to cover it."""
+    if source.isEmpty() or target.isEmpty():
+        return QRect()
+    scale = max(target.width() / source.width(), target.height() / source.height())
+    width = min(source.width(), max(1, round(target.width() / scale)))
+    height = min(source.height(), max(1, round(target.height() / scale)))
+    return QRect((source.width() - width) // 2, (source.height() - height) // 2, width, height)
+
+
+def decode_image(
+    path: Optional[str],
+    width: int = 0,
+    height: int = 0,
+    device_pixel_ratio: float = 1.0,
+    *,
+    cover: bool = False,
+) -> QImage:
+    """Read the image at *path* at the size it will be shown; safe in worker threads.
+
+    ``width``/``height`` are logical pixels. When the target is smaller than
+    the source the reader decodes straight to it (JPEG uses DCT scaling), so
+    the full-resolution bitmap is never materialised. With *cover* and both
+    sides given the image fills ``width`` x ``height`` and is cropped to it.
+    """
+    if not path:
+        return QImage()
+    try:
+        ratio = max(1.0, float(device_pixel_ratio or 1.0))
+        width = round(width * ratio) if width else 0
+        height = round(height * ratio) if height else 0
+        reader = QImageReader(path)
+        reader.setAutoTransform(True)
+        source = reader.size()
+        rotated = bool(reader.transformation() & QImageIOHandler.TransformationRotate90)
+        if rotated:
+            source.transpose()
+        if cover and width and height and source.isValid() and not source.isEmpty():
+            return _decode_cover(reader, source, QSize(width, height), ratio, rotated)
+        target = fit_size(source, width, height)
+        if (width or height) and target.isValid() and target.width() < source.width():
+            reader.setScaledSize(target.transposed() if rotated else target)
+        image = reader.read()
+        if image.isNull():
+            return QImage()
+        image = scale_image(image, width, height)
+        image.setDevicePixelRatio(ratio)
+        return image
+    except Exception:
+        return QImage()
+
+
+def _decode_cover(reader: QImageReader, source: QSize, target: QSize, ratio: float, rotated: bool) -> QImage:
+    scaled = source.scaled(target, Qt.KeepAspectRatioByExpanding)
+    if scaled.width() < source.width() and not rotated:
+        # the reader scales, then clips the centre: one pass, no full-size copy
+        reader.setScaledSize(scaled)
+        reader.setScaledClipRect(cover_rect(scaled, target))
+        image = reader.read()
+    else:
+        image = reader.read()
+        if not image.isNull():
+            image = image.copy(cover_rect(image.size(), target))
+    if image.isNull():
+        return QImage()
+    if image.size() != target:
+        image = image.scaled(target, Qt.IgnoreAspectRatio, Qt.SmoothTransformation)
+    image.setDevicePixelRatio(ratio)
+    return image
+
+
+class DecodeTicket:
+    """Handle returned by :meth:`DecodeService.submit`; cancel it to drop the result."""
+
+    __slots__ = ("key", "cancelled")
+
+    def __init__(self, key: Hashable) -> None:
+        self.key = key
+        self.cancelled = False
+
+    def cancel(self) -> None:
+        self.cancelled = True
+
+
+class _DecodeRelay(QObject):
+    finished = Signal(object, object)
+
+
+class _DecodeJob(QRunnable):
+    def __init__(
+        self,
+        relay: _DecodeRelay,
+        key: Hashable,
+        loader: Callable[[], Optional[str]],
+        width: int,
+        height: int,
+        device_pixel_ratio: float = 1.0,
+        cover: bool = False,
+    ) -> None:
+        super().__init__()
+        self.setAutoDelete(False)
+        self.relay = relay
+        self.key = key
+        self.loader = loader
+        self.width = width
+        self.height = height
+        self.device_pixel_ratio = device_pixel_ratio
+        self.cover = cover
+        self.waiters: List[Tuple[DecodeTicket, Callable[[QPixmap], None]]] = []
+        self.skipped = False
+        self._lock = threading.Lock()
+
+    def cancelled(self) -> bool:
+        with self._lock:
+            return all(ticket.cancelled for ticket, _ in self.waiters)
+
+    def run(self) -> None:  # worker thread
+        image = QImage()
+        try:
+            if self.cancelled():
+                self.skipped = True
+            else:
+                path = self.loader()
+                if self.cancelled():
+                    self.skipped = True
+                elif path:
+                    image = decode_image(
+                        path, self.width, self.height, self.device_pixel_ratio, cover=self.cover
+                    )
+        except Exception:
+            image = QImage()
+        self.relay.finished.emit(self.key, image)
+
+
+class DecodeService:
+    """Decode and scale images on a thread pool, delivering pixmaps on the GUI thread.
+
+    Jobs for the same key are shared, higher priorities are started first and a
+    job whose tickets were all cancelled is skipped before any I/O or decoding.
+    The GUI thread only converts the ready ``QImage`` into a ``QPixmap``.
+    """
+
+    def __init__(self, max_threads: int = 2) -> None:
+        self.pool = QThreadPool()
+        self.pool.setMaxThreadCount(max(1, max_threads))
+        self._relay = _DecodeRelay()
+        self._relay.finished.connect(self._on_finished)
+        self._jobs: Dict[Hashable, _DecodeJob] = {}
+        self._listeners: List[Callable[[Hashable, QPixmap], None]] = []
+
+    def add_listener(self, callback: Callable[[Hashable, QPixmap], None]) -> None:
+        """Call *callback* with ``(key, pixmap)`` for every decoded image."""
+        self._listeners.append(callback)
+
+    def submit(
+        self,
+        key: Hashable,
+        loader: Callable[[], Optional[str]],
+        callback: Callable[[QPixmap], None],
+        *,
+        width: int = 0,
+        height: int = 0,
+        device_pixel_ratio: float = 1.0,
+        cover: bool = False,
+        priority: int = PRIORITY_PAGE,
+    ) -> DecodeTicket:
+        ticket = DecodeTicket(key)
+        job = self._jobs.get(key)
+        if job is not None:
+            with job._lock:
+                job.waiters.append((ticket, callback))
+            return ticket
+        job = _DecodeJob(self._relay, key, loader, width, height, device_pixel_ratio, cover)
+        job.waiters.append((ticket, callback))
+        self._jobs[key] = job
+        self.pool.start(job, priority)
+        return ticket
+
+    def cancel_all(self) -> None:
+        for key, job in list(self._jobs.items()):
+            with job._lock:
+                for ticket, _ in job.waiters:
+                    ticket.cancel()
+            if self.pool.tryTake(job):
+                self._jobs.pop(key, None)
+
+    def pending(self) -> int:
+        return len(self._jobs)
+
+    def _on_finished(self, key: Hashable, image: QImage) -> None:  # GUI thread
+        job = self._jobs.pop(key, None)
+        pixmap = QPixmap.fromImage(image) if isinstance(image, QImage) and not image.isNull() else QPixmap()
+        if not pixmap.isNull():
+            for listener in self._listeners:
+                try:
+                    listener(key, pixmap)
+                except Exception:
+                    pass
+        if job is None:
+            return
+        with job._lock:
+            waiters = [(ticket, callback) for ticket, callback in job.waiters if not ticket.cancelled]
+        if job.skipped and waiters:
+            retry = _DecodeJob(
+                self._relay, key, job.loader, job.width, job.height, job.device_pixel_ratio, job.cover
+            )
+            retry.waiters = waiters
+            self._jobs[key] = retry
+            self.pool.start(retry, PRIORITY_PAGE)
+            return
+        for ticket, callback in waiters:
+            try:
+                callback(pixmap)
+            except Exception:
+                pass
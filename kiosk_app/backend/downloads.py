@@ -0,0 +1,305 @@
+from __future__ import annotations
+
+import heapq
+import itertools
+import os
+import threading
+import time
+from concurrent.futures import Future
+from typing import Callable, Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+from .cache import DiskCache
+
+PRIORITY_SCREENSAVER = 0
+PRIORITY_PREFETCH = 1
+PRIORITY_PAGE = 2
+PRIORITY_VISIBLE = 3
+
+ProgressCallback = Callable[[int, Optional[int]], None]
+
+
+def default_background_rate() -> int:
+    """Return the prefetch/screensaver bandwidth cap in bytes/s (``KIOSK_BACKGROUND_KBPS``).
+
+    ``0`` means unlimited.
+    """
+    try:
+        value = int(os.environ.get("KIOSK_BACKGROUND_KBPS") or 0)
+    except ValueError:
+        value = 0
+    return max(0, value) * 1024
+
+
+def is_background(priority: int) -> bool:
+    return priority <= PRIORITY_PREFETCH
+
+
+class TokenBucket:
+    """Blocking token bucket; callers may run into debt and sleep it off."""
+
+    def __init__(self, rate: int, burst: Optional[int] = None) -> None:
+        self.rate = max(1, int(rate))
+        self.capacity = max(1, int(burst or rate))
+        self._tokens = float(self.capacity)
+        self._stamp = time.monotonic()
+        self._lock = threading.Lock()
+
+    def consume(self, amount: int) -> float:
+        """Take *amount* tokens, sleeping while the bucket is in debt; return the wait."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._stamp) * self.rate)
+            self._stamp = now
+            self._tokens -= amount
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+
+class Download:
+    """A queued or running download shared by every caller asking for the same URL."""
+
+    def __init__(
+        self,
+        url: str,
+        priority: int,
+        limit_bytes: Optional[int],
+        timeout: int,
+        revalidate: bool,
+    ) -> None:
+        self.url = url
+        self.host = urlsplit(url).netloc
+        self.priority = priority
+        self.limit_bytes = limit_bytes
+        self.timeout = timeout
+        self.revalidate = revalidate
+        self.started = False
+        self.received = 0
+        self.total: Optional[int] = None
+        self.future: "Future[Optional[str]]" = Future()
+        self._listeners: List[ProgressCallback] = []
+        self._lock = threading.Lock()
+
+    def result(self, timeout: Optional[float] = None) -> Optional[str]:
+        """Block until the download finishes and return the cached path (or ``None``)."""
+        return self.future.result(timeout)
+
+    def done(self) -> bool:
+        return self.future.done()
+
+    def add_done_callback(self, callback: Callable[[Optional[str]], None]) -> None:
+        """Call *callback* with the local path once finished (from the worker thread)."""
+        self.future.add_done_callback(lambda future: callback(future.result()))
+
+    def add_progress_listener(self, callback: ProgressCallback) -> None:
+        with self._lock:
+            self._listeners.append(callback)
+
+    def _report(self, received: int, total: Optional[int]) -> None:
+        self.received = received
+        self.total = total
+        with self._lock:
+            listeners = list(self._listeners)
+        for listener in listeners:
+            try:
+                listener(received, total)
+            except Exception:
+                pass
+
+
+class DownloadManager:
+    """Bounded worker pool that fills a :class:`DiskCache` in priority order.
+
+    Requests for a URL that is already queued or running share one
+    :class:`Download`; a more urgent request raises its priority. At most
+    ``per_host`` downloads run against one host, background classes (prefetch
+    and screensaver) never occupy every worker nor every slot of a host and
+    share a bandwidth cap, so a large video cannot hold back an image that is
+    about to be shown.
+    """
+
+    def __init__(
+        self,
+        cache: DiskCache,
+        *,
+        max_workers: int = 4,
+        per_host: int = 2,
+        background_rate: Optional[int] = None,
+    ) -> None:
+        self.cache = cache
+        self.max_workers = max(1, max_workers)
+        self.per_host = max(1, per_host)
+        self.background_workers = max(1, self.max_workers - 1)
+        # all kiosk media comes from one host: keep a slot of it for visible content
+        self.background_per_host = max(1, self.per_host - 1)
+        rate = default_background_rate() if background_rate is None else background_rate
+        self._throttle = TokenBucket(rate) if rate and rate > 0 else None
+        self._cond = threading.Condition()
+        self._queue: List[Tuple[int, int, Download]] = []
+        self._seq = itertools.count()
+        self._inflight: Dict[str, Download] = {}
+        self._hosts: Dict[str, int] = {}
+        self._background_hosts: Dict[str, int] = {}
+        self._background_running = 0
+        self._threads: List[threading.Thread] = []
+        self._closed = False
+
+    # --------- Public API ---------
+    def submit(
+        self,
+        url: str,
+        *,
+        priority: int = PRIORITY_PAGE,
+        limit_bytes: Optional[int] = None,
+        timeout: int = 20,
+        revalidate: bool = True,
+        on_progress: Optional[ProgressCallback] = None,
+    ) -> Download:
+        """Queue *url* for download and return its (possibly shared) :class:`Download`."""
+        with self._cond:
+            job = self._inflight.get(url)
+            if job is None:
+                job = Download(url, priority, limit_bytes, timeout, revalidate)
+                if self._closed:
+                    job.future.set_result(None)
+                    return job
+                self._inflight[url] = job
+                self._push(job)
+                self._spawn_worker()
+            elif not job.started:
+                if limit_bytes is None or (job.limit_bytes and limit_bytes > job.limit_bytes):
+                    job.limit_bytes = limit_bytes
+                if priority > job.priority:
+                    job.priority = priority
+                    self._push(job)
+            elif priority > job.priority:
+                job.priority = priority
+            if on_progress is not None:
+                job.add_progress_listener(on_progress)
+            self._cond.notify()
+        return job
+
+    def fetch(
+        self,
+        url: str,
+        *,
+        priority: int = PRIORITY_PAGE,
+        limit_bytes: Optional[int] = None,
+        timeout: int = 20,
+        on_progress: Optional[ProgressCallback] = None,
+    ) -> Optional[str]:
+        """Return a local copy of *url*, waiting for the download if it is not cached."""
+        fresh = self.cache.lookup(url, fresh=True)
+        if fresh:
+            return fresh
+        job = self.submit(
+            url, priority=priority, limit_bytes=limit_bytes, timeout=timeout, on_progress=on_progress
+        )
+        return job.result()
+
+    def progress(self, url: str) -> Optional[Tuple[int, Optional[int]]]:
+        """Return ``(received, total)`` for an in-flight download of *url*."""
+        with self._cond:
+            job = self._inflight.get(url)
+        return (job.received, job.total) if job is not None else None
+
+    def pending(self) -> int:
+        with self._cond:
+            return len(self._inflight)
+
+    def shutdown(self) -> None:
+        """Stop the workers; queued downloads resolve to ``None``."""
+        with self._cond:
+            self._closed = True
+            queued = [job for _, _, job in self._queue if not job.started]
+            self._queue.clear()
+            for job in queued:
+                self._inflight.pop(job.url, None)
+            self._cond.notify_all()
+        for job in queued:
+            if not job.future.done():
+                job.future.set_result(None)
+
+    # --------- Internals ---------
+    def _push(self, job: Download) -> None:
+        heapq.heappush(self._queue, (-job.priority, next(self._seq), job))
+
+    def _spawn_worker(self) -> None:
+        self._threads = [thread for thread in self._threads if thread.is_alive()]
+        if len(self._threads) >= self.max_workers:
+            return
+        thread = threading.Thread(
+            target=self._worker, name=f"kiosk-download-{len(self._threads)}", daemon=True
+        )
+        self._threads.append(thread)
+        thread.start()
+
+    def _take(self) -> Optional[Download]:
+        """Pop the most urgent runnable job; caller holds ``self._cond``."""
+        deferred: List[Tuple[int, int, Download]] = []
+        found: Optional[Download] = None
+        while self._queue:
+            entry = heapq.heappop(self._queue)
+            job = entry[2]
+            if job.started or -entry[0] != job.priority:
+                continue
+            if self._hosts.get(job.host, 0) >= self.per_host:
+                deferred.append(entry)
+                continue
+            if is_background(job.priority) and (
+                self._background_running >= self.background_workers
+                or self._background_hosts.get(job.host, 0) >= self.background_per_host
+            ):
+                deferred.append(entry)
+                continue
+            found = job
+            break
+        for entry in deferred:
+            heapq.heappush(self._queue, entry)
+        return found
+
+    def _worker(self) -> None:
+        while True:
+            with self._cond:
+                job = self._take()
+                while job is None:
+                    if self._closed:
+                        return
+                    self._cond.wait()
+                    job = self._take()
+                job.started = True
+                background = is_background(job.priority)
+                self._hosts[job.host] = self._hosts.get(job.host, 0) + 1
+                if background:
+                    self._background_running += 1
+                    self._background_hosts[job.host] = self._background_hosts.get(job.host, 0) + 1
+
+            path: Optional[str] = None
+            try:
+                path = self.cache.fetch(
+                    job.url,
+                    limit_bytes=job.limit_bytes,
+                    timeout=job.timeout,
+                    revalidate=job.revalidate,
+                    on_progress=lambda received, total, job=job: self._on_progress(job, received, total),
+                )
+            except Exception:
+                path = None
+            finally:
+                with self._cond:
+                    self._hosts[job.host] = max(0, self._hosts.get(job.host, 1) - 1)
+                    if background:
+                        self._background_running = max(0, self._background_running - 1)
+                        self._background_hosts[job.host] = max(0, self._background_hosts.get(job.host, 1) - 1)
+                    if self._inflight.get(job.url) is job:
+                        self._inflight.pop(job.url, None)
+                    self._cond.notify_all()
+            job.future.set_result(path)
+
+    def _on_progress(self, job: Download, received: int, total: Optional[int]) -> None:
+        chunk = received - job.received
+        job._report(received, total)
+        if self._throttle is not None and chunk > 0 and is_background(job.priority):
+            self._throttle.consume(chunk)
@@ -1,16 +1,43 @@
 from __future__ import annotations
 
-import hashlib
 import os
-import tempfile
-from typing import Optional
+from collections import OrderedDict
+from typing import Callable, Hashable, Optional, Tuple
 
-import requests
-from PySide6.QtCore import QUrl
-from PySide6.QtGui import QImage, QPixmap
+from PySide6.QtCore import QObject, QUrl, Signal
+from PySide6.QtGui import QPixmap
 
-_CACHE_DIR = os.path.join(tempfile.gettempdir(), "kiosk_cache")
-os.makedirs(_CACHE_DIR, exist_ok=True)
+from .cache import DiskCache, default_cache_root
+from .decode import DecodeService, DecodeTicket
+from .downloads import (
+    PRIORITY_PAGE,
+    PRIORITY_PREFETCH,
+    Download,
+    DownloadManager,
+    ProgressCallback,
+)
+
+VIDEO_LIMIT_BYTES = 200 * 1024 * 1024
+
+_CACHE_DIR = default_cache_root()
+_default_cache: Optional[DiskCache] = None
+
+
+def cache_dir() -> str:
+    """Return the directory holding cached media and the content store."""
+    return _CACHE_DIR
+
+
+def default_cache() -> DiskCache:
+    """Return the shared media cache, creating it on first use."""
+    global _default_cache
+    if _default_cache is None:
+        _default_cache = DiskCache(os.path.join(_CACHE_DIR, "media"))
+    return _default_cache
+
+
+def _is_http(url: str) -> bool:
+    return url.startswith("http://") or url.startswith("https://")
 
 
 def resolve_url_or_path(path: str, api_base: str) -> str:
@@ -22,131 +49,234 @@ def resolve_url_or_path(path: str, api_base: str) -> str:
     return path
 
 
-def _cache_http_file(url: str, limit_bytes: Optional[int] = None, timeout: int = 20) -> Optional[str]:
-    try:
-        key = hashlib.md5(url.encode("utf-8")).hexdigest()
-        ext = os.path.splitext(url.split("?")[0])[-1].lower()
-        if not ext or len(ext) > 5:
-            ext = ".bin"
-        target = os.path.join(_CACHE_DIR, f"{key}{ext}")
-        if os.path.exists(target) and os.path.getsize(target) > 0:
-            return target
-
-        headers = {
-            "User-Agent": (
-                "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-                "AppleWebKit/537.36 (KHTML, like Gecko) Chrome/124 Safari/537.36"
-            )
-        }
-        with requests.get(url, stream=True, headers=headers, timeout=timeout) as response:
-            response.raise_for_status()
-            tmp = target + ".part"
-            total = 0
-            with open(tmp, "wb") as handle:
-                for chunk in response.iter_content(chunk_size=256 * 1024):
-                    if not chunk:
-                        continue
-                    handle.write(chunk)
-                    total += len(chunk)
-                    if limit_bytes and total > limit_bytes:
-                        break
-            os.replace(tmp, target)
-        return target
-    except Exception:
-        return None
-
-
-def load_pixmap_any(path: str, api_base: str) -> QPixmap:
-    pixmap = QPixmap()
-    if not path:
-        return pixmap
-    url = resolve_url_or_path(path, api_base)
-    try:
-        if url.startswith("http://") or url.startswith("https://"):
-            response = requests.get(url, timeout=7)
-            response.raise_for_status()
-            image = QImage()
-            if image.loadFromData(response.content):
-                return QPixmap.fromImage(image)
-            return pixmap
-        pixmap.load(url)
-        return pixmap
-    except Exception:
-        return QPixmap()
-
-
-def ensure_local_file_for_pdf(path: str, api_base: str) -> str:
-    if not path:
-        return ""
-    url = resolve_url_or_path(path, api_base)
-    if not (url.startswith("http://") or url.startswith("https://")):
-        return url
-    key = hashlib.md5(url.encode("utf-8")).hexdigest() + ".pdf"
-    local_path = os.path.join(_CACHE_DIR, key)
-    if not os.path.exists(local_path):
+class PixmapCache:
+    """In-memory LRU of decoded (and usually scaled) pixmaps bounded by bytes."""
+
+    def __init__(self, max_bytes: int = 96 * 1024 * 1024) -> None:
+        self.max_bytes = max_bytes
+        self._items: "OrderedDict[Hashable, Tuple[QPixmap, int]]" = OrderedDict()
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def cost(pixmap: QPixmap) -> int:
         try:
-            response = requests.get(url, timeout=15)
-            response.raise_for_status()
-            with open(local_path, "wb") as handle:
-                handle.write(response.content)
+            return max(1, pixmap.width() * pixmap.height() * max(1, pixmap.depth() // 8))
         except Exception:
-            return ""
-    return local_path
+            return 1
 
+    def get(self, key: Hashable) -> Optional[QPixmap]:
+        item = self._items.get(key)
+        if item is None:
+            self.misses += 1
+            return None
+        self._items.move_to_end(key)
+        self.hits += 1
+        return item[0]
 
-def ensure_local_media_file(
-    path: str,
-    api_base: str,
-    *,
-    limit_bytes: Optional[int] = 200 * 1024 * 1024,
-    timeout: int = 40,
-) -> Optional[str]:
-    if not path:
-        return None
-    url = resolve_url_or_path(path, api_base)
-    if not url:
-        return None
-    if url.startswith("http://") or url.startswith("https://"):
-        cached = _cache_http_file(url, limit_bytes=limit_bytes, timeout=timeout)
-        return cached or None
-    return url.replace("\\", "/")
+    def put(self, key: Hashable, pixmap: QPixmap) -> None:
+        cost = self.cost(pixmap)
+        if cost > self.max_bytes:
+            return
+        previous = self._items.pop(key, None)
+        if previous is not None:
+            self._bytes -= previous[1]
+        self._items[key] = (pixmap, cost)
+        self._bytes += cost
+        while self._bytes > self.max_bytes and self._items:
+            _, (_, evicted_cost) = self._items.popitem(last=False)
+            self._bytes -= evicted_cost
 
+    def clear(self) -> None:
+        self._items.clear()
+        self._bytes = 0
 
-def url_or_local_for_video(path: str, api_base: str) -> QUrl:
-    if not path:
-        return QUrl()
-    url = resolve_url_or_path(path, api_base)
-    if url.startswith("http://") or url.startswith("https://"):
-        local_path = _cache_http_file(url)
-        if local_path and os.path.exists(local_path) and os.path.getsize(local_path) > 0:
-            return QUrl.fromLocalFile(local_path)
-        return QUrl(url)
-    return QUrl.fromLocalFile(url)
+    @property
+    def total_bytes(self) -> int:
+        return self._bytes
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+
+class _FileRelay(QObject):
+    finished = Signal(object, object, object)
 
 
 class MediaClient:
     """High level helpers for working with media assets served by the backend."""
 
-    def __init__(self, base_url: str):
+    def __init__(
+        self,
+        base_url: str,
+        cache: Optional[DiskCache] = None,
+        pixmaps: Optional[PixmapCache] = None,
+        downloads: Optional[DownloadManager] = None,
+    ):
         self.base_url = base_url.rstrip("/")
+        self.cache = cache or default_cache()
+        self.pixmaps = pixmaps or PixmapCache()
+        self.downloads = downloads or DownloadManager(self.cache)
+        self._decoder: Optional[DecodeService] = None
+        self._relay: Optional[_FileRelay] = None
 
     def resolve(self, path: str) -> str:
         return resolve_url_or_path(path, self.base_url)
 
-    def load_pixmap(self, path: str) -> QPixmap:
-        return load_pixmap_any(path, self.base_url)
+    @property
+    def decoder(self) -> DecodeService:
+        if self._decoder is None:
+            self._decoder = DecodeService()
+            self._decoder.add_listener(self.pixmaps.put)
+        return self._decoder
 
-    def ensure_pdf(self, path: str) -> str:
-        return ensure_local_file_for_pdf(path, self.base_url)
+    @property
+    def relay(self) -> _FileRelay:
+        if self._relay is None:
+            self._relay = _FileRelay()
+            self._relay.finished.connect(self._deliver_file)
+        return self._relay
 
-    def video_url(self, path: str) -> QUrl:
-        return url_or_local_for_video(path, self.base_url)
+    def _pixmap_key(
+        self, path: str, width: int, height: int, device_pixel_ratio: float = 1.0, cover: bool = False
+    ) -> Tuple[str, int, int, float, str]:
+        ratio = round(max(1.0, float(device_pixel_ratio or 1.0)), 2)
+        return (self.resolve(path), int(width or 0), int(height or 0), ratio, "cover" if cover else "smooth")
 
-    def ensure_media(
+    def _local_file(
         self,
         path: str,
         *,
+        priority: int,
+        limit_bytes: Optional[int],
+        timeout: int,
+        on_progress: Optional[ProgressCallback] = None,
+    ) -> Optional[str]:
+        url = self.resolve(path)
+        if not url:
+            return None
+        if _is_http(url):
+            return self.downloads.fetch(
+                url,
+                priority=priority,
+                limit_bytes=limit_bytes,
+                timeout=timeout,
+                on_progress=on_progress,
+            )
+        return url.replace("\\", "/")
+
+    def cached_file(self, path: str) -> Optional[str]:
+        """Return a local file for *path* if it is local or already cached; never downloads."""
+        url = self.resolve(path)
+        if not url:
+            return None
+        if _is_http(url):
+            return self.cache.lookup(url)
+        return url.replace("\\", "/")
+
+    def local_image(self, path: str, *, priority: int = PRIORITY_PAGE) -> Optional[str]:
+        """Return a local file for the image at *path*, downloading it if needed."""
+        return self._local_file(path, priority=priority, limit_bytes=50 * 1024 * 1024, timeout=7)
+
+    def prefetch(
+        self,
+        path: str,
+        *,
+        priority: int = PRIORITY_PREFETCH,
+        limit_bytes: Optional[int] = 50 * 1024 * 1024,
+        timeout: int = 40,
+    ) -> Optional[Download]:
+        """Queue *path* for download without waiting; local paths return ``None``."""
+        url = self.resolve(path)
+        if not url or not _is_http(url):
+            return None
+        return self.downloads.submit(url, priority=priority, limit_bytes=limit_bytes, timeout=timeout)
+
+    def request_pixmap(
+        self,
+        path: str,
+        callback: Callable[[QPixmap], None],
+        width: int = 0,
+        height: int = 0,
+        *,
+        device_pixel_ratio: float = 1.0,
+        cover: bool = False,
+        priority: int = PRIORITY_PAGE,
+    ) -> Optional[DecodeTicket]:
+        """Deliver *path* scaled to ``width`` x ``height`` to *callback* on the GUI thread.
+
+        Sizes are logical pixels; the image is decoded at ``size * device_pixel_ratio``.
+        With *cover* it fills the whole size and is cropped to it instead of fitting.
+        Memory-tier hits call back immediately and return ``None``; otherwise the
+        download and decode run on the decoder pool and a cancellable ticket is
+        returned. A null pixmap is delivered when the image cannot be loaded.
+        """
+        if not path:
+            callback(QPixmap())
+            return None
+        key = self._pixmap_key(path, width, height, device_pixel_ratio, cover)
+        cached = self.pixmaps.get(key)
+        if cached is not None:
+            callback(cached)
+            return None
+        return self.decoder.submit(
+            key,
+            lambda: self.local_image(path, priority=priority),
+            callback,
+            width=int(width or 0),
+            height=int(height or 0),
+            device_pixel_ratio=key[3],
+            cover=cover,
+            priority=priority,
+        )
+
+    def request_file(
+        self,
+        path: str,
+        callback: Callable[[Optional[str]], None],
+        *,
+        priority: int = PRIORITY_PAGE,
         limit_bytes: Optional[int] = None,
         timeout: int = 40,
-    ) -> Optional[str]:
-        return ensure_local_media_file(path, self.base_url, limit_bytes=limit_bytes, timeout=timeout)
+    ) -> Optional[DecodeTicket]:
+        """Deliver a local copy of *path* to *callback* on the GUI thread, ``None`` on failure.
+
+        Local and freshly cached files call back immediately and return
+        ``None``; otherwise the file is queued on the download manager at
+        *priority* and a cancellable ticket is returned.
+        """
+        url = self.resolve(path)
+        if not url or not _is_http(url):
+            callback(url.replace("\\", "/") if url else None)
+            return None
+        fresh = self.cache.lookup(url, fresh=True)
+        if fresh:
+            callback(fresh)
+            return None
+        ticket = DecodeTicket(url)
+        relay = self.relay
+        download = self.downloads.submit(url, priority=priority, limit_bytes=limit_bytes, timeout=timeout)
+        download.add_done_callback(lambda local: relay.finished.emit(ticket, callback, local))
+        return ticket
+
+    def _deliver_file(self, ticket: DecodeTicket, callback, local: Optional[str]) -> None:  # GUI thread
+        if not ticket.cancelled:
+            callback(local)
+
+    def video_url(self, path: str, *, priority: int = PRIORITY_PREFETCH) -> QUrl:
+        """Return a playable URL for *path* without waiting for a download.
+
+        A cached copy is played from disk. Otherwise the player streams the
+        HTTP URL while the file is downloaded into the cache in the background
+        at *priority*, so the next play starts from the local file.
+        """
+        if not path:
+            return QUrl()
+        url = self.resolve(path)
+        if not _is_http(url):
+            return QUrl.fromLocalFile(url.replace("\\", "/"))
+        if not self.cache.lookup(url, fresh=True):
+            self.prefetch(path, priority=priority, limit_bytes=VIDEO_LIMIT_BYTES)
+        local = self.cache.lookup(url)
+        return QUrl.fromLocalFile(local) if local else QUrl(url)
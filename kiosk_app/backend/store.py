@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Optional, Tuple
+
+from .media import cache_dir
+
+STORE_FILENAME = "content.sqlite3"
+
+
+def default_store_path() -> str:
+    """Return the location of the content store next to the media cache."""
+    return os.path.join(cache_dir(), STORE_FILENAME)
+
+
+def content_revision(payload: object) -> str:
+    """Return a stable revision string for a JSON-serialisable payload."""
+    raw = json.dumps(payload, ensure_ascii=False, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha1(raw.encode("utf-8")).hexdigest()
+
+
+class ContentStore:
+    """Persistent snapshot of the last-known config, menu and pages.
+
+    Every document is stored as JSON together with a revision derived from its
+    content, so callers can tell whether a fresh backend response differs from
+    what is already on screen.
+    """
+
+    def __init__(self, path: Optional[str] = None) -> None:
+        self.path = path or default_store_path()
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS documents (
+                    kind TEXT NOT NULL,
+                    key TEXT NOT NULL,
+                    revision TEXT NOT NULL,
+                    payload TEXT NOT NULL,
+                    updated_at REAL NOT NULL,
+                    PRIMARY KEY (kind, key)
+                )
+                """
+            )
+
+    # --------- Generic documents ---------
+    def get(self, kind: str, key: str = "") -> Optional[Tuple[object, str]]:
+        """Return ``(payload, revision)`` for a stored document or ``None``."""
+        try:
+            with self._lock:
+                row = self._conn.execute(
+                    "SELECT payload, revision FROM documents WHERE kind = ? AND key = ?",
+                    (kind, key),
+                ).fetchone()
+            if row is None:
+                return None
+            return json.loads(row[0]), row[1]
+        except Exception:
+            return None
+
+    def put(self, kind: str, key: str, payload: object) -> bool:
+        """Store *payload* and return ``True`` when its revision changed."""
+        try:
+            revision = content_revision(payload)
+            with self._lock, self._conn:
+                row = self._conn.execute(
+                    "SELECT revision FROM documents WHERE kind = ? AND key = ?",
+                    (kind, key),
+                ).fetchone()
+                if row is not None and row[0] == revision:
+                    return False
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO documents (kind, key, revision, payload, updated_at) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    (kind, key, revision, json.dumps(payload, ensure_ascii=False), time.time()),
+                )
+            return True
+        except Exception:
+            return False
+
+    def revision(self, kind: str, key: str = "") -> Optional[str]:
+        try:
+            with self._lock:
+                row = self._conn.execute(
+                    "SELECT revision FROM documents WHERE kind = ? AND key = ?",
+                    (kind, key),
+                ).fetchone()
+            return row[0] if row else None
+        except Exception:
+            return None
+
+    def delete(self, kind: str, key: str = "") -> None:
+        try:
+            with self._lock, self._conn:
+                self._conn.execute("DELETE FROM documents WHERE kind = ? AND key = ?", (kind, key))
+        except Exception:
+            pass
+
+    def close(self) -> None:
+        try:
+            with self._lock:
+                self._conn.close()
+        except Exception:
+            pass
@@ -1,48 +1,194 @@
 from __future__ import annotations
 
-from typing import Optional, Tuple
-
-import requests
-
-
-def fetch_weather(city: str) -> Tuple[Optional[str], Optional[float], Optional[int]]:
-    city = (city or "").strip()
-    if not city:
-        return None, None, None
-    try:
-        geo = requests.get(
-            "https://geocoding-api.open-meteo.com/v1/search",
-            params={"name": city, "count": 1, "language": "ru", "format": "json"},
-            timeout=6,
-        ).json()
-        results = (geo or {}).get("results") or []
-        if not results:
-            return None, None, None
-        location = results[0]
-        lat = location.get("latitude")
-        lon = location.get("longitude")
-        if lat is None or lon is None:
-            return None, None, None
-        forecast = requests.get(
-            "https://api.open-meteo.com/v1/forecast",
-            params={"latitude": lat, "longitude": lon, "current_weather": True, "timezone": "auto"},
-            timeout=6,
-        ).json()
-        current = (forecast or {}).get("current_weather") or {}
-        temp = current.get("temperature")
-        code = current.get("weathercode")
-        if temp is None:
-            current = (forecast or {}).get("current") or {}
-            temp = current.get("temperature_2m") if isinstance(current, dict) else None
-            code = current.get("weather_code") if isinstance(current, dict) else code
-        display_city = location.get("name") or city
-        if isinstance(temp, (int, float)):
+import threading
+import time
+from dataclasses import asdict, dataclass
+from typing import Callable, List, Optional
+
+from .store import ContentStore
+
+REFRESH_INTERVAL = 10 * 60
+RETRY_AFTER = 30
+MAX_STALE = 3 * 60 * 60
+
+
+@dataclass(slots=True)
+class WeatherReading:
+    city: str
+    temperature: Optional[float]
+    code: Optional[int]
+    fetched_at: float
+
+
+class WeatherService:
+    """Keeps the current weather for one city fresh on a background thread.
+
+    ``fetcher(city)`` returns a :class:`WeatherReading` or ``None``, e.g. from
+    the backend's shared ``/weather`` endpoint. The last reading is persisted
+    in the content store and served immediately (also after a restart) while
+    a newer one is fetched; failures are retried with exponential backoff
+    and the reading is dropped once it is older than ``max_stale``.
+    Listeners are called from the worker thread with a reading or ``None``.
+    """
+
+    def __init__(
+        self,
+        store: Optional[ContentStore] = None,
+        *,
+        fetcher: Callable[[str], Optional[WeatherReading]],
+        refresh_interval: float = REFRESH_INTERVAL,
+        retry_after: float = RETRY_AFTER,
+        max_stale: float = MAX_STALE,
+    ) -> None:
+        self.store = store
+        self.fetcher = fetcher
+        self.refresh_interval = refresh_interval
+        self.retry_after = retry_after
+        self.max_stale = max_stale
+        self.failures = 0
+        self._forced = False
+        self._city: Optional[str] = None
+        self._reading: Optional[WeatherReading] = None
+        self._listeners: List[Callable[[Optional[WeatherReading]], None]] = []
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    # --------- Public API ---------
+    def add_listener(self, callback: Callable[[Optional[WeatherReading]], None]) -> None:
+        self._listeners.append(callback)
+
+    @property
+    def city(self) -> Optional[str]:
+        return self._city
+
+    def current(self) -> Optional[WeatherReading]:
+        return self._reading
+
+    def set_city(self, city: Optional[str]) -> None:
+        """Follow *city* (``None``/empty disables weather); a no-op if unchanged."""
+        city = (city or "").strip() or None
+        with self._lock:
+            if city == self._city:
+                return
+            self._city = city
+            self.failures = 0
+            self._reading = self._load_reading(city) if city else None
+            reading = self._reading
+        if reading is not None or city is None:
+            self._publish(reading)
+        if city:
+            self._ensure_thread()
+        self._wake.set()
+
+    def push(self, reading: Optional[WeatherReading]) -> None:
+        """Accept a reading delivered out of band (e.g. a backend event)."""
+        with self._lock:
+            city = self._city
+            if not city or reading is None:
+                return
+            self._reading = reading
+            self.failures = 0
+        self._save_reading(city, reading)
+        self._publish(reading)
+        self._wake.set()
+
+    def refresh_now(self) -> None:
+        with self._lock:
+            self._forced = True
+        self._wake.set()
+
+    def stop(self) -> None:
+        self._stopped.set()
+        self._wake.set()
+
+    # --------- Internals ---------
+    def _ensure_thread(self) -> None:
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stopped.clear()
+        self._thread = threading.Thread(target=self._run, name="kiosk-weather", daemon=True)
+        self._thread.start()
+
+    def _run(self) -> None:
+        while not self._stopped.is_set():
+            self._wake.clear()
+            delay = self._step()
+            if delay is None:
+                self._wake.wait()
+            else:
+                self._wake.wait(max(0.0, delay))
+
+    def _step(self) -> Optional[float]:
+        """Refresh if due; return seconds until the next attempt (``None`` = idle)."""
+        with self._lock:
+            city = self._city
+            reading = self._reading
+            retry = self._forced or self.failures > 0
+            self._forced = False
+        if not city:
+            return None
+        if reading is not None and not retry:
+            age = time.time() - reading.fetched_at
+            if age < self.refresh_interval:
+                return self.refresh_interval - age
+        try:
+            fresh = self.fetcher(city)
+        except Exception:
+            fresh = None
+        with self._lock:
+            if city != self._city:
+                return 0.0
+            if fresh is not None:
+                self.failures = 0
+                self._reading = fresh
+            else:
+                self.failures += 1
+                if self._reading is not None and time.time() - self._reading.fetched_at > self.max_stale:
+                    self._reading = None
+            reading = self._reading
+            failures = self.failures
+        if fresh is not None:
+            self._save_reading(city, fresh)
+        self._publish(reading)
+        if failures:
+            return min(self.refresh_interval, self.retry_after * 2 ** (failures - 1))
+        return self.refresh_interval
+
+    @staticmethod
+    def reading_from(data: object) -> Optional[WeatherReading]:
+        """Build a reading from a ``{city, temperature, code, fetched_at}`` mapping."""
+        if not isinstance(data, dict) or not data.get("city"):
+            return None
+        temp = data.get("temperature")
+        code = data.get("code")
+        return WeatherReading(
+            str(data["city"]),
+            float(temp) if isinstance(temp, (int, float)) else None,
+            int(code) if isinstance(code, (int, float)) else None,
+            float(data.get("fetched_at") or time.time()),
+        )
+
+    def _load_reading(self, city: str) -> Optional[WeatherReading]:
+        cached = self.store.get("weather", city.casefold()) if self.store is not None else None
+        if cached is None:
+            return None
+        try:
+            reading = WeatherReading(**cached[0])
+        except Exception:
+            return None
+        if time.time() - reading.fetched_at > self.max_stale:
+            return None
+        return reading
+
+    def _save_reading(self, city: str, reading: WeatherReading) -> None:
+        if self.store is not None:
+            self.store.put("weather", city.casefold(), asdict(reading))
+
+    def _publish(self, reading: Optional[WeatherReading]) -> None:
+        for listener in list(self._listeners):
             try:
-                temp = float(temp)
+                listener(reading)
             except Exception:
-                temp = None
-        else:
-            temp = None
-        return display_city, temp, code if isinstance(code, (int, float)) else None
-    except Exception:
-        return None, None, None
+                pass
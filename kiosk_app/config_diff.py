@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+from typing import Callable, Dict, List, Optional, Set, Tuple
+
+# Aspects of the kiosk UI that a config change can affect.
+FULL = "full"
+COLORS = "colors"
+BACKGROUND = "background"
+LOGO = "logo"
+ORG_NAME = "org_name"
+CLOCK = "clock"
+QR = "qr"
+SCREENSAVER = "screensaver"
+WEATHER = "weather"
+
+
+def _theme(cfg: dict) -> dict:
+    theme = cfg.get("theme")
+    return theme if isinstance(theme, dict) else {}
+
+
+def screensaver_playlist(data: dict) -> List[Tuple[str, int]]:
+    """Return the ``(path, seconds)`` items of a screensaver config in play order.
+
+    The playlist wins over the legacy single ``path``; ``0`` seconds means a
+    video plays to its end and an image uses the screensaver default.
+    """
+    playlist: List[Tuple[str, int]] = []
+    for item in data.get("items") or []:
+        if not isinstance(item, dict) or not item.get("path"):
+            continue
+        try:
+            duration = max(0, int(item.get("duration") or 0))
+        except (TypeError, ValueError):
+            duration = 0
+        playlist.append((item["path"], duration))
+    if not playlist and data.get("path"):
+        playlist.append((data["path"], 0))
+    return playlist
+
+
+def _screensaver(cfg: dict) -> Tuple[Tuple[Tuple[str, int], ...], int]:
+    data = cfg.get("screensaver")
+    data = data if isinstance(data, dict) else {}
+    try:
+        timeout = max(0, int(data.get("timeout") or 0))
+    except (TypeError, ValueError):
+        timeout = 0
+    return tuple(screensaver_playlist(data)), timeout
+
+
+def _background(cfg: dict) -> Tuple[Optional[str], str]:
+    theme = _theme(cfg)
+    return theme.get("bg_image_path") or None, theme.get("bg_image_fit") or "cover"
+
+
+def _weather(cfg: dict) -> Tuple[bool, Optional[str]]:
+    return bool(cfg.get("show_weather")), (cfg.get("weather_city") or "").strip() or None
+
+
+# aspect -> value extractor; two configs differ in an aspect when the values differ
+FIELDS: Dict[str, Callable[[dict], object]] = {
+    COLORS: lambda cfg: tuple(_theme(cfg).get(key) for key in ("bg", "text", "primary")),
+    BACKGROUND: _background,
+    LOGO: lambda cfg: _theme(cfg).get("logo_path") or None,
+    ORG_NAME: lambda cfg: cfg.get("org_name") or "Организация",
+    CLOCK: lambda cfg: cfg.get("footer_clock_format") or "%H:%M",
+    QR: lambda cfg: cfg.get("footer_qr_text") or "",
+    SCREENSAVER: _screensaver,
+    WEATHER: _weather,
+}
+
+# keys covered by FIELDS plus keys that do not affect the kiosk UI
+KNOWN_KEYS = {
+    "theme",
+    "org_name",
+    "footer_clock_format",
+    "footer_qr_text",
+    "screensaver",
+    "show_weather",
+    "weather_city",
+}
+KNOWN_THEME_KEYS = {"bg", "text", "primary", "bg_image_path", "bg_image_fit", "logo_path", "id", "name"}
+
+
+def config_changes(old: Optional[dict], new: dict) -> Set[str]:
+    """Return the UI aspects that differ between two ``/config`` payloads.
+
+    ``FULL`` is returned when there is no previous config or when a field the
+    kiosk does not know how to apply incrementally changed.
+    """
+    if not isinstance(old, dict) or not isinstance(new, dict):
+        return {FULL}
+    unknown = {key for key in set(old) | set(new) if key not in KNOWN_KEYS and old.get(key) != new.get(key)}
+    old_theme, new_theme = _theme(old), _theme(new)
+    unknown |= {
+        key
+        for key in set(old_theme) | set(new_theme)
+        if key not in KNOWN_THEME_KEYS and old_theme.get(key) != new_theme.get(key)
+    }
+    if unknown:
+        return {FULL}
+    return {aspect for aspect, value in FIELDS.items() if value(old) != value(new)}
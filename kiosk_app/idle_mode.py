@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+import time
+from typing import Callable, Dict, Iterable, Sequence, Tuple
+
+from PySide6.QtWidgets import QWidget
+
+from .scheduler import TickScheduler
+
+
+class IdleMode:
+    """Suspends the UI work hidden behind the screensaver and restores it on exit.
+
+    While active, the *widgets* under the screensaver, all of which are
+    normally shown, are hidden: nothing repaints underneath and pages pause
+    their media from ``hideEvent``. The *paused* scheduler jobs stop and the
+    *slowed* ones switch from their ``(normal, idle)`` interval to the idle
+    one. :meth:`exit` shows everything again and the clocks catch up in the
+    same frame. ``entries`` and ``suspended_seconds`` report how much time
+    was spent suspended.
+    """
+
+    def __init__(
+        self,
+        ticks: TickScheduler,
+        widgets: Callable[[], Iterable[QWidget]],
+        *,
+        paused: Sequence[str] = (),
+        slowed: Dict[str, Tuple[int, int]] | None = None,
+    ) -> None:
+        self.ticks = ticks
+        self.widgets = widgets
+        self.paused = tuple(paused)
+        self.slowed = dict(slowed or {})
+        self.enabled = True
+        self.entries = 0
+        self.suspended_seconds = 0.0
+        self._active = False
+        self._since = 0.0
+
+    @property
+    def active(self) -> bool:
+        return self._active
+
+    def enter(self) -> None:
+        if self._active or not self.enabled:
+            return
+        self._active = True
+        self._since = time.monotonic()
+        self.entries += 1
+        self.refresh()
+
+    def refresh(self) -> None:
+        """Suspend widgets and jobs created while idle, e.g. by a config rebuild."""
+        if not self._active:
+            return
+        # explicitly: a widget just added to a layout would otherwise show itself
+        for widget in self.widgets():
+            widget.hide()
+        self.ticks.pause(*self.paused)
+        for name, (_normal, idle) in self.slowed.items():
+            self.ticks.set_interval(name, idle)
+
+    def exit(self) -> None:
+        if not self._active:
+            return
+        self._active = False
+        self.suspended_seconds += time.monotonic() - self._since
+        for widget in self.widgets():
+            widget.show()
+        self.ticks.resume(*self.paused)
+        for name, (normal, _idle) in self.slowed.items():
+            self.ticks.set_interval(name, normal)
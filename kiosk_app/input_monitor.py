@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+import time
+import weakref
+from typing import Callable, Optional
+
+from PySide6.QtCore import QEvent, QObject
+
+
+class InputMonitor(QObject):
+    """Notices user input on the kiosk's top-level windows.
+
+    Input arrives at a window before the window hands it to a widget, so a
+    filter on each :class:`QWindow` sees every press, key and touch while
+    paint, timer and layout traffic of the widgets never crosses into
+    Python, as it would through an application-wide filter. Input only
+    stamps ``last_input``; idle deadlines compare against it when they fire
+    instead of being re-armed per event. ``on_input`` is called for each
+    input event, ``on_context_menu(global_pos)`` for menu-key requests.
+    ``callbacks`` counts the events the filter was called for.
+    """
+
+    def __init__(
+        self,
+        on_input: Callable[[], None],
+        on_context_menu: Callable[[object], None],
+        parent: Optional[QObject] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        super().__init__(parent)
+        self._on_input = on_input
+        self._on_context_menu = on_context_menu
+        self._clock = clock
+        self._windows: "weakref.WeakSet" = weakref.WeakSet()
+        self._input_types = frozenset(
+            (
+                QEvent.MouseButtonPress,
+                QEvent.KeyPress,
+                QEvent.TouchBegin,
+                QEvent.TouchUpdate,
+                QEvent.TouchEnd,
+            )
+        )
+        self._context_menu = QEvent.ContextMenu
+        self.callbacks = 0
+        self.last_input = clock()
+
+    def watch(self, window) -> None:
+        """Filter *window*, e.g. a newly focused dialog; repeated calls are no-ops."""
+        if window is None or window in self._windows:
+            return
+        self._windows.add(window)
+        window.installEventFilter(self)
+
+    def touch(self) -> None:
+        """Count now as activity, e.g. after navigating programmatically."""
+        self.last_input = self._clock()
+
+    def idle_ms(self) -> float:
+        return (self._clock() - self.last_input) * 1000
+
+    def remaining_ms(self, timeout_ms: float) -> float:
+        """How long until *timeout_ms* of inactivity is reached, 0 if it already is."""
+        return max(0.0, timeout_ms - self.idle_ms())
+
+    def eventFilter(self, obj, event):  # type: ignore[override]
+        self.callbacks += 1
+        kind = event.type()
+        if kind in self._input_types:
+            self.last_input = self._clock()
+            try:
+                self._on_input()
+            except Exception:
+                pass
+        elif kind == self._context_menu:
+            try:
+                self._on_context_menu(event.globalPos())
+            except Exception:
+                pass
+            return True
+        return False
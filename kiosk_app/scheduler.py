@@ -0,0 +1,265 @@
+from __future__ import annotations
+
+import logging
+import math
+import re
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Callable, Dict, List, Optional
+
+from PySide6.QtCore import QObject, Qt, QTimer
+
+logger = logging.getLogger(__name__)
+
+# a periodic job may run up to this much early to share another job's wakeup
+COALESCE_MS = 1000
+# clock jobs fire this long after the boundary, so the new value is showing
+CLOCK_LATE_MS = 20
+
+_DIRECTIVE = re.compile(r"%[-_0^#]*([A-Za-z%])")
+_RESOLUTION = {
+    **dict.fromkeys("STXcrsf", 1),
+    **dict.fromkeys("MR", 60),
+    **dict.fromkeys("HIklp", 3600),
+}
+
+
+def clock_resolution(fmt: str) -> int:
+    """Return how often, in seconds, a ``strftime`` *fmt* can show a new value."""
+    resolutions = [_RESOLUTION.get(match, 86400) for match in _DIRECTIVE.findall(fmt or "") if match != "%"]
+    return min(resolutions, default=86400)
+
+
+def next_change(now: datetime, resolution: int) -> datetime:
+    """Return the first moment after *now* at which a clock of *resolution* changes."""
+    if resolution <= 1:
+        return now.replace(microsecond=0) + timedelta(seconds=1)
+    if resolution <= 60:
+        return now.replace(second=0, microsecond=0) + timedelta(minutes=1)
+    if resolution <= 3600:
+        return now.replace(minute=0, second=0, microsecond=0) + timedelta(hours=1)
+    return now.replace(hour=0, minute=0, second=0, microsecond=0) + timedelta(days=1)
+
+
+def _owner_deleted(callback: Callable) -> bool:
+    """Whether *callback* is bound to a Qt object whose C++ side is gone."""
+    owner = getattr(callback, "__self__", None)
+    if owner is None:
+        return False
+    try:
+        import shiboken6
+
+        return not shiboken6.isValid(owner)
+    except Exception:
+        # not a Qt object, or no shiboken to ask
+        return False
+
+
+@dataclass
+class JobStats:
+    runs: int = 0
+    total_ms: float = 0.0
+    max_ms: float = 0.0
+    errors: int = 0
+
+
+@dataclass
+class _Job:
+    name: str
+    callback: Callable
+    interval_ms: Optional[int] = None
+    resolution: Optional[int] = None
+    slack_ms: float = 0.0
+    due: float = 0.0
+    paused: bool = False
+    stats: JobStats = field(default_factory=JobStats)
+
+
+class TickSchedule:
+    """The job table behind :class:`TickScheduler`, free of Qt for testing.
+
+    Times are milliseconds on the monotonic *clock*; clock jobs read the
+    wall time from *wall* to find their next visible change.
+    """
+
+    def __init__(
+        self,
+        clock: Callable[[], float] = time.monotonic,
+        wall: Callable[[], datetime] = datetime.now,
+    ) -> None:
+        self._clock = clock
+        self._wall = wall
+        self._jobs: Dict[str, _Job] = {}
+
+    def now(self) -> float:
+        return self._clock() * 1000
+
+    def every(self, name: str, interval_ms: int, callback: Callable[[], None], slack_ms: Optional[float] = None) -> None:
+        slack = min(COALESCE_MS, interval_ms / 10) if slack_ms is None else slack_ms
+        job = _Job(name, callback, interval_ms=interval_ms, slack_ms=slack, stats=self._stats(name))
+        job.due = self.now() + interval_ms
+        self._jobs[name] = job
+
+    def clock(self, name: str, fmt: str, callback: Callable[[datetime], None]) -> None:
+        """Call ``callback(now)`` whenever the text of *fmt* changes; the first call is immediate."""
+        job = _Job(name, callback, resolution=clock_resolution(fmt), stats=self._stats(name))
+        self._jobs[name] = job
+        self._run(job)
+
+    def once(self, name: str, delay_ms: int, callback: Callable[[], None]) -> None:
+        self._jobs[name] = _Job(name, callback, due=self.now() + delay_ms, stats=self._stats(name))
+
+    def cancel(self, name: str) -> None:
+        self._jobs.pop(name, None)
+
+    def pause(self, name: str) -> None:
+        job = self._jobs.get(name)
+        if job is not None:
+            job.paused = True
+
+    def resume(self, name: str) -> None:
+        job = self._jobs.get(name)
+        if job is None or not job.paused:
+            return
+        job.paused = False
+        if job.resolution is not None:
+            self._run(job)
+        elif job.interval_ms is not None:
+            job.due = min(job.due, self.now() + job.interval_ms)
+
+    def set_interval(self, name: str, interval_ms: int) -> None:
+        job = self._jobs.get(name)
+        if job is not None and job.interval_ms is not None and job.interval_ms != interval_ms:
+            job.interval_ms = interval_ms
+            job.slack_ms = min(COALESCE_MS, interval_ms / 10)
+            job.due = self.now() + interval_ms
+
+    def has(self, name: str) -> bool:
+        return name in self._jobs
+
+    def next_due(self) -> Optional[float]:
+        return min((job.due for job in self._jobs.values() if not job.paused), default=None)
+
+    def run_due(self) -> int:
+        """Run every job that is due, plus periodic ones close enough to join; return how many ran."""
+        now = self.now()
+        active = [job for job in self._jobs.values() if not job.paused]
+        if not any(job.due <= now for job in active):
+            return 0
+        ran = 0
+        for job in active:
+            if job.due - job.slack_ms <= now and self._jobs.get(job.name) is job and not job.paused:
+                self._run(job)
+                ran += 1
+        return ran
+
+    def stats(self) -> Dict[str, JobStats]:
+        return {name: job.stats for name, job in self._jobs.items()}
+
+    def _stats(self, name: str) -> JobStats:
+        # a job re-registered under its name keeps counting where it left off
+        job = self._jobs.get(name)
+        return job.stats if job is not None else JobStats()
+
+    def _run(self, job: _Job) -> None:
+        started = time.perf_counter()
+        try:
+            if job.resolution is not None:
+                job.callback(self._wall())
+            else:
+                job.callback()
+        except Exception:
+            job.stats.errors += 1
+            if _owner_deleted(job.callback):
+                # the widget behind the job was destroyed
+                self._drop(job)
+            else:
+                logger.exception("tick job %r failed", job.name)
+        elapsed = (time.perf_counter() - started) * 1000
+        job.stats.runs += 1
+        job.stats.total_ms += elapsed
+        job.stats.max_ms = max(job.stats.max_ms, elapsed)
+        if self._jobs.get(job.name) is not job:
+            return
+        now = self.now()
+        if job.resolution is not None:
+            wall = self._wall()
+            delay = (next_change(wall, job.resolution) - wall).total_seconds() * 1000
+            job.due = now + delay + CLOCK_LATE_MS
+        elif job.interval_ms is not None:
+            job.due = now + job.interval_ms
+        else:
+            self._drop(job)
+
+    def _drop(self, job: _Job) -> None:
+        if self._jobs.get(job.name) is job:
+            del self._jobs[job.name]
+
+
+class TickScheduler(QObject):
+    """One timer for the kiosk's clocks, polls and idle deadlines.
+
+    Clock jobs wake up when their format shows a new value (once a minute for
+    ``%H:%M``) instead of every second, and periodic jobs that fall due close
+    together share a wakeup. ``stats()`` reports runs and time spent per job,
+    ``wakeups`` the number of timer expiries.
+    """
+
+    def __init__(self, parent: Optional[QObject] = None, schedule: Optional[TickSchedule] = None) -> None:
+        super().__init__(parent)
+        self.schedule = schedule or TickSchedule()
+        self.wakeups = 0
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setTimerType(Qt.PreciseTimer)
+        self._timer.timeout.connect(self._wake)
+
+    def every(self, name: str, interval_ms: int, callback: Callable[[], None]) -> None:
+        self.schedule.every(name, interval_ms, callback)
+        self._arm()
+
+    def clock(self, name: str, fmt: str, callback: Callable[[datetime], None]) -> None:
+        self.schedule.clock(name, fmt, callback)
+        self._arm()
+
+    def once(self, name: str, delay_ms: int, callback: Callable[[], None]) -> None:
+        self.schedule.once(name, delay_ms, callback)
+        self._arm()
+
+    def cancel(self, *names: str) -> None:
+        for name in names:
+            self.schedule.cancel(name)
+        self._arm()
+
+    def pause(self, *names: str) -> None:
+        for name in names:
+            self.schedule.pause(name)
+        self._arm()
+
+    def resume(self, *names: str) -> None:
+        for name in names:
+            self.schedule.resume(name)
+        self._arm()
+
+    def set_interval(self, name: str, interval_ms: int) -> None:
+        self.schedule.set_interval(name, interval_ms)
+        self._arm()
+
+    def stats(self) -> Dict[str, JobStats]:
+        return self.schedule.stats()
+
+    def jobs(self) -> List[str]:
+        return list(self.schedule.stats())
+
+    def _arm(self) -> None:
+        due = self.schedule.next_due()
+        if due is None:
+            self._timer.stop()
+            return
+        self._timer.start(max(0, math.ceil(due - self.schedule.now())))
+
+    def _wake(self) -> None:
+        self.wakeups += 1
+        self.schedule.run_due()
+        self._arm()
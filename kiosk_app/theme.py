@@ -20,7 +20,7 @@ THEME_DEFAULT: Dict[str, object] = {
     "tile_min_w": 320,
     "tile_h": 80,
     "bg_image_path": None,
-    "bg_image_local": None,
+    "bg_image_fit": "cover",
 }
 
 
@@ -36,7 +36,8 @@ def merge_theme(api_theme: dict | None) -> Dict[str, object]:
             merged[key] = value
 
     merged["bg_image_path"] = api_theme.get("bg_image_path") or None
-    merged["bg_image_local"] = None
+    if api_theme.get("bg_image_fit") in ("cover", "contain"):
+        merged["bg_image_fit"] = api_theme["bg_image_fit"]
     return merged
 
 
@@ -49,21 +50,12 @@ def darker(hex_color: str, factor: float = 0.9) -> str:
     return QColor(red, green, blue).name()
 
 
-def build_background_qss(theme: Dict[str, object], *, include_image: bool = True) -> str:
-    """Compose a background stylesheet string for widgets based on the theme."""
+def build_background_qss(theme: Dict[str, object]) -> str:
+    """Compose a background stylesheet string for widgets based on the theme.
+
+    Only the colour: the image is painted by :class:`ui.background.BackgroundLayer`,
+    since Qt stylesheets cannot scale a background image to cover a widget.
+    """
 
     color = theme.get("bg") or "#f5f7fb"
-    parts = [f"background-color: {color};"]
-    if include_image:
-        path = (theme.get("bg_image_local") or theme.get("bg_image_path") or "")
-        if path:
-            url = str(path).replace("\\", "/")
-            parts.append(
-                "background-image: url({}); background-repeat: no-repeat; "
-                "background-position: center center; background-size: cover;".format(url)
-            )
-        else:
-            parts.append("background-image: none;")
-    else:
-        parts.append("background-image: none;")
-    return " ".join(parts)
+    return f"background-color: {color}; background-image: none;"
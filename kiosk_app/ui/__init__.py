@@ -1,18 +1,26 @@
 """UI components for the kiosk application."""
 
+from .background import BackgroundLayer
 from .header import Header
 from .footer import Footer
 from .home import HomePage
+from .home_grid import VirtualHomePage
 from .page import PageView
+from .page_cache import PageCache
+from .players import PlayerPool
 from .admin import AdminView
 from .dialogs import ExitPwdDialog, install_password_dialog_patch
 from .screensaver import ScreensaverLayer
 
 __all__ = [
+    "BackgroundLayer",
     "Header",
     "Footer",
     "HomePage",
+    "VirtualHomePage",
     "PageView",
+    "PageCache",
+    "PlayerPool",
     "AdminView",
     "ExitPwdDialog",
     "install_password_dialog_patch",
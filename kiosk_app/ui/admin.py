@@ -19,6 +19,8 @@ class AdminView(QWidget):
         layout.setSpacing(0)
         if QWebEngineView is not None:
             self.view = QWebEngineView(self)
+            # right clicks open the kiosk menu of the window, not the browser's
+            self.view.setContextMenuPolicy(Qt.NoContextMenu)
             layout.addWidget(self.view)
         else:
             self.view = None
@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+from typing import Optional, Tuple
+
+from PySide6.QtCore import QEvent, QObject, QRect, QSize, Qt
+from PySide6.QtGui import QPainter, QPixmap
+from PySide6.QtWidgets import QWidget
+
+from ..backend.decode import PRIORITY_VISIBLE, DecodeTicket, cover_rect
+from ..backend.media import MediaClient
+
+FITS = ("cover", "contain")
+
+
+def contain_rect(source: QSize, target: QRect) -> QRect:
+    """Return the rect centred in *target* that shows all of *source*."""
+    if source.isEmpty() or target.isEmpty():
+        return QRect()
+    size = source.scaled(target.size(), Qt.KeepAspectRatio)
+    return QRect(
+        target.x() + (target.width() - size.width()) // 2,
+        target.y() + (target.height() - size.height()) // 2,
+        size.width(),
+        size.height(),
+    )
+
+
+class BackgroundLayer(QWidget):
+    """Background image that fills its parent, stacked under the parent's pages.
+
+    The image is downloaded and decoded on the media decoder pool at exactly
+    the widget's size and DPI, so painting is a plain ``drawPixmap`` whatever
+    the resolution of the uploaded file. A resize requests a new variant and
+    keeps painting the old one, scaled, until it arrives.
+    """
+
+    def __init__(self, parent: QWidget, media: MediaClient) -> None:
+        super().__init__(parent)
+        self.media = media
+        self._path: Optional[str] = None
+        self._fit = "cover"
+        self._pixmap: Optional[QPixmap] = None
+        self._requested: Tuple[int, int, float] = (0, 0, 0.0)
+        self._ticket: Optional[DecodeTicket] = None
+        self.setAttribute(Qt.WA_TransparentForMouseEvents, True)
+        self.setAttribute(Qt.WA_NoSystemBackground, True)
+        self.setFocusPolicy(Qt.NoFocus)
+        parent.installEventFilter(self)
+        self.setGeometry(parent.rect())
+        self.lower()
+        self.hide()
+
+    def set_image(self, path: Optional[str], fit: Optional[str] = "cover") -> None:
+        """Show the image at *path* (URL or local file); ``None`` clears it."""
+        path = path or None
+        fit = fit if fit in FITS else "cover"
+        if path == self._path and fit == self._fit:
+            return
+        if path != self._path:
+            self._pixmap = None
+        self._path = path
+        self._fit = fit
+        self._requested = (0, 0, 0.0)
+        self._request()
+        self.update()
+
+    def has_image(self) -> bool:
+        return bool(self._path)
+
+    def _request(self) -> None:
+        ratio = self.devicePixelRatioF()
+        wanted = (self.width(), self.height(), ratio)
+        if wanted == self._requested:
+            return
+        self._requested = wanted
+        if self._ticket is not None:
+            self._ticket.cancel()
+            self._ticket = None
+        if not self._path or self.width() <= 0 or self.height() <= 0:
+            return
+        path = self._path
+        self._ticket = self.media.request_pixmap(
+            path,
+            lambda pixmap: self._on_pixmap(path, wanted, pixmap),
+            self.width(),
+            self.height(),
+            device_pixel_ratio=ratio,
+            cover=self._fit == "cover",
+            priority=PRIORITY_VISIBLE,
+        )
+
+    def _on_pixmap(self, path: str, wanted: Tuple[int, int, float], pixmap: QPixmap) -> None:
+        if path != self._path or wanted != self._requested:
+            return
+        self._ticket = None
+        if pixmap.isNull():
+            return
+        self._pixmap = pixmap
+        if self.isVisible():
+            self.update()
+
+    def eventFilter(self, obj: QObject, event: QEvent) -> bool:  # type: ignore[override]
+        if event.type() == QEvent.Resize:
+            self.setGeometry(self.parentWidget().rect())
+            # Scale ahead of time even while hidden, so the next home visit is ready.
+            self._request()
+        return False
+
+    def paintEvent(self, event) -> None:  # type: ignore[override]
+        pixmap = self._pixmap
+        if pixmap is None or pixmap.isNull():
+            return
+        painter = QPainter(self)
+        ratio = pixmap.devicePixelRatio()
+        logical = QSize(round(pixmap.width() / ratio), round(pixmap.height() / ratio))
+        if self._fit == "contain":
+            painter.drawPixmap(contain_rect(logical, self.rect()), pixmap)
+        elif logical == self.size():
+            painter.drawPixmap(0, 0, pixmap)
+        else:
+            # Stale variant from before a resize: crop and scale until the new one lands.
+            target = QSize(round(self.width() * ratio), round(self.height() * ratio))
+            painter.drawPixmap(self.rect(), pixmap, cover_rect(pixmap.size(), target))
+        painter.end()
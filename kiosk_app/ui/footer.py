@@ -1,17 +1,28 @@
 from __future__ import annotations
 
-from PySide6.QtCore import Qt, QTimer, QSize
+from datetime import datetime
+from typing import Optional
+
+from PySide6.QtCore import Qt, QSize
 from PySide6.QtGui import QPixmap
 from PySide6.QtWidgets import QLabel, QHBoxLayout, QWidget
 
+from ..scheduler import TickScheduler
+
 
 class Footer(QWidget):
-    def __init__(self, theme: dict, clock_format: str = "%H:%M", qr_text: str = "") -> None:
+    CLOCK_JOB = "footer-clock"
+
+    def __init__(
+        self,
+        theme: dict,
+        clock_format: str = "%H:%M",
+        qr_text: str = "",
+        ticks: Optional[TickScheduler] = None,
+    ) -> None:
         super().__init__()
-        self.setStyleSheet(
-            f"background:{theme['footer_bg']}; color:{theme['muted']};"
-            f"border-top:1px solid {theme['border']};"
-        )
+        self.ticks = ticks if ticks is not None else TickScheduler(self)
+        self.apply_theme(theme)
         self.clock = QLabel()
         self.clock.setStyleSheet("font-size:18px; background: transparent;")
         self.qr = QLabel()
@@ -22,13 +33,18 @@ class Footer(QWidget):
         layout.addStretch()
         layout.addWidget(self.qr)
 
-        self._clock_format = clock_format or "%H:%M"
         self.set_qr(qr_text)
-        timer = QTimer(self)
-        timer.timeout.connect(self._tick)
-        timer.start(1000)
-        self._timer = timer
-        self._tick()
+        self.set_clock_format(clock_format)
+
+    def apply_theme(self, theme: dict) -> None:
+        self.setStyleSheet(
+            f"background:{theme['footer_bg']}; color:{theme['muted']};"
+            f"border-top:1px solid {theme['border']};"
+        )
+
+    def set_clock_format(self, clock_format: str) -> None:
+        self._clock_format = clock_format or "%H:%M"
+        self.ticks.clock(self.CLOCK_JOB, self._clock_format, self._tick)
 
     def set_qr(self, text: str) -> None:
         self.qr.clear()
@@ -47,7 +63,5 @@ class Footer(QWidget):
         except Exception:
             pass
 
-    def _tick(self) -> None:
-        from datetime import datetime
-
-        self.clock.setText(datetime.now().strftime(self._clock_format))
+    def _tick(self, now: datetime) -> None:
+        self.clock.setText(now.strftime(self._clock_format))
@@ -1,16 +1,36 @@
 from __future__ import annotations
 
+from datetime import datetime
 from typing import Optional
 
-from PySide6.QtCore import Qt, QTimer
+from PySide6.QtCore import Qt
 from PySide6.QtGui import QFont
 from PySide6.QtWidgets import QLabel, QHBoxLayout, QVBoxLayout, QWidget
 
+from ..backend.decode import PRIORITY_VISIBLE
 from ..backend.media import MediaClient
-from ..backend.weather import fetch_weather
+from ..backend.weather import WeatherReading
+from ..scheduler import TickScheduler
+
+MONTHS = (
+    "января",
+    "февраля",
+    "марта",
+    "апреля",
+    "мая",
+    "июня",
+    "июля",
+    "августа",
+    "сентября",
+    "октября",
+    "ноября",
+    "декабря",
+)
 
 
 class Header(QWidget):
+    CLOCK_JOB = "header-clock"
+
     def __init__(
         self,
         theme: dict,
@@ -20,24 +40,23 @@ class Header(QWidget):
         logo_path: Optional[str] = None,
         weather: Optional[dict] = None,
         clock_format: str = "%H:%M",
+        ticks: Optional[TickScheduler] = None,
     ) -> None:
         super().__init__()
         self.theme = theme
         self.media = media
-        self.setStyleSheet(f"background:{theme['header_bg']}; color:{theme['text']};")
+        self.ticks = ticks if ticks is not None else TickScheduler(self)
+        self.apply_theme(theme)
 
         layout = QHBoxLayout(self)
         layout.setContentsMargins(24, 14, 24, 14)
         layout.setSpacing(12)
 
         self.logo = QLabel()
-        if logo_path:
-            pix = self.media.load_pixmap(logo_path)
-            if not pix.isNull():
-                self.logo.setPixmap(pix.scaledToHeight(36, Qt.SmoothTransformation))
+        self.logo.setStyleSheet("background: transparent; margin-right: 8px;")
+        self._logo_ticket = None
         layout.addWidget(self.logo, 0, Qt.AlignVCenter)
-        if logo_path:
-            layout.addSpacing(8)
+        self.set_logo_path(logo_path)
 
         self.title = QLabel(org_name)
         font = QFont()
@@ -71,20 +90,42 @@ class Header(QWidget):
         right_layout.addWidget(self.time_label, 0, Qt.AlignRight)
         layout.addWidget(right, 0, Qt.AlignVCenter)
 
-        self._time_format = clock_format or "%H:%M"
-        try:
-            timer = QTimer(self)
-            timer.timeout.connect(self._tick_time)
-            timer.start(1000)
-            self._time_timer = timer
-        except Exception:
-            self._time_timer = None
-        self._tick_time()
+        self.set_clock_format(clock_format)
 
-        self._weather_timer = None
-        self._weather_city: Optional[str] = None
-        if weather and weather.get("show_weather"):
-            self._init_weather(weather.get("weather_city") or "")
+        if weather and weather.get("show_weather") and weather.get("weather_city"):
+            self.weather_label.setText("⛅ …")
+
+    def apply_theme(self, theme: dict) -> None:
+        self.theme = theme
+        self.setStyleSheet(f"background:{theme['header_bg']}; color:{theme['text']};")
+
+    def set_title(self, org_name: str) -> None:
+        self.title.setText(org_name)
+
+    def set_clock_format(self, clock_format: str) -> None:
+        self._time_format = clock_format or "%H:%M"
+        # the date is shown as well, so the label changes at midnight at the latest
+        self.ticks.clock(self.CLOCK_JOB, self._time_format, self._tick_time)
+
+    def set_logo_path(self, logo_path: Optional[str]) -> None:
+        if self._logo_ticket is not None:
+            self._logo_ticket.cancel()
+        self._logo_ticket = None
+        self.logo.clear()
+        self.logo.setVisible(bool(logo_path))
+        if logo_path:
+            self._logo_ticket = self.media.request_pixmap(
+                logo_path,
+                self._set_logo,
+                height=36,
+                device_pixel_ratio=self.devicePixelRatioF(),
+                priority=PRIORITY_VISIBLE,
+            )
+
+    def _set_logo(self, pix) -> None:
+        self._logo_ticket = None
+        if not pix.isNull():
+            self.logo.setPixmap(pix)
 
     @staticmethod
     def _icon_for_code(code: Optional[int]) -> str:
@@ -110,57 +151,18 @@ class Header(QWidget):
             return "⛈"
         return "☁"
 
-    def _init_weather(self, city: str) -> None:
-        self._weather_city = city or ""
-        try:
-            self.weather_label.setText("⛅ …")
-        except Exception:
-            pass
-        self._update_weather()
-        try:
-            timer = QTimer(self)
-            timer.setInterval(10 * 60 * 1000)
-            timer.timeout.connect(self._update_weather)
-            timer.start()
-            self._weather_timer = timer
-        except Exception:
-            self._weather_timer = None
-
-    def _update_weather(self) -> None:
-        if not self._weather_city:
-            self.weather_label.setText("")
-            return
-        city, temperature, code = fetch_weather(self._weather_city)
-        if not city:
+    def set_weather(self, reading: Optional[WeatherReading]) -> None:
+        """Show *reading* next to the clock; ``None`` clears the label."""
+        if reading is None or not reading.city:
             self.weather_label.setText("")
             return
-        icon = self._icon_for_code(code)
-        if isinstance(temperature, (int, float)):
-            self.weather_label.setText(f"{city}  {icon} {int(round(temperature))}°C")
+        icon = self._icon_for_code(reading.code)
+        if isinstance(reading.temperature, (int, float)):
+            self.weather_label.setText(f"{reading.city}  {icon} {int(round(reading.temperature))}°C")
         else:
-            self.weather_label.setText(f"{city}  {icon}")
+            self.weather_label.setText(f"{reading.city}  {icon}")
 
-    def _tick_time(self) -> None:
-        try:
-            from datetime import datetime
-
-            now = datetime.now()
-            months = [
-                "января",
-                "февраля",
-                "марта",
-                "апреля",
-                "мая",
-                "июня",
-                "июля",
-                "августа",
-                "сентября",
-                "октября",
-                "ноября",
-                "декабря",
-            ]
-            date_str = f"{now.day} {months[now.month - 1]}"
-            time_str = now.strftime(self._time_format or "%H:%M")
-            self.time_label.setText(f"{time_str}  •  {date_str}")
-        except Exception:
-            pass
+    def _tick_time(self, now: datetime) -> None:
+        date_str = f"{now.day} {MONTHS[now.month - 1]}"
+        time_str = now.strftime(self._time_format)
+        self.time_label.setText(f"{time_str}  •  {date_str}")
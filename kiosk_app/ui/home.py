@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Callable, List
+from typing import Callable, List, Tuple
 
 from PySide6.QtCore import Qt
 from PySide6.QtGui import QGuiApplication
@@ -14,7 +14,8 @@ from PySide6.QtWidgets import (
     QWidget,
 )
 
-from .styles import add_shadow, button_stylesheet
+from .reconcile import Reconciler
+from .styles import STYLES, add_shadow
 
 
 class KioskTile(QPushButton):
@@ -29,8 +30,7 @@ class KioskTile(QPushButton):
     ) -> None:
         super().__init__()
         self.slug = slug
-        background = bg_color or theme["primary"]
-        self.setStyleSheet(button_stylesheet(background, pad_v=10))
+        self._background = ""
         self.setCursor(Qt.PointingHandCursor)
         self.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
         self.setMinimumHeight(theme["tile_h"])
@@ -39,15 +39,27 @@ class KioskTile(QPushButton):
         layout.setContentsMargins(14, 6, 14, 6)
         layout.setSpacing(0)
 
-        label = QLabel(title)
-        label.setStyleSheet("font-size:20px; font-weight:700; background: transparent; color: #ffffff;")
+        self.label = QLabel(title)
+        STYLES.apply(self.label, "label", fg="#ffffff")
         layout.addStretch(1)
-        layout.addWidget(label, 0, Qt.AlignCenter)
+        layout.addWidget(self.label, 0, Qt.AlignCenter)
         layout.addStretch(1)
+        self.set_colors(bg_color or theme["primary"])
         add_shadow(self, blur=16, y=3)
         if on_click:
             self.clicked.connect(lambda: on_click(self.slug))
 
+    def set_colors(self, background: str) -> None:
+        if background != self._background:
+            self._background = background
+            STYLES.apply(self, "tile", bg=background, fg="#ffffff")
+
+    def update_node(self, node: dict, theme: dict) -> None:
+        """Refresh the tile in place for a changed menu *node*."""
+        self.slug = node.get("target_slug", "")
+        self.label.setText(node.get("title", ""))
+        self.set_colors(node.get("bg_color") or theme["primary"])
+
 
 class DropList(QWidget):
     def __init__(
@@ -76,29 +88,28 @@ class DropList(QWidget):
         wrap = QVBoxLayout(self)
         wrap.setContentsMargins(0, 0, 0, 0)
         wrap.setSpacing(0)
-        self.setStyleSheet("background: transparent;")
-
-        for item in self.items:
-            title = item.get("title", "")
-            slug = item.get("target_slug", "")
-            bg = item.get("bg_color") or theme["primary"]
-            fg = item.get("text_color") or "#ffffff"
-
-            btn = QPushButton(title)
-            btn.setCursor(Qt.PointingHandCursor)
-            btn.setStyleSheet(
-                button_stylesheet(bg, fg=fg, radius=10, pad_v=14, pad_h=16, fs=18)
-            )
-            btn.setMinimumWidth(260)
-            try:
-                btn.setMinimumHeight(max(44, theme["tile_h"] - 48))
-            except Exception:
-                btn.setMinimumHeight(44)
+        STYLES.apply(self, "dropList")
+
+        with STYLES.batch():
+            for item in self.items:
+                title = item.get("title", "")
+                slug = item.get("target_slug", "")
+                bg = item.get("bg_color") or theme["primary"]
+                fg = item.get("text_color") or "#ffffff"
+
+                btn = QPushButton(title)
+                btn.setCursor(Qt.PointingHandCursor)
+                STYLES.apply(btn, "drop", bg=bg, fg=fg)
+                btn.setMinimumWidth(260)
+                try:
+                    btn.setMinimumHeight(max(44, theme["tile_h"] - 48))
+                except Exception:
+                    btn.setMinimumHeight(44)
 
-            if self.on_pick:
-                btn.clicked.connect(lambda _, slug=slug: self._select(slug))
+                if self.on_pick:
+                    btn.clicked.connect(lambda _, slug=slug: self._select(slug))
 
-            wrap.addWidget(btn)
+                wrap.addWidget(btn)
 
     def _select(self, slug: str) -> None:
         self.hide()
@@ -121,10 +132,9 @@ class GroupTile(QPushButton):
         self.theme = theme
         self.items = items or []
         self.on_pick = on_pick
+        self._colors: tuple = ()
+        self._popup: DropList | None = None
 
-        background = bg_color or theme["primary"]
-        fg = text_color or "#ffffff"
-        self.setStyleSheet(button_stylesheet(background, fg=fg, pad_v=10))
         self.setCursor(Qt.PointingHandCursor)
         self.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
         self.setMinimumHeight(theme["tile_h"])
@@ -133,19 +143,42 @@ class GroupTile(QPushButton):
         row.setContentsMargins(14, 6, 14, 6)
         row.setSpacing(0)
 
-        title_lbl = QLabel(title)
-        title_lbl.setStyleSheet(
-            f"font-size:20px; font-weight:700; background: transparent; color: {fg};"
-        )
+        self.title_lbl = QLabel(title)
         row.addStretch(1)
-        row.addWidget(title_lbl, 0, Qt.AlignCenter)
+        row.addWidget(self.title_lbl, 0, Qt.AlignCenter)
         row.addStretch(1)
+        self.set_colors(bg_color or theme["primary"], text_color or "#ffffff")
 
         add_shadow(self, blur=16, y=3)
         self.clicked.connect(self._show_list)
 
+    def set_colors(self, background: str, fg: str) -> None:
+        if (background, fg) == self._colors:
+            return
+        self._colors = (background, fg)
+        STYLES.apply(self, "tile", bg=background, fg=fg)
+        STYLES.apply(self.title_lbl, "label", fg=fg)
+
+    def update_node(self, node: dict, theme: dict) -> None:
+        """Refresh the tile in place; the cached popup is rebuilt on next use."""
+        self.title_lbl.setText(node.get("title", "Группа"))
+        self.set_colors(node.get("bg_color") or theme["primary"], node.get("text_color") or "#ffffff")
+        items = node.get("items") or []
+        if items != self.items or theme is not self.theme:
+            self.items = items
+            self.theme = theme
+            self._drop_popup()
+
+    def _drop_popup(self) -> None:
+        if self._popup is not None:
+            self._popup.hide()
+            self._popup.deleteLater()
+        self._popup = None
+
     def _show_list(self) -> None:
-        popup = DropList(self.theme, self.items, self.on_pick, parent=self)
+        if self._popup is None:
+            self._popup = DropList(self.theme, self.items, self.on_pick, parent=self)
+        popup = self._popup
         try:
             popup.setFixedWidth(max(self.width(), 260))
         except Exception:
@@ -181,13 +214,24 @@ class GroupTile(QPushButton):
         popup.show()
 
 
+def _node_key(node: dict) -> Tuple[str, object]:
+    kind = "group" if node.get("kind") == "group" else "button"
+    key = node.get("id")
+    if key is None:
+        key = node.get("target_slug") if kind == "button" else node.get("title")
+    return kind, key
+
+
 class HomePage(QWidget):
     def __init__(self, theme: dict, router: Callable[[str], None]):
         super().__init__()
         self.theme = theme
         self.router = router
         self.buttons_data: List[dict] = []
-        self.setStyleSheet(f"background: transparent; color:{theme['text']};")
+        # Scoped to the page: a selector-less rule would cascade to the tiles
+        # and override the application stylesheet they are styled by.
+        self.setObjectName("homePage")
+        self.setStyleSheet(f"#homePage {{ background: transparent; color:{theme['text']}; }}")
 
         outer = QVBoxLayout(self)
         outer.setContentsMargins(24, 24, 24, 24)
@@ -201,70 +245,87 @@ class HomePage(QWidget):
         self.grid.setHorizontalSpacing(theme["gap"])
         self.grid.setVerticalSpacing(theme.get("gap_v", theme["gap"]))
 
+        # Tiles are kept per node key and only re-placed when the order or
+        # the number of columns changes.
+        self._tiles: Reconciler[QPushButton] = Reconciler(
+            _node_key,
+            self._create_tile,
+            lambda tile, node: tile.update_node(node, self.theme),
+            self._remove_tile,
+        )
+        self._placed: Tuple[list, int] = ([], 0)
+
+    def apply_theme(self, theme: dict) -> None:
+        """Restyle the page and its tiles for *theme* without touching the data."""
+        self.theme = theme
+        sheet = f"#homePage {{ background: transparent; color:{theme['text']}; }}"
+        if sheet != self.styleSheet():
+            self.setStyleSheet(sheet)
+        with STYLES.batch():
+            for tile, node in self._tiles.entries():
+                tile.update_node(node, theme)
+
     def build(self, top_nodes: List[dict]) -> None:
-        self.buttons_data = top_nodes
+        self.buttons_data = top_nodes or []
+        flat = sorted(self.buttons_data, key=lambda x: (x.get("order_index") or 0))
+        seen = set()
+        nodes: List[dict] = []
+        for node in flat:
+            key = _node_key(node)
+            if key not in seen:
+                seen.add(key)
+                nodes.append(node)
+        with STYLES.batch():
+            self._tiles.reconcile(nodes)
         self._relayout()
 
+    def _remove_tile(self, tile: QPushButton) -> None:
+        self.grid.removeWidget(tile)
+        tile.hide()
+        tile.deleteLater()
+
+    def _create_tile(self, node: dict) -> QPushButton:
+        if node.get("kind") == "group":
+            return GroupTile(
+                title=node.get("title", "Группа"),
+                items=node.get("items", []),
+                theme=self.theme,
+                bg_color=node.get("bg_color"),
+                text_color=node.get("text_color"),
+                on_pick=lambda slug, r=self.router: r(slug),
+            )
+        return KioskTile(
+            title=node.get("title", ""),
+            slug=node.get("target_slug", ""),
+            theme=self.theme,
+            bg_color=node.get("bg_color"),
+            on_click=lambda slug, r=self.router: r(slug),
+        )
+
     def resizeEvent(self, event):  # type: ignore[override]
         super().resizeEvent(event)
         self._relayout()
 
-    def _relayout(self) -> None:
-        try:
-            while self.grid.count():
-                item = self.grid.takeAt(0)
-                widget = item.widget()
-                if widget is not None:
-                    widget.hide()
-                    widget.setParent(None)
-                    widget.deleteLater()
-        except Exception:
-            for i in reversed(range(self.grid.count())):
-                grid_item = self.grid.itemAt(i)
-                widget = grid_item.widget() if grid_item else None
-                if widget is not None:
-                    widget.hide()
-                    widget.setParent(None)
-        if not self.buttons_data:
-            return
-
+    def _columns(self) -> int:
         width = max(300, self.width() - 48)
         tile_width = self.theme["tile_min_w"]
         gap = self.theme["gap"]
-        cols = max(1, min(4, (width + gap) // (tile_width + gap)))
+        return max(1, min(4, (width + gap) // (tile_width + gap)))
 
-        flat = sorted(self.buttons_data, key=lambda x: (x.get("order_index") or 0))
-        for idx, node in enumerate(flat):
+    def _relayout(self) -> None:
+        cols = self._columns()
+        if self._placed == (self._tiles.order, cols):
+            return
+        self._placed = (list(self._tiles.order), cols)
+
+        while self.grid.count():
+            self.grid.takeAt(0)
+        for idx, tile in enumerate(self._tiles.widgets()):
             row, col = divmod(idx, cols)
-            if node.get("kind") == "group":
-                tile = GroupTile(
-                    title=node.get("title", "Группа"),
-                    items=node.get("items", []),
-                    theme=self.theme,
-                    bg_color=node.get("bg_color"),
-                    text_color=node.get("text_color"),
-                    on_pick=lambda slug, r=self.router: r(slug),
-                )
-            else:
-                tile = KioskTile(
-                    title=node.get("title", ""),
-                    slug=node.get("target_slug", ""),
-                    theme=self.theme,
-                    bg_color=node.get("bg_color"),
-                    on_click=lambda slug, r=self.router: r(slug),
-                )
             self.grid.addWidget(tile, row, col, Qt.AlignTop)
+            tile.show()
 
-        try:
-            rows = (len(flat) + cols - 1) // cols
-            for i in range(max(0, rows)):
-                try:
-                    self.grid.setRowStretch(i, 0)
-                except Exception:
-                    pass
-            try:
-                self.grid.setRowStretch(rows, 1)
-            except Exception:
-                pass
-        except Exception:
-            pass
+        rows = (len(self._tiles) + cols - 1) // cols
+        for i in range(self.grid.rowCount()):
+            self.grid.setRowStretch(i, 0)
+        self.grid.setRowStretch(rows, 1)
@@ -0,0 +1,283 @@
+from __future__ import annotations
+
+from typing import Callable, Dict, List, Optional, Tuple
+
+from PySide6.QtCore import QAbstractListModel, QModelIndex, QPoint, QRect, QSize, Qt
+from PySide6.QtGui import QColor, QFont, QPainter, QPainterPath, QPixmap
+from PySide6.QtWidgets import (
+    QAbstractItemView,
+    QFrame,
+    QListView,
+    QScroller,
+    QStyle,
+    QStyledItemDelegate,
+    QStyleOptionViewItem,
+    QVBoxLayout,
+    QWidget,
+)
+
+from ..backend.decode import PRIORITY_VISIBLE
+from ..theme import darker
+from .home import DropList, _node_key
+from .styles import paint_shadow
+
+NodeRole = Qt.UserRole + 1
+
+
+class MenuModel(QAbstractListModel):
+    """Flat list model of top-level menu nodes (buttons and groups)."""
+
+    def __init__(self, parent: Optional[QWidget] = None) -> None:
+        super().__init__(parent)
+        self._nodes: List[dict] = []
+        self._icons: Dict[str, QPixmap] = {}
+
+    def set_nodes(self, nodes: List[dict]) -> None:
+        self.beginResetModel()
+        self._nodes = sorted(nodes or [], key=lambda x: (x.get("order_index") or 0))
+        self.endResetModel()
+
+    def node(self, row: int) -> dict:
+        return self._nodes[row]
+
+    def set_icon(self, path: str, pixmap: QPixmap) -> None:
+        self._icons[path] = pixmap
+        for row, node in enumerate(self._nodes):
+            if node.get("icon_path") == path:
+                index = self.index(row)
+                self.dataChanged.emit(index, index, [Qt.DecorationRole])
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:  # type: ignore[override]
+        return 0 if parent.isValid() else len(self._nodes)
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole):  # type: ignore[override]
+        if not index.isValid() or index.row() >= len(self._nodes):
+            return None
+        node = self._nodes[index.row()]
+        if role == Qt.DisplayRole:
+            return node.get("title") or ("Группа" if node.get("kind") == "group" else "")
+        if role == Qt.DecorationRole:
+            return self._icons.get(node.get("icon_path") or "")
+        if role == NodeRole:
+            return node
+        return None
+
+
+class TileDelegate(QStyledItemDelegate):
+    """Paints menu tiles: rounded background, soft shadow, optional icon and title."""
+
+    def __init__(self, theme: dict, parent: Optional[QWidget] = None) -> None:
+        super().__init__(parent)
+        self.theme = theme
+        self.pressed_row = -1
+        self._shades: Dict[Tuple[str, float], QColor] = {}
+        self._font = QFont()
+        self._font.setPixelSize(20)
+        self._font.setWeight(QFont.Bold)
+
+    def set_theme(self, theme: dict) -> None:
+        self.theme = theme
+
+    def _shade(self, color: str, factor: float) -> QColor:
+        key = (color, factor)
+        shade = self._shades.get(key)
+        if shade is None:
+            shade = QColor(darker(color, factor) if factor != 1.0 else color)
+            self._shades[key] = shade
+        return shade
+
+    def sizeHint(self, option: QStyleOptionViewItem, index: QModelIndex) -> QSize:  # type: ignore[override]
+        view = self.parent()
+        grid = view.gridSize() if isinstance(view, QListView) else QSize()
+        if grid.isValid():
+            return grid
+        return QSize(int(self.theme["tile_min_w"]), int(self.theme["tile_h"]))
+
+    def paint(self, painter: QPainter, option: QStyleOptionViewItem, index: QModelIndex) -> None:  # type: ignore[override]
+        node = index.data(NodeRole) or {}
+        gap = int(self.theme.get("gap", 16))
+        gap_v = int(self.theme.get("gap_v", gap))
+        rect: QRect = option.rect.adjusted(gap // 2, gap_v // 2, -(gap - gap // 2), -(gap_v - gap_v // 2) - 4)
+        radius = float(self.theme.get("radius", 14))
+        base = node.get("bg_color") or self.theme["primary"]
+        if index.row() == self.pressed_row:
+            factor = 0.85
+        elif option.state & QStyle.State_MouseOver:
+            factor = 0.92
+        else:
+            factor = 1.0
+
+        painter.save()
+        painter.setRenderHint(QPainter.Antialiasing, True)
+        # kept inside the cell: a repaint of one item must not cut its neighbour's shadow
+        paint_shadow(painter, rect, radius=int(radius), blur=4, y=1)
+
+        path = QPainterPath()
+        path.addRoundedRect(rect, radius, radius)
+        painter.fillPath(path, self._shade(base, factor))
+
+        text_rect = rect.adjusted(14, 6, -14, -6)
+        icon = index.data(Qt.DecorationRole)
+        if isinstance(icon, QPixmap) and not icon.isNull():
+            size = icon.deviceIndependentSize().toSize()
+            top = text_rect.top() + (text_rect.height() - size.height()) // 2
+            painter.drawPixmap(QPoint(text_rect.left(), top), icon)
+            text_rect.setLeft(text_rect.left() + size.width() + 10)
+
+        painter.setPen(QColor(node.get("text_color") or "#ffffff"))
+        painter.setFont(self._font)
+        painter.drawText(text_rect, Qt.AlignCenter | Qt.TextWordWrap, str(index.data(Qt.DisplayRole) or ""))
+        painter.restore()
+
+
+class _TileView(QListView):
+    def __init__(self, delegate: TileDelegate, parent: Optional[QWidget] = None) -> None:
+        super().__init__(parent)
+        self._delegate = delegate
+
+    def mousePressEvent(self, event):  # type: ignore[override]
+        index = self.indexAt(event.position().toPoint())
+        self._delegate.pressed_row = index.row() if index.isValid() else -1
+        self.viewport().update()
+        super().mousePressEvent(event)
+
+    def mouseReleaseEvent(self, event):  # type: ignore[override]
+        super().mouseReleaseEvent(event)
+        self._delegate.pressed_row = -1
+        self.viewport().update()
+
+
+class VirtualHomePage(QWidget):
+    """Home grid for large menus: one view, tiles painted by a delegate.
+
+    Only the visible rows are painted and no widget exists per tile, so the
+    cost no longer grows with the menu size. The column count follows the
+    width (no four-column cap) and the list scrolls kinetically. The public
+    API matches :class:`HomePage`.
+    """
+
+    def __init__(self, theme: dict, router: Callable[[str], None], media=None):
+        super().__init__()
+        self.theme = theme
+        self.router = router
+        self.media = media
+        self.buttons_data: List[dict] = []
+        self._popups: Dict[Tuple[str, object], DropList] = {}
+        self._icon_tickets: List[object] = []
+        self.setObjectName("homePage")
+        self.setStyleSheet(f"#homePage {{ background: transparent; color:{theme['text']}; }}")
+
+        outer = QVBoxLayout(self)
+        outer.setContentsMargins(24 - theme["gap"] // 2, 24, 24 - theme["gap"] // 2, 24)
+        outer.setSpacing(0)
+
+        self.model = MenuModel(self)
+        self.delegate = TileDelegate(theme)
+        self.view = _TileView(self.delegate, self)
+        self.delegate.setParent(self.view)
+        self.view.setModel(self.model)
+        self.view.setItemDelegate(self.delegate)
+        self.view.setViewMode(QListView.IconMode)
+        self.view.setFlow(QListView.LeftToRight)
+        self.view.setWrapping(True)
+        self.view.setResizeMode(QListView.Adjust)
+        self.view.setMovement(QListView.Static)
+        self.view.setUniformItemSizes(True)
+        self.view.setSelectionMode(QAbstractItemView.NoSelection)
+        self.view.setFocusPolicy(Qt.NoFocus)
+        self.view.setFrameShape(QFrame.NoFrame)
+        self.view.setMouseTracking(True)
+        self.view.setVerticalScrollMode(QAbstractItemView.ScrollPerPixel)
+        self.view.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        self.view.setVerticalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        self.view.setCursor(Qt.PointingHandCursor)
+        self.view.setStyleSheet("QListView { background: transparent; border: 0; }")
+        try:
+            QScroller.grabGesture(self.view.viewport(), QScroller.LeftMouseButtonGesture)
+        except Exception:
+            pass
+        self.view.clicked.connect(self._activate)
+        outer.addWidget(self.view, 1)
+
+    def apply_theme(self, theme: dict) -> None:
+        self.theme = theme
+        sheet = f"#homePage {{ background: transparent; color:{theme['text']}; }}"
+        if sheet != self.styleSheet():
+            self.setStyleSheet(sheet)
+        self.delegate.set_theme(theme)
+        self._drop_popups()
+        self._update_grid()
+        self.view.viewport().update()
+
+    def build(self, top_nodes: List[dict]) -> None:
+        self.buttons_data = top_nodes or []
+        self._drop_popups()
+        for ticket in self._icon_tickets:
+            ticket.cancel()
+        self._icon_tickets.clear()
+        self.model.set_nodes(self.buttons_data)
+        self._update_grid()
+        self._request_icons()
+
+    def resizeEvent(self, event):  # type: ignore[override]
+        super().resizeEvent(event)
+        self._update_grid()
+
+    def _update_grid(self) -> None:
+        width = self.view.viewport().width()
+        if width <= 0:
+            return
+        gap = self.theme["gap"]
+        cols = max(1, width // (self.theme["tile_min_w"] + gap))
+        # QListView wraps an item that would end exactly on the right edge
+        size = QSize((width - 1) // cols, self.theme["tile_h"] + self.theme.get("gap_v", gap) + 4)
+        if size != self.view.gridSize():
+            self.view.setGridSize(size)
+
+    def _request_icons(self) -> None:
+        if self.media is None:
+            return
+        for path in {node.get("icon_path") for node in self.buttons_data if node.get("icon_path")}:
+            ticket = self.media.request_pixmap(
+                path,
+                lambda pix, path=path: self._set_icon(path, pix),
+                height=36,
+                device_pixel_ratio=self.devicePixelRatioF(),
+                priority=PRIORITY_VISIBLE,
+            )
+            if ticket is not None:
+                self._icon_tickets.append(ticket)
+
+    def _set_icon(self, path: str, pixmap: QPixmap) -> None:
+        if not pixmap.isNull():
+            self.model.set_icon(path, pixmap)
+
+    def _drop_popups(self) -> None:
+        for popup in self._popups.values():
+            popup.hide()
+            popup.deleteLater()
+        self._popups.clear()
+
+    def _activate(self, index: QModelIndex) -> None:
+        node = index.data(NodeRole) or {}
+        if node.get("kind") != "group":
+            slug = node.get("target_slug")
+            if slug:
+                self.router(slug)
+            return
+        key = _node_key(node)
+        popup = self._popups.get(key)
+        if popup is None:
+            popup = DropList(self.theme, node.get("items") or [], self.router, parent=self)
+            self._popups[key] = popup
+        rect = self.view.visualRect(index)
+        popup.setFixedWidth(max(rect.width() - self.theme["gap"], 260))
+        popup.adjustSize()
+        anchor = self.view.viewport().mapToGlobal(rect.bottomLeft())
+        x, y = anchor.x() + self.theme["gap"] // 2, anchor.y() + 6
+        screen = self.screen().availableGeometry() if self.screen() is not None else None
+        if screen is not None:
+            x = max(8, min(x, screen.right() - 8 - popup.width()))
+            y = min(y, max(8, screen.bottom() - 8 - popup.sizeHint().height()))
+        popup.move(x, y)
+        popup.show()
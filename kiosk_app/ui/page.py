@@ -1,8 +1,8 @@
 from __future__ import annotations
 
-from typing import List
+from typing import List, Optional, Tuple
 
-from PySide6.QtCore import Qt
+from PySide6.QtCore import QRect, Qt, QTimer
 from PySide6.QtGui import QDesktopServices
 from PySide6.QtWidgets import (
     QLabel,
@@ -14,18 +14,37 @@ from PySide6.QtWidgets import (
     QPushButton,
 )
 
+from ..backend.decode import PRIORITY_VISIBLE
 from ..backend.media import MediaClient
 from ..theme import build_background_qss
+from .players import PlayerLease, PlayerPool
+from .reconcile import Reconciler
 from .styles import add_shadow
 
+# blocks within this many viewport heights of the visible area are materialized
+PRELOAD_SCREENS = 1.0
+# off-screen heavy blocks are released, farthest first, above this estimate
+HEAVY_BUDGET_BYTES = 128 * 1024 * 1024
+RESERVED_HEIGHT = {"image": 360, "pdf": 620, "video": 460}
+PDF_COST = 24 * 1024 * 1024
+VIDEO_COST = 32 * 1024 * 1024
+
+
+def _block_key(block: dict) -> Tuple[str, object]:
+    key = block.get("id")
+    if key is None:
+        key = repr(block.get("content"))
+    return block.get("kind") or "", key
+
 
 class PageView(QWidget):
-    def __init__(self, theme: dict, router, media: MediaClient) -> None:
+    def __init__(self, theme: dict, router, media: MediaClient, players: Optional[PlayerPool] = None) -> None:
         super().__init__()
         self.theme = theme
         self.router = router
         self.media = media
-        self.setStyleSheet(f"{build_background_qss(theme, include_image=False)} color:{theme['text']};")
+        self.players = players if players is not None else PlayerPool()
+        self.setStyleSheet(f"{build_background_qss(theme)} color:{theme['text']};")
 
         outer = QVBoxLayout(self)
         outer.setContentsMargins(24, 24, 24, 24)
@@ -45,7 +64,24 @@ class PageView(QWidget):
         self.body = QVBoxLayout(self.page_wrap)
         self.body.setContentsMargins(0, 0, 0, 0)
         self.body.setSpacing(theme["gap"])
-        self._media_refs: List[tuple] = []
+        self._blocks: Reconciler[QWidget] = Reconciler(
+            _block_key, self._create_block, self._update_block, self._remove_block
+        )
+        self._slots: List[BlockSlot] = []
+        self.heavy_budget = HEAVY_BUDGET_BYTES
+        self._image_width = 0
+        self._rescale_timer = QTimer(self)
+        self._rescale_timer.setSingleShot(True)
+        self._rescale_timer.setInterval(150)
+        self._rescale_timer.timeout.connect(self._rescale_images)
+        self._visibility_timer = QTimer(self)
+        self._visibility_timer.setSingleShot(True)
+        self._visibility_timer.setInterval(0)
+        self._visibility_timer.timeout.connect(self._update_visible)
+        scrollbar = self.scroll.verticalScrollBar()
+        # not connected to QTimer.start directly: it would take the value as an interval
+        scrollbar.valueChanged.connect(lambda _value: self._visibility_timer.start())
+        scrollbar.rangeChanged.connect(lambda _low, _high: self._visibility_timer.start())
 
         self.home_btn = QPushButton("На главную")
         self.home_btn.setCursor(Qt.PointingHandCursor)
@@ -54,126 +90,346 @@ class PageView(QWidget):
             "background: #e5e7eb; color:#111; border:0; border-radius:10px;"
             "font-weight:600; font-size:16px; padding:10px 14px;"
         )
-        add_shadow(self.home_btn, blur=16, y=6, color="rgba(0,0,0,0.10)")
+        add_shadow(self.home_btn, radius=10, blur=16, y=6, color="rgba(0,0,0,0.10)")
         self.home_btn.clicked.connect(lambda: self.router("home"))
         outer.addSpacing(8)
         outer.addWidget(self.home_btn, 0, Qt.AlignRight)
 
+    def apply_theme(self, theme: dict) -> None:
+        self.theme = theme
+        self.setStyleSheet(f"{build_background_qss(theme)} color:{theme['text']};")
+
+    @property
+    def heavy_cost(self) -> int:
+        """Estimated bytes held by the page's materialized images, PDFs and videos."""
+        return sum(slot.cost for slot in self._slots)
+
     def render_blocks(self, blocks: List[dict]) -> None:
-        def clear(layout: QVBoxLayout) -> None:
-            for i in reversed(range(layout.count())):
-                widget = layout.itemAt(i).widget()
-                if widget:
-                    widget.setParent(None)
+        """Show *blocks*: text at once, images/PDFs/videos as placeholders.
+
+        Blocks already on the page are matched by id and patched in place, so
+        an edit keeps the scroll position and untouched images and videos.
+        Heavy blocks are materialized by :meth:`_update_visible` once they come
+        within a viewport height of the visible area.
+        """
+        if not self._blocks:
+            self._image_width = self._image_target_width()
+        blocks = [block for block in blocks if block.get("kind") in RESERVED_HEIGHT or block.get("kind") == "text"]
+        fresh = not self._blocks
+        patch = self._blocks.reconcile(blocks)
+        if patch.created or patch.moved:
+            for index, widget in enumerate(self._blocks.widgets()):
+                if self.body.indexOf(widget) != index:
+                    self.body.removeWidget(widget)
+                    self.body.insertWidget(index, widget)
+        self._slots = [widget for widget in self._blocks.widgets() if isinstance(widget, BlockSlot)]
+        if fresh:
+            self.scroll.verticalScrollBar().setValue(0)
+        self._visibility_timer.start()
+
+    def _create_block(self, block: dict) -> QWidget:
+        kind = block.get("kind")
+        content = block.get("content", {})
+        if kind == "text":
+            label = QLabel(content.get("html", ""))
+            label.setTextFormat(Qt.RichText)
+            label.setWordWrap(True)
+            label.setContextMenuPolicy(Qt.NoContextMenu)
+            label.setStyleSheet("font-size:18px; line-height:1.55; background: transparent;")
+            return label
+        return BlockSlot(kind, content)
+
+    def _update_block(self, widget: QWidget, block: dict) -> None:
+        content = block.get("content", {})
+        if isinstance(widget, BlockSlot):
+            if content != widget.content:
+                widget.reset(content)
+        elif widget.text() != content.get("html", ""):  # type: ignore[attr-defined]
+            widget.setText(content.get("html", ""))  # type: ignore[attr-defined]
+
+    def _remove_block(self, widget: QWidget) -> None:
+        if isinstance(widget, BlockSlot):
+            widget.release()
+        self.body.removeWidget(widget)
+        widget.hide()
+        widget.deleteLater()
 
+    def _update_visible(self) -> None:
+        """Materialize blocks near the viewport, play visible videos, trim the rest."""
+        if not self._slots or not self.isVisible():
+            return
+        self.body.activate()
+        if self.page_wrap.height() < self.body.minimumSize().height():
+            # the scroll area has not grown the page to its new content yet
+            self._visibility_timer.start()
+            return
+        if self._image_target_width() != self._image_width:
+            # rendered while hidden, before the viewport had its real width
+            self._rescale_images()
+        viewport = self.scroll.viewport()
+        top = self.scroll.verticalScrollBar().value()
+        visible = QRect(0, top, viewport.width(), viewport.height())
+        margin = round(viewport.height() * PRELOAD_SCREENS)
+        near = visible.adjusted(0, -margin, 0, margin)
+        for slot in self._slots:
+            geometry = slot.geometry()
+            if geometry.intersects(near) and not slot.live:
+                # a visible video may take a player from a hidden page in the back stack
+                self._materialize(slot, steal=geometry.intersects(visible))
+            slot.set_playing(geometry.intersects(visible))
+        self._trim(near)
+
+    def _trim(self, near: QRect) -> None:
+        live = [slot for slot in self._slots if slot.live and slot.cost]
+        total = sum(slot.cost for slot in live)
+        if total <= self.heavy_budget:
+            return
+        centre = near.center().y()
+        live.sort(key=lambda slot: abs(slot.geometry().center().y() - centre), reverse=True)
+        for slot in live:
+            if total <= self.heavy_budget or slot.geometry().intersects(near):
+                break
+            total -= slot.cost
+            slot.release()
+
+    def _materialize(self, slot: BlockSlot, *, steal: bool = False) -> None:
+        content = slot.content
+        if slot.kind == "image":
+            img = QLabel()
+            img.setStyleSheet("background: transparent;")
+            slot.hold(img, slot.height() * max(1, self._image_width) * 4)
+            self._request_image(slot)
+        elif slot.kind == "pdf":
+            try:
+                from PySide6.QtPdfWidgets import QPdfView  # noqa: F401
+            except Exception as exc:
+                slot.hold(QLabel(f"PDF просмотрщик недоступен: {exc}"))
+                return
+            # the file comes from the download queue; the slot keeps its height meanwhile
+            loading = QLabel()
+            loading.setStyleSheet("background: transparent;")
+            slot.hold(loading)
+            slot.setMinimumHeight(RESERVED_HEIGHT["pdf"])
+            slot.ticket = self.media.request_file(
+                content.get("path", ""),
+                lambda local, slot=slot, loading=loading: self._show_pdf(slot, loading, local),
+                timeout=15,
+            )
+        elif slot.kind == "video":
+            try:
+                lease = self.players.acquire(
+                    on_revoke=lambda: self._revoke(slot), steal=steal, steal_visible=False
+                )
+            except Exception as exc:
+                slot.hold(QLabel(f"Видео недоступно: {exc}"))
+                return
+            if lease is None:
+                # every pooled player is busy; retried on the next visibility pass
+                return
+            video_widget = lease.widget
+            try:
+                video_widget.setAttribute(Qt.WA_StyledBackground, True)
+                video_widget.setStyleSheet(f"background:{self.theme['bg']};")
+                video_widget.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
+            except Exception:
+                pass
+            try:
+                lease.audio.setVolume(0.5)
+            except Exception:
+                pass
+            url = self.media.video_url(content.get("path", ""))
+            lease.player.setSource(url)
+
+            def _video_error(*_):
+                link = QLabel(f"Видео: {content.get('path', '')}")
+                link.setStyleSheet("color:#2563eb; text-decoration:underline; font-size:16px;")
+                link.setCursor(Qt.PointingHandCursor)
+                link.mousePressEvent = lambda e: QDesktopServices.openUrl(url)  # type: ignore[assignment]
+                slot.layout().addWidget(link)
+
+            try:
+                lease.connect(lease.player.errorOccurred, _video_error)
+            except Exception:
+                pass
+
+            video_widget.setMinimumHeight(RESERVED_HEIGHT["video"])
+            slot.hold(video_widget, VIDEO_COST, lease=lease)
+            video_widget.show()
+
+    def _show_pdf(self, slot: BlockSlot, loading: QLabel, local: Optional[str]) -> None:
+        if slot.widget is not loading:
+            return
+        slot.ticket = None
+        slot.release()
+        content = slot.content
         try:
-            for player, audio, video_widget in self._media_refs:
+            from PySide6.QtPdfWidgets import QPdfView
+            from PySide6.QtPdf import QPdfDocument
+
+            if local:
+                view = QPdfView()
+                # owned by the slot: QPdfView crashes when its document dies as its child
+                document = QPdfDocument(slot)
+                document.load(local)
+                view.setDocument(document)
                 try:
-                    player.stop()
+                    view.setZoomMode(QPdfView.ZoomMode.FitToWidth)
                 except Exception:
                     pass
-            self._media_refs.clear()
+                view.setMinimumHeight(RESERVED_HEIGHT["pdf"])
+                slot.hold(view, PDF_COST, document=document)
+            else:
+                placeholder = QLabel(f"Не удалось загрузить PDF:\n{content.get('path', '')}")
+                placeholder.setAlignment(Qt.AlignCenter)
+                placeholder.setMinimumHeight(180)
+                placeholder.setStyleSheet(
+                    "border:1px dashed rgba(0,0,0,0.25); border-radius:10px;"
+                    "font-size:14px; color:#666;"
+                )
+                slot.hold(placeholder)
+        except Exception as exc:
+            slot.hold(QLabel(f"PDF просмотрщик недоступен: {exc}"))
+
+    def _revoke(self, slot: BlockSlot) -> None:
+        """Give a slot's player back to the pool; the slot is rebuilt when seen again."""
+        slot.release()
+        self._visibility_timer.start()
+
+    def showEvent(self, event):  # type: ignore[override]
+        super().showEvent(event)
+        self._visibility_timer.start()
+
+    def hideEvent(self, event):  # type: ignore[override]
+        super().hideEvent(event)
+        for slot in self._slots:
+            slot.set_playing(False)
+
+    def resizeEvent(self, event):  # type: ignore[override]
+        super().resizeEvent(event)
+        self._visibility_timer.start()
+        if self._slots and self._image_target_width() != self._image_width:
+            self._rescale_timer.start()
+
+    def _image_target_width(self) -> int:
+        width = self.scroll.viewport().width()
+        return width if width >= 200 else 1100
+
+    def _request_image(self, slot: BlockSlot) -> None:
+        path = slot.content.get("path", "")
+        slot.ticket = self.media.request_pixmap(
+            path,
+            lambda pix, slot=slot, img=slot.widget: self._show_image(slot, img, pix, path),
+            width=self._image_width,
+            device_pixel_ratio=self.devicePixelRatioF(),
+            priority=PRIORITY_VISIBLE,
+        )
+
+    def _rescale_images(self) -> None:
+        self._image_width = self._image_target_width()
+        for slot in self._slots:
+            if slot.kind == "image" and slot.live:
+                if slot.ticket is not None:
+                    slot.ticket.cancel()
+                self._request_image(slot)
+
+    def _show_image(self, slot: BlockSlot, img: QLabel, pix, path: str) -> None:
+        if slot.widget is not img:
+            return
+        slot.ticket = None
+        slot.setMinimumHeight(0)
+        if not pix.isNull():
+            img.setPixmap(pix)
+            slot.cost = pix.width() * pix.height() * 4
+            return
+        slot.cost = 0
+        img.setText(f"Не удалось загрузить изображение:\n{path}")
+        img.setAlignment(Qt.AlignCenter)
+        img.setMinimumHeight(180)
+        img.setStyleSheet(
+            "border:1px dashed rgba(0,0,0,0.25); border-radius:10px;"
+            "font-size:14px; color:#666;"
+        )
+
+
+class BlockSlot(QWidget):
+    """Placeholder for one heavy page block that holds its widget only while needed.
+
+    An empty slot reserves the block's height, so the page keeps its scroll
+    extent while images, PDF views and video players come and go.
+    """
+
+    def __init__(self, kind: str, content: dict) -> None:
+        super().__init__()
+        self.kind = kind
+        self.content = content
+        self.widget: Optional[QWidget] = None
+        self.lease: Optional[PlayerLease] = None
+        self.document = None
+        self.ticket = None
+        self.cost = 0
+        self._playing = False
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.setSpacing(0)
+        self.setMinimumHeight(RESERVED_HEIGHT[kind])
+
+    @property
+    def live(self) -> bool:
+        return self.widget is not None
+
+    def hold(
+        self, widget: QWidget, cost: int = 0, *, lease: Optional[PlayerLease] = None, document=None
+    ) -> None:
+        """Show *widget* in the slot; *cost* is its estimated memory in bytes."""
+        self.widget = widget
+        self.cost = cost
+        self.lease = lease
+        self.document = document
+        self._playing = False
+        if self.kind != "image":
+            self.setMinimumHeight(0)
+        self.layout().addWidget(widget)
+
+    def set_playing(self, playing: bool) -> None:
+        if self.lease is None or playing == self._playing:
+            return
+        self._playing = playing
+        try:
+            if playing:
+                self.lease.player.play()
+            else:
+                self.lease.player.pause()
         except Exception:
             pass
-        clear(self.body)
-
-        for block in blocks:
-            kind = block.get("kind")
-            content = block.get("content", {})
-            if kind == "text":
-                label = QLabel(content.get("html", ""))
-                label.setTextFormat(Qt.RichText)
-                label.setWordWrap(True)
-                label.setStyleSheet("font-size:18px; line-height:1.55; background: transparent;")
-                self.body.addWidget(label)
-            elif kind == "image":
-                img = QLabel()
-                img.setStyleSheet("background: transparent;")
-                path = content.get("path", "")
-                pix = self.media.load_pixmap(path)
-                if not pix.isNull():
-                    img.setPixmap(pix.scaledToWidth(1100, Qt.SmoothTransformation))
-                else:
-                    img.setText(f"Не удалось загрузить изображение:\n{path}")
-                    img.setAlignment(Qt.AlignCenter)
-                    img.setMinimumHeight(180)
-                    img.setStyleSheet(
-                        "border:1px dashed rgba(0,0,0,0.25); border-radius:10px;"
-                        "font-size:14px; color:#666;"
-                    )
-                self.body.addWidget(img)
-            elif kind == "pdf":
-                try:
-                    from PySide6.QtPdfWidgets import QPdfView
-                    from PySide6.QtPdf import QPdfDocument
-
-                    view = QPdfView()
-                    document = QPdfDocument(view)
-                    local_pdf = self.media.ensure_pdf(content.get("path", ""))
-                    if local_pdf:
-                        document.load(local_pdf)
-                        view.setDocument(document)
-                        try:
-                            view.setZoomMode(QPdfView.ZoomMode.FitToWidth)
-                        except Exception:
-                            pass
-                        view.setMinimumHeight(620)
-                        self.body.addWidget(view)
-                    else:
-                        placeholder = QLabel(f"Не удалось загрузить PDF:\n{content.get('path', '')}")
-                        placeholder.setAlignment(Qt.AlignCenter)
-                        placeholder.setMinimumHeight(180)
-                        placeholder.setStyleSheet(
-                            "border:1px dashed rgba(0,0,0,0.25); border-radius:10px;"
-                            "font-size:14px; color:#666;"
-                        )
-                        self.body.addWidget(placeholder)
-                except Exception as exc:
-                    self.body.addWidget(QLabel(f"PDF просмотрщик недоступен: {exc}"))
-            elif kind == "video":
-                try:
-                    from PySide6.QtMultimedia import QMediaPlayer, QAudioOutput
-                    from PySide6.QtMultimediaWidgets import QVideoWidget
-
-                    video_widget = QVideoWidget()
-                    player = QMediaPlayer()
-                    audio = QAudioOutput()
-                    try:
-                        video_widget.setAttribute(Qt.WA_StyledBackground, True)
-                        video_widget.setStyleSheet(f"background:{self.theme['bg']};")
-                        video_widget.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
-                    except Exception:
-                        pass
-                    try:
-                        audio.setVolume(0.5)
-                    except Exception:
-                        pass
-                    url = self.media.video_url(content.get("path", ""))
-                    player.setVideoOutput(video_widget)
-                    player.setAudioOutput(audio)
-                    player.setSource(url)
-
-                    def _video_error(*_):
-                        link = QLabel(f"Видео: {content.get('path', '')}")
-                        link.setStyleSheet("color:#2563eb; text-decoration:underline; font-size:16px;")
-                        link.setCursor(Qt.PointingHandCursor)
-                        link.mousePressEvent = lambda e: QDesktopServices.openUrl(url)  # type: ignore[assignment]
-                        self.body.addWidget(link)
-
-                    try:
-                        if hasattr(player, "errorOccurred"):
-                            player.errorOccurred.connect(_video_error)
-                        elif hasattr(player, "errorChanged"):
-                            player.errorChanged.connect(_video_error)
-                    except Exception:
-                        pass
-
-                    player.play()
-                    video_widget.setMinimumHeight(460)
-                    self.body.addWidget(video_widget)
-                    try:
-                        self._media_refs.append((player, audio, video_widget))
-                    except Exception:
-                        self._media_refs = [(player, audio, video_widget)]
-                except Exception as exc:
-                    self.body.addWidget(QLabel(f"Видео недоступно: {exc}"))
+
+    def reset(self, content: dict) -> None:
+        """Point the slot at new *content*; it is materialized again when seen."""
+        self.release()
+        self.content = content
+        self.setMinimumHeight(RESERVED_HEIGHT[self.kind])
+
+    def release(self) -> None:
+        """Drop the heavy widget and keep its height reserved."""
+        if self.widget is None:
+            return
+        if self.ticket is not None:
+            self.ticket.cancel()
+            self.ticket = None
+        self.setMinimumHeight(max(self.height(), self.minimumHeight()))
+        layout = self.layout()
+        if self.lease is not None:
+            layout.removeWidget(self.lease.widget)
+            self.lease.release()
+        while layout.count():
+            item = layout.takeAt(0)
+            widget = item.widget() if item else None
+            if widget is not None:
+                widget.hide()
+                widget.deleteLater()
+        if self.document is not None:
+            self.document.deleteLater()
+        self.widget = None
+        self.lease = None
+        self.document = None
+        self.cost = 0
+        self._playing = False
@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+from typing import List, Optional, Tuple
+
+from PySide6.QtWidgets import QStackedWidget
+
+from .page import PageView
+
+# built pages kept alive behind the current one
+PAGE_CACHE_SIZE = 4
+# estimated image/PDF/video memory the hidden pages may hold together
+PAGE_CACHE_BUDGET_BYTES = 192 * 1024 * 1024
+
+
+class PageCache:
+    """Recently shown :class:`PageView` instances kept in the stack, keyed by slug.
+
+    Each entry remembers the content revision it was rendered from, so a
+    revisit of an unchanged page is a plain ``setCurrentWidget``. The order of
+    the entries is the navigation history: the least recently shown page is
+    evicted first when there are more than ``max_pages`` pages or their heavy
+    blocks exceed ``budget_bytes``. Hidden pages keep their media paused.
+    """
+
+    def __init__(
+        self,
+        stack: QStackedWidget,
+        max_pages: int = PAGE_CACHE_SIZE,
+        budget_bytes: int = PAGE_CACHE_BUDGET_BYTES,
+    ) -> None:
+        self.stack = stack
+        self.max_pages = max_pages
+        self.budget_bytes = budget_bytes
+        self._entries: "OrderedDict[str, Tuple[str, PageView]]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, slug: str, revision: Optional[str] = None) -> Optional[PageView]:
+        """Return the page built for *slug*, ``None`` if missing or of another *revision*."""
+        entry = self._entries.get(slug)
+        if entry is None:
+            return None
+        if revision is not None and entry[0] != revision:
+            self.invalidate(slug)
+            return None
+        self._entries.move_to_end(slug)
+        return entry[1]
+
+    def revision(self, slug: str) -> Optional[str]:
+        entry = self._entries.get(slug)
+        return entry[0] if entry else None
+
+    def put(self, slug: str, revision: str, view: PageView) -> None:
+        """Add *view* to the stack as the most recent page for *slug*."""
+        old = self._entries.pop(slug, None)
+        if old is not None and old[1] is not view:
+            self._discard(old[1])
+        self._entries[slug] = (revision, view)
+        if self.stack.indexOf(view) < 0:
+            self.stack.addWidget(view)
+
+    def recycle(self, keep: Optional[PageView] = None) -> Optional[PageView]:
+        """Take the least recently shown page out of a full cache, emptied for reuse.
+
+        Building a PageView and rendering its chrome for the first time costs
+        more than re-rendering an existing one, so a full cache hands over its
+        oldest page instead of letting it be evicted. Never returns *keep*.
+        """
+        if len(self._entries) < self.max_pages:
+            return None
+        for slug, (_revision, view) in self._entries.items():
+            if view is not keep:
+                del self._entries[slug]
+                view.render_blocks([])
+                return view
+        return None
+
+    def invalidate(self, slug: str) -> None:
+        entry = self._entries.pop(slug, None)
+        if entry is not None:
+            self._discard(entry[1])
+
+    def trim(self, keep: Optional[PageView] = None) -> None:
+        """Evict the least recently shown pages over the count or memory budget, never *keep*."""
+        for slug in list(self._entries):
+            if not self._over_budget():
+                break
+            view = self._entries[slug][1]
+            if view is not keep:
+                self.invalidate(slug)
+
+    def views(self) -> List[PageView]:
+        return [view for _revision, view in self._entries.values()]
+
+    def clear(self) -> None:
+        for slug in list(self._entries):
+            self.invalidate(slug)
+
+    def _over_budget(self) -> bool:
+        if len(self._entries) > self.max_pages:
+            return True
+        return sum(view.heavy_cost for view in self.views()) > self.budget_bytes
+
+    def _discard(self, view: PageView) -> None:
+        # hands its video players back to the pool before the widget goes
+        view.render_blocks([])
+        self.stack.removeWidget(view)
+        view.deleteLater()
@@ -0,0 +1,170 @@
+from __future__ import annotations
+
+from typing import Callable, List, Optional, Tuple
+
+from PySide6.QtCore import QUrl
+
+PlayerSet = Tuple[object, object, object]  # (QMediaPlayer, QAudioOutput, QVideoWidget)
+
+
+def _create_player_set() -> PlayerSet:
+    from PySide6.QtMultimedia import QAudioOutput, QMediaPlayer
+    from PySide6.QtMultimediaWidgets import QVideoWidget
+
+    player = QMediaPlayer()
+    audio = QAudioOutput()
+    widget = QVideoWidget()
+    player.setAudioOutput(audio)
+    player.setVideoOutput(widget)
+    return player, audio, widget
+
+
+def _alive(obj: object) -> bool:
+    try:
+        obj.objectName()  # type: ignore[attr-defined]
+    except RuntimeError:
+        return False
+    return True
+
+
+def _visible(widget: object) -> bool:
+    try:
+        return bool(widget.isVisible())  # type: ignore[attr-defined]
+    except Exception:
+        return False
+
+
+class PlayerLease:
+    """A player/output/widget set lent out by :class:`PlayerPool`.
+
+    Signal handlers connected through :meth:`connect` are disconnected when
+    the lease is returned, so the next borrower starts from a clean player.
+    """
+
+    def __init__(self, pool: "PlayerPool", players: PlayerSet, on_revoke: Optional[Callable[[], None]]) -> None:
+        self.pool = pool
+        self.player, self.audio, self.widget = players
+        self.on_revoke = on_revoke
+        self._connections: List[Tuple[object, Callable]] = []
+
+    def connect(self, signal, handler: Callable) -> None:
+        signal.connect(handler)
+        self._connections.append((signal, handler))
+
+    def release(self) -> None:
+        self.pool.release(self)
+
+    def _disconnect(self) -> None:
+        for signal, handler in self._connections:
+            try:
+                signal.disconnect(handler)
+            except Exception:
+                pass
+        self._connections.clear()
+
+
+class PlayerPool:
+    """Bounded pool of media players shared by page videos and the screensaver.
+
+    Building a QMediaPlayer pipeline is expensive and its native resources are
+    only freed when the objects are destroyed, so the kiosk keeps at most
+    ``max_size`` sets alive and rebinds them to new sources instead.
+    """
+
+    def __init__(self, max_size: int = 3, factory: Callable[[], PlayerSet] = _create_player_set) -> None:
+        self.max_size = max_size
+        self._factory = factory
+        self._idle: List[PlayerSet] = []
+        self._leases: List[PlayerLease] = []
+
+    @property
+    def size(self) -> int:
+        return len(self._idle) + len(self._leases)
+
+    def acquire(
+        self,
+        on_revoke: Optional[Callable[[], None]] = None,
+        *,
+        steal: bool = False,
+        steal_visible: bool = True,
+    ) -> Optional[PlayerLease]:
+        """Lend out a player set, or ``None`` when every set is in use.
+
+        With *steal* the oldest lease that has an *on_revoke* callback is
+        taken back first, preferring one whose widget is hidden; without
+        *steal_visible* only hidden ones are taken. The callback must stop
+        using the lease. Raises if QtMultimedia is unavailable.
+        """
+        self._prune()
+        if not self._idle and self.size >= self.max_size and steal:
+            victim = self._victim(steal_visible)
+            if victim is not None:
+                self._revoke(victim)
+        if self._idle:
+            players = self._idle.pop()
+        elif self.size < self.max_size:
+            players = self._factory()
+        else:
+            return None
+        lease = PlayerLease(self, players, on_revoke)
+        self._leases.append(lease)
+        return lease
+
+    def release(self, lease: PlayerLease) -> None:
+        """Stop *lease*'s player, unbind it from its source and widget parent, and keep it."""
+        if lease not in self._leases:
+            return
+        self._leases.remove(lease)
+        lease._disconnect()
+        players = (lease.player, lease.audio, lease.widget)
+        if not all(_alive(obj) for obj in players):
+            self._discard(players)
+            return
+        try:
+            lease.player.stop()
+            lease.player.setSource(QUrl())
+            lease.player.setLoops(1)
+            lease.widget.hide()
+            lease.widget.setParent(None)
+            lease.widget.setMinimumSize(0, 0)
+            lease.widget.setStyleSheet("")
+        except Exception:
+            self._discard(players)
+            return
+        self._idle.append(players)
+
+    def clear(self) -> None:
+        """Destroy every idle player set."""
+        while self._idle:
+            self._discard(self._idle.pop())
+
+    def _prune(self) -> None:
+        # a borrower's widget may have been destroyed with its parent page
+        for players in [players for players in self._idle if not all(_alive(obj) for obj in players)]:
+            self._idle.remove(players)
+            self._discard(players)
+        for lease in [lease for lease in self._leases if not _alive(lease.widget)]:
+            self._leases.remove(lease)
+            lease._disconnect()
+            self._discard((lease.player, lease.audio, lease.widget))
+
+    def _victim(self, visible: bool) -> Optional[PlayerLease]:
+        candidates = [lease for lease in self._leases if lease.on_revoke is not None]
+        hidden = [lease for lease in candidates if not _visible(lease.widget)]
+        if hidden:
+            return hidden[0]
+        return candidates[0] if candidates and visible else None
+
+    def _revoke(self, lease: PlayerLease) -> None:
+        try:
+            lease.on_revoke()  # type: ignore[misc]
+        except Exception:
+            pass
+        self.release(lease)
+
+    def _discard(self, players: PlayerSet) -> None:
+        for obj in players:
+            try:
+                obj.deleteLater()  # type: ignore[attr-defined]
+            except Exception:
+                pass
@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+from typing import Callable, Dict, Generic, Hashable, Iterable, List, NamedTuple, Tuple, TypeVar
+
+W = TypeVar("W")
+
+
+class Patch(NamedTuple):
+    """What one :meth:`Reconciler.reconcile` call did to the rendered widgets."""
+
+    created: int
+    updated: int
+    removed: int
+    moved: bool
+
+
+class Reconciler(Generic[W]):
+    """Keep one widget per keyed data item in step with a new list of items.
+
+    Items are matched to the widgets rendered for them by ``key(item)``
+    (typically the backend ``id``). Unchanged items keep their widget as is,
+    changed ones are patched in place with ``update(widget, item)``, and only
+    new or vanished keys are passed to ``create`` and ``remove``. Placing
+    :meth:`widgets` in a layout is left to the caller, which only needs to
+    do it when the patch reports new widgets or kept ones that moved.
+    Repeated keys are told apart by their occurrence, so identical items
+    each get a widget.
+    """
+
+    def __init__(
+        self,
+        key: Callable[[dict], Hashable],
+        create: Callable[[dict], W],
+        update: Callable[[W, dict], None],
+        remove: Callable[[W], None],
+    ) -> None:
+        self._key = key
+        self._create = create
+        self._update = update
+        self._remove = remove
+        self._widgets: Dict[Hashable, W] = {}
+        self._items: Dict[Hashable, dict] = {}
+        self.order: List[Hashable] = []
+
+    def __len__(self) -> int:
+        return len(self.order)
+
+    def reconcile(self, items: Iterable[dict]) -> Patch:
+        order: List[Hashable] = []
+        fresh: Dict[Hashable, dict] = {}
+        seen: Dict[Hashable, int] = {}
+        for item in items:
+            key = self._key(item)
+            count = seen.get(key, 0)
+            seen[key] = count + 1
+            if count:
+                key = (key, count)
+            order.append(key)
+            fresh[key] = item
+
+        removed = [key for key in self._widgets if key not in fresh]
+        for key in removed:
+            del self._items[key]
+            self._remove(self._widgets.pop(key))
+        created = updated = 0
+        for key in order:
+            item = fresh[key]
+            widget = self._widgets.get(key)
+            if widget is None:
+                self._widgets[key] = self._create(item)
+                created += 1
+            elif item != self._items[key]:
+                self._update(widget, item)
+                updated += 1
+            self._items[key] = item
+        previous = set(self.order)
+        moved = [key for key in self.order if key in fresh] != [key for key in order if key in previous]
+        self.order = order
+        return Patch(created, updated, len(removed), moved)
+
+    def widget(self, key: Hashable) -> W:
+        return self._widgets[key]
+
+    def widgets(self) -> List[W]:
+        """The widgets in item order."""
+        return [self._widgets[key] for key in self.order]
+
+    def entries(self) -> List[Tuple[W, dict]]:
+        """``(widget, item)`` pairs in item order."""
+        return [(self._widgets[key], self._items[key]) for key in self.order]
+
+    def clear(self) -> None:
+        self.reconcile([])
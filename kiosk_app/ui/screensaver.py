@@ -1,17 +1,45 @@
 from __future__ import annotations
 
 import os
-from typing import Callable, Optional
+from collections import OrderedDict
+from typing import Callable, List, Optional, Sequence, Tuple
 
-from PySide6.QtCore import QEvent, Qt, QUrl
-from PySide6.QtGui import QMovie
-from PySide6.QtWidgets import QLabel, QVBoxLayout, QWidget
+from PySide6.QtCore import QEvent, Qt, QTimer
+from PySide6.QtGui import QMovie, QPixmap
+from PySide6.QtWidgets import QLabel, QStackedLayout, QVBoxLayout, QWidget
 
-from ..backend.media import MediaClient
+from ..backend.decode import PRIORITY_SCREENSAVER, PRIORITY_VISIBLE
+from ..backend.media import VIDEO_LIMIT_BYTES, MediaClient
+from .players import PlayerLease, PlayerPool
+
+# images and GIFs without their own duration stay up this long in a playlist
+DEFAULT_SLIDE_SECONDS = 10
+# decoded playlist images kept at screen size, so a rotation is a pixmap swap
+PREDECODED_IMAGES = 6
+
+
+class _Slide:
+    """One playlist item built into a widget of the layer's stack."""
+
+    def __init__(self, path: str, duration: int, widget: QWidget) -> None:
+        self.path = path
+        self.duration = duration
+        self.widget = widget
+        self.movie: Optional[QMovie] = None
+        self.lease: Optional[PlayerLease] = None
+        self.ticket = None
+        self.ok = False
+        self.ready = False
+        self.video = False
 
 
 class ScreensaverLayer(QWidget):
-    """Fullscreen overlay that plays idle media while the kiosk is inactive."""
+    """Fullscreen overlay that plays idle media while the kiosk is inactive.
+
+    The playlist is shown one item at a time. While an item plays, the next
+    one is built and pre-rolled hidden underneath it, so advancing is a flip
+    of the stacked layout and never shows an empty frame.
+    """
 
     _VIDEO_EXTS = {".mp4", ".webm", ".avi", ".mov", ".mkv"}
     _IMAGE_EXTS = {".png", ".jpg", ".jpeg", ".webp"}
@@ -23,9 +51,12 @@ class ScreensaverLayer(QWidget):
         *,
         on_exit: Optional[Callable[[], None]] = None,
         parent: Optional[QWidget] = None,
+        players: Optional[PlayerPool] = None,
     ) -> None:
         super().__init__(parent)
         self.media = media
+        # two sets: the playing video and the next one pre-rolled behind it
+        self.players = players if players is not None else PlayerPool(max_size=2)
         self._on_exit = on_exit
 
         self.setAttribute(Qt.WA_StyledBackground, True)
@@ -35,189 +66,351 @@ class ScreensaverLayer(QWidget):
         self.setVisible(False)
         self.setFocusPolicy(Qt.NoFocus)
 
-        layout = QVBoxLayout(self)
-        layout.setContentsMargins(0, 0, 0, 0)
-        layout.setSpacing(0)
-        layout.setAlignment(Qt.AlignCenter)
+        self._stack = QStackedLayout(self)
+        self._stack.setContentsMargins(0, 0, 0, 0)
+
+        self._playlist: List[Tuple[str, int]] = []
+        self._index = 0
+        self._current: Optional[_Slide] = None
+        self._next: Optional[_Slide] = None
+        self._advance_when_ready = False
+        self._pixmaps: "OrderedDict[Tuple[str, int, int], QPixmap]" = OrderedDict()
 
-        self._message = QLabel("Нет медиа", self)
-        self._message.setAlignment(Qt.AlignCenter)
-        self._message.setStyleSheet("color:#ffffff; font-size:32px; padding:16px;")
-        layout.addWidget(self._message, 0, Qt.AlignCenter)
-
-        self._image = QLabel(self)
-        self._image.setAlignment(Qt.AlignCenter)
-        self._image.setStyleSheet("background:transparent;")
-        layout.addWidget(self._image, 0, Qt.AlignCenter)
-        self._image.hide()
-
-        self._movie_label = QLabel(self)
-        self._movie_label.setAlignment(Qt.AlignCenter)
-        layout.addWidget(self._movie_label, 0, Qt.AlignCenter)
-        self._movie_label.hide()
-
-        self._video_container = QWidget(self)
-        self._video_layout = QVBoxLayout(self._video_container)
-        self._video_layout.setContentsMargins(0, 0, 0, 0)
-        self._video_layout.setAlignment(Qt.AlignCenter)
-        layout.addWidget(self._video_container, 0, Qt.AlignCenter)
-        self._video_container.hide()
-
-        self._movie: Optional[QMovie] = None
-        self._player = None
-        self._audio = None
-        self._video_widget = None
+        self._advance_timer = QTimer(self)
+        self._advance_timer.setSingleShot(True)
+        self._advance_timer.timeout.connect(self._advance)
 
     def set_exit_callback(self, callback: Callable[[], None] | None) -> None:
         self._on_exit = callback
 
     # ---------------------- Public API ----------------------
+    def set_playlist(self, items: Sequence[Tuple[str, int]]) -> None:
+        """Replace the ``(path, seconds)`` playlist and download every item in the background."""
+        playlist = [(path, max(0, int(duration or 0))) for path, duration in items if path]
+        if playlist == self._playlist:
+            return
+        showing = self.isVisible() and self._current is not None
+        self._dispose_all()
+        self._playlist = playlist
+        self._index = 0
+        paths = {path for path, _ in playlist}
+        for key in [key for key in self._pixmaps if key[0] not in paths]:
+            del self._pixmaps[key]
+        for path in paths:
+            self.preload(path)
+        if showing:
+            self.show_media()
+
+    def preload(self, path: Optional[str]) -> None:
+        """Download *path* in the background as soon as the config names it."""
+        if not path:
+            return
+        download = self.media.prefetch(path, priority=PRIORITY_SCREENSAVER, limit_bytes=VIDEO_LIMIT_BYTES)
+        if download is not None:
+            url = self.media.resolve(path)
+            download.add_done_callback(lambda local: self._verify(path, url, local))
+
+    def prepare(self, path: Optional[str] = None, *, steal: bool = False) -> bool:
+        """Build the current item while hidden and pre-roll it to its first frame.
+
+        Showing a prepared item is then a visibility flip. A video only takes a
+        player from a page video with *steal*, i.e. when it is shown for real.
+        A *path* replaces the playlist with that single item.
+        """
+        if path:
+            self.set_playlist([(path, 0)])
+        slide = self._current
+        if slide is not None and (slide.ok or not steal or not slide.video):
+            return slide.ok
+        if slide is not None:
+            # a video that found no free player while hidden retries with steal
+            self._dispose(slide)
+        if not self._playlist:
+            self._current = self._build_message("Нет медиа")
+        else:
+            self._current = self._build(self._index, steal=steal)
+        self._stack.setCurrentWidget(self._current.widget)
+        return self._current.ok
+
+    @property
+    def prepared(self) -> bool:
+        return self._current is not None
+
+    def unprepare(self) -> None:
+        """Drop an item pre-rolled while hidden, giving its player back to the pool."""
+        if self.isVisible():
+            return
+        self._dispose_all()
+        self._index = 0
+
     def hide_media(self) -> None:
-        self._cleanup()
+        self._dispose_all()
+        self._index = 0
         self.hide()
 
-    def show_media(self, path: Optional[str]) -> bool:
-        self._cleanup()
-        if not path:
-            self._message.setText("Нет медиа")
-            self._message.show()
-            self.show()
-            self.raise_()
-            return False
+    def show_media(self, path: Optional[str] = None) -> bool:
+        success = self.prepare(path, steal=True)
+        self.show()
+        self.raise_()
+        slide = self._current
+        if slide is not None:
+            self._start(slide)
+            self._arm(slide)
+        self._prepare_next()
+        return success
+
+    # ---------------------- Playlist ----------------------
+    def _arm(self, slide: _Slide) -> None:
+        """Schedule the move past *slide*; a single item just keeps playing."""
+        self._advance_timer.stop()
+        if len(self._playlist) < 2:
+            return
+        seconds = slide.duration
+        if not seconds and slide.video and slide.lease is not None:
+            lease = slide.lease
+            statuses = type(lease.player).MediaStatus
+            if lease.player.mediaStatus() != statuses.InvalidMedia:
+                lease.connect(lease.player.mediaStatusChanged, lambda status: self._on_media_status(slide, status))
+                # a broken video never reaches its end: move on instead of showing black
+                lease.connect(lease.player.errorOccurred, lambda *_: self._on_media_status(slide, statuses.InvalidMedia))
+                return
+        self._advance_timer.start((seconds or DEFAULT_SLIDE_SECONDS) * 1000)
+
+    def _on_media_status(self, slide: _Slide, status) -> None:
+        if slide is not self._current or slide.lease is None:
+            return
+        statuses = type(slide.lease.player).MediaStatus
+        if status in (statuses.EndOfMedia, statuses.InvalidMedia):
+            self._advance()
+
+    def _prepare_next(self) -> None:
+        if len(self._playlist) < 2 or self._next is not None:
+            return
+        self._next = self._build((self._index + 1) % len(self._playlist), steal=False)
+
+    def _advance(self) -> None:
+        if not self.isVisible() or len(self._playlist) < 2:
+            return
+        self._prepare_next()
+        slide = self._next
+        if slide is None:
+            return
+        if slide.video and slide.lease is None:
+            self._dispose(slide)
+            slide = self._build((self._index + 1) % len(self._playlist), steal=True)
+            self._next = slide
+        if not slide.ready:
+            # the next image is still decoding: keep the current one up until it lands
+            self._advance_when_ready = True
+            return
+        self._advance_when_ready = False
+        previous = self._current
+        self._next = None
+        self._index = (self._index + 1) % len(self._playlist)
+        self._current = slide
+        self._start(slide)
+        self._stack.setCurrentWidget(slide.widget)
+        if previous is not None:
+            self._dispose(previous)
+        self._arm(slide)
+        self._prepare_next()
 
+    def _start(self, slide: _Slide) -> None:
+        if slide.movie is not None:
+            slide.movie.start()
+        if slide.lease is not None:
+            slide.lease.player.play()
+
+    # ---------------------- Internals ----------------------
+    def _verify(self, path: str, url: str, local: Optional[str]) -> None:
+        # download worker thread: a corrupt copy is dropped and fetched once more
+        if local and not self.media.cache.verify(url):
+            self.media.prefetch(path, priority=PRIORITY_SCREENSAVER, limit_bytes=VIDEO_LIMIT_BYTES)
+
+    def _build(self, index: int, *, steal: bool) -> _Slide:
+        path, duration = self._playlist[index]
         ext = os.path.splitext(path.split("?")[0])[-1].lower()
-        success = False
         if ext in self._IMAGE_EXTS:
-            success = self._show_image(path)
+            slide = self._build_image(path, duration)
         elif ext in self._GIF_EXTS:
-            success = self._show_gif(path)
+            slide = self._build_gif(path, duration)
         elif ext in self._VIDEO_EXTS:
-            success = self._show_video(path)
+            slide = self._build_video(path, duration, steal=steal)
         else:
             name = os.path.basename(path.split("?")[0]) or path
-            self._message.setText(f"Файл: {name}")
-            self._message.show()
+            slide = self._build_message(f"Файл: {name}", path, duration)
+        return slide
 
-        self.show()
-        self.raise_()
-        return success
+    def _label(self) -> QLabel:
+        label = QLabel(self)
+        label.setAlignment(Qt.AlignCenter)
+        self._stack.addWidget(label)
+        return label
 
-    # ---------------------- Internals ----------------------
-    def _cleanup(self) -> None:
-        if self._movie:
-            try:
-                self._movie.stop()
-            except Exception:
-                pass
-            try:
-                self._movie.deleteLater()
-            except Exception:
-                pass
-        self._movie = None
-        if self._player:
-            try:
-                self._player.stop()
-            except Exception:
-                pass
-            try:
-                self._player.deleteLater()
-            except Exception:
-                pass
-        self._player = None
-        if self._audio:
-            try:
-                self._audio.deleteLater()
-            except Exception:
-                pass
-        self._audio = None
-        if self._video_widget:
-            try:
-                self._video_widget.deleteLater()
-            except Exception:
-                pass
-        self._video_widget = None
-        while self._video_layout.count():
-            item = self._video_layout.takeAt(0)
-            widget = item.widget() if item else None
-            if widget is not None:
-                widget.setParent(None)
-        self._video_container.hide()
-        self._movie_label.hide()
-        self._image.hide()
-        self._image.clear()
-        self._message.hide()
-        self._message.setText("Нет медиа")
-
-    def _show_image(self, path: str) -> bool:
-        pixmap = self.media.load_pixmap(path)
+    def _build_message(self, text: str, path: str = "", duration: int = 0) -> _Slide:
+        label = self._label()
+        label.setText(text)
+        label.setStyleSheet("color:#ffffff; font-size:32px; padding:16px;")
+        slide = _Slide(path, duration, label)
+        slide.ready = True
+        return slide
+
+    def _fail(self, slide: _Slide, text: str) -> None:
+        slide.ok = False
+        slide.ready = True
+        slide.widget.setText(text)  # type: ignore[attr-defined]
+        slide.widget.setStyleSheet("color:#ffffff; font-size:32px; padding:16px;")
+
+    def _build_image(self, path: str, duration: int) -> _Slide:
+        label = self._label()
+        label.setStyleSheet("background:transparent;")
+        slide = _Slide(path, duration, label)
+        slide.ok = True
+        width = max(320, int(self.width() * 0.9) or 800)
+        height = max(240, int(self.height() * 0.9) or 600)
+        key = (path, width, height)
+        pixmap = self._pixmaps.get(key)
+        if pixmap is not None:
+            self._pixmaps.move_to_end(key)
+            label.setPixmap(pixmap)
+            slide.ready = True
+            return slide
+        slide.ticket = self.media.request_pixmap(
+            path,
+            lambda pixmap: self._set_image(slide, key, pixmap),
+            width,
+            height,
+            device_pixel_ratio=self.devicePixelRatioF(),
+            priority=PRIORITY_VISIBLE,
+        )
+        return slide
+
+    def _set_image(self, slide: _Slide, key: Tuple[str, int, int], pixmap) -> None:
+        slide.ticket = None
         if pixmap and not pixmap.isNull():
-            width = max(320, int(self.width() * 0.9) or 800)
-            height = max(240, int(self.height() * 0.9) or 600)
-            scaled = pixmap.scaled(width, height, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-            self._image.setPixmap(scaled)
-            self._image.show()
-            return True
-        self._message.setText("Не удалось загрузить изображение")
-        self._message.show()
-        return False
-
-    def _show_gif(self, path: str) -> bool:
-        local_path = self.media.ensure_media(path, limit_bytes=50 * 1024 * 1024)
-        if not local_path:
-            self._message.setText("Не удалось загрузить GIF")
-            self._message.show()
-            return False
-        movie = QMovie(local_path)
-        if not movie.isValid():
-            self._message.setText("Не удалось загрузить GIF")
-            self._message.show()
-            return False
-        self._movie = movie
-        self._movie_label.setMovie(movie)
-        self._movie_label.show()
-        movie.start()
-        return True
-
-    def _show_video(self, path: str) -> bool:
+            self._pixmaps[key] = pixmap
+            self._pixmaps.move_to_end(key)
+            while len(self._pixmaps) > PREDECODED_IMAGES:
+                self._pixmaps.popitem(last=False)
+            slide.widget.setPixmap(pixmap)  # type: ignore[attr-defined]
+            slide.ready = True
+        else:
+            self._fail(slide, "Не удалось загрузить изображение")
+        if slide is self._next and self._advance_when_ready:
+            self._advance()
+
+    def _build_gif(self, path: str, duration: int) -> _Slide:
+        label = self._label()
+        slide = _Slide(path, duration, label)
+        slide.ok = True
+        local_path = self.media.cached_file(path)
+        if local_path:
+            self._set_gif(slide, local_path)
+        else:
+            # the layer stays on the previous item (or black) until the file arrives
+            slide.ticket = self.media.request_file(
+                path,
+                lambda local: self._set_gif(slide, local),
+                priority=PRIORITY_VISIBLE,
+                limit_bytes=50 * 1024 * 1024,
+            )
+        return slide
+
+    def _set_gif(self, slide: _Slide, local_path: Optional[str]) -> None:
+        slide.ticket = None
+        movie = QMovie(local_path) if local_path else None
+        if movie is None or not movie.isValid():
+            self._fail(slide, "Не удалось загрузить GIF")
+        else:
+            slide.movie = movie
+            slide.widget.setMovie(movie)  # type: ignore[attr-defined]
+            movie.jumpToFrame(0)
+            slide.ready = True
+            if slide is self._current and self.isVisible():
+                movie.start()
+        if slide is self._next and self._advance_when_ready:
+            self._advance()
+
+    def _build_video(self, path: str, duration: int, *, steal: bool) -> _Slide:
+        container = QWidget(self)
+        layout = QVBoxLayout(container)
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.setAlignment(Qt.AlignCenter)
+        self._stack.addWidget(container)
+        slide = _Slide(path, duration, container)
+        slide.video = True
+        slide.ready = True
         try:
-            from PySide6.QtMultimedia import QAudioOutput, QMediaPlayer
-            from PySide6.QtMultimediaWidgets import QVideoWidget
+            lease = self.players.acquire(steal=steal)
         except Exception:
-            self._message.setText("Модуль QtMultimedia недоступен")
-            self._message.show()
-            return False
+            self._video_message(slide, "Модуль QtMultimedia недоступен")
+            return slide
+        if lease is None:
+            self._video_message(slide, "Видео недоступно")
+            return slide
 
-        url = self.media.video_url(path)
-        video_widget = QVideoWidget(self)
+        url = self.media.video_url(path, priority=PRIORITY_SCREENSAVER)
+        video_widget = lease.widget
         video_widget.setAttribute(Qt.WA_StyledBackground, True)
         video_widget.setStyleSheet("background-color:#000;")
         video_widget.setMinimumSize(640, 360)
-        player = QMediaPlayer(self)
-        audio = QAudioOutput(self)
+        player = lease.player
         try:
-            audio.setVolume(0.0)
+            lease.audio.setVolume(0.0)
         except Exception:
             pass
-        player.setVideoOutput(video_widget)
-        player.setAudioOutput(audio)
         player.setSource(url)
-        try:
-            if hasattr(player, "setLoops"):
-                loops = getattr(player, "Loops", None)
-                if loops and hasattr(loops, "Infinite"):
-                    player.setLoops(loops.Infinite)
-                else:
-                    player.setLoops(-1)
-        except Exception:
-            pass
+        # in a playlist a video without its own duration plays once and hands over
+        if len(self._playlist) < 2 or duration:
+            try:
+                if hasattr(player, "setLoops"):
+                    loops = getattr(player, "Loops", None)
+                    if loops and hasattr(loops, "Infinite"):
+                        player.setLoops(loops.Infinite)
+                    else:
+                        player.setLoops(-1)
+            except Exception:
+                pass
+
+        slide.lease = lease
+        layout.addWidget(video_widget, 0, Qt.AlignCenter)
+        video_widget.show()
+        # decode up to the first frame now, so play() starts without a black gap
+        player.pause()
+        slide.ok = True
+        return slide
+
+    def _video_message(self, slide: _Slide, text: str) -> None:
+        label = QLabel(text, slide.widget)
+        label.setAlignment(Qt.AlignCenter)
+        label.setStyleSheet("color:#ffffff; font-size:32px; padding:16px;")
+        slide.widget.layout().addWidget(label, 0, Qt.AlignCenter)
+
+    def _dispose(self, slide: _Slide) -> None:
+        if slide.ticket is not None:
+            slide.ticket.cancel()
+        slide.ticket = None
+        if slide.movie is not None:
+            try:
+                slide.movie.stop()
+                slide.movie.deleteLater()
+            except Exception:
+                pass
+        slide.movie = None
+        if slide.lease is not None:
+            slide.widget.layout().removeWidget(slide.lease.widget)
+            slide.lease.release()
+        slide.lease = None
+        self._stack.removeWidget(slide.widget)
+        slide.widget.deleteLater()
 
-        self._video_widget = video_widget
-        self._player = player
-        self._audio = audio
-        self._video_layout.addWidget(video_widget, 0, Qt.AlignCenter)
-        self._video_container.show()
-        player.play()
-        return True
+    def _dispose_all(self) -> None:
+        self._advance_timer.stop()
+        self._advance_when_ready = False
+        for slide in (self._next, self._current):
+            if slide is not None:
+                self._dispose(slide)
+        self._current = self._next = None
 
     # ---------------------- Event handling ----------------------
     def mousePressEvent(self, event):  # type: ignore[override]
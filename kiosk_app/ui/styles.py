@@ -1,12 +1,44 @@
 from __future__ import annotations
 
-from PySide6.QtWidgets import QWidget
-from PySide6.QtGui import QColor
-from PySide6.QtWidgets import QGraphicsDropShadowEffect
+import contextlib
+import functools
+import re
+from collections import OrderedDict
+from typing import Dict, Tuple
+
+from PySide6.QtCore import QEvent, QObject, QRect, QRectF, Qt
+from PySide6.QtGui import QColor, QImage, QPainter, QPainterPath, QPixmap
+from PySide6.QtWidgets import (
+    QApplication,
+    QGraphicsBlurEffect,
+    QGraphicsPathItem,
+    QGraphicsScene,
+    QWidget,
+)
 
 from ..theme import darker
 
 
+# Button variants: (radius, vertical padding, horizontal padding, font size)
+BUTTON_VARIANTS: Dict[str, Tuple[int, int, int, int]] = {
+    "tile": (14, 10, 22, 20),
+    "drop": (10, 14, 16, 18),
+}
+
+_QSS_UNSAFE = re.compile(r'[\s"{};\\]')
+
+
+def qss_value(value: str) -> str:
+    """Normalise a colour so it can be used inside a quoted QSS selector."""
+    return _QSS_UNSAFE.sub("", str(value or "")).lower()
+
+
+@functools.lru_cache(maxsize=256)
+def button_shades(background: str) -> Tuple[str, str]:
+    """Return the (hover, pressed) shades of *background*."""
+    return darker(background, 0.92), darker(background, 0.85)
+
+
 def button_stylesheet(
     background: str,
     *,
@@ -16,9 +48,11 @@ def button_stylesheet(
     pad_h: int = 22,
     fs: int = 20,
 ) -> str:
-    """Return a styled QPushButton stylesheet with consistent hover/press states."""
-    hover = darker(background, 0.92)
-    pressed = darker(background, 0.85)
+    """Return a styled QPushButton stylesheet with consistent hover/press states.
+
+    For one-off buttons; tiles and popup items use :data:`STYLES` instead.
+    """
+    hover, pressed = button_shades(background)
     return f"""
         QPushButton {{
             background: {background};
@@ -40,18 +74,366 @@ def button_stylesheet(
     """
 
 
+class StyleRegistry:
+    """One application stylesheet for tiles, group popups and their labels.
+
+    Widgets only carry dynamic properties (``tileVariant``, ``bgColor``,
+    ``fgColor``) and the rules live in a single sheet on the
+    ``QApplication``, so Qt parses it once instead of once per widget. The
+    sheet is regenerated only when a colour is used for the first time.
+    """
+
+    def __init__(self) -> None:
+        self._backgrounds: Dict[str, None] = {}
+        self._foregrounds: Dict[str, None] = {}
+        self._batch = 0
+        self._dirty = False
+        self._installed = ""
+
+    def register(self, bg: str | None = None, fg: str | None = None) -> bool:
+        """Add rules for *bg*/*fg*; return True if the stylesheet changed."""
+        changed = False
+        for value, known in ((bg, self._backgrounds), (fg, self._foregrounds)):
+            value = qss_value(value) if value else ""
+            if value and value not in known:
+                known[value] = None
+                changed = True
+        self._dirty = self._dirty or changed
+        return changed
+
+    def stylesheet(self) -> str:
+        rules = [
+            'QWidget[tileVariant="dropList"] { background: transparent; }',
+            'QLabel[tileVariant="label"] { font-size: 20px; font-weight: 700; background: transparent; }',
+        ]
+        for variant, (radius, pad_v, pad_h, fs) in BUTTON_VARIANTS.items():
+            rules.append(
+                f'QPushButton[tileVariant="{variant}"] {{ border: 0px; border-radius: {radius}px; '
+                f"padding: {pad_v}px {pad_h}px; font-size: {fs}px; font-weight: 700; text-align: center; }}"
+            )
+        for fg in self._foregrounds:
+            rules.append(f'*[fgColor="{fg}"] {{ color: {fg}; }}')
+        for bg in self._backgrounds:
+            hover, pressed = button_shades(bg)
+            selector = f'QPushButton[tileVariant][bgColor="{bg}"]'
+            rules.append(f"{selector} {{ background: {bg}; }}")
+            rules.append(f"{selector}:hover {{ background: {hover}; }}")
+            rules.append(f"{selector}:pressed {{ background: {pressed}; }}")
+        rules.append(
+            "QPushButton[tileVariant][bgColor]:disabled "
+            "{ background: rgba(0,0,0,0.05); color: rgba(0,0,0,0.4); }"
+        )
+        rules.append("QPushButton[tileVariant]:focus { outline: none; }")
+        return "\n".join(rules)
+
+    def apply(self, widget: QWidget, variant: str, *, bg: str | None = None, fg: str | None = None) -> None:
+        """Tag *widget* as *variant* in the given colours and repolish it if needed."""
+        self.register(bg, fg)
+        changed = False
+        props = (("tileVariant", variant), ("bgColor", bg and qss_value(bg)), ("fgColor", fg and qss_value(fg)))
+        for name, value in props:
+            if value and widget.property(name) != value:
+                widget.setProperty(name, value)
+                changed = True
+        # A new application sheet repolishes every widget anyway.
+        pending = self._dirty if self._batch else self.install()
+        if changed and not pending and widget.testAttribute(Qt.WA_WState_Polished):
+            style = widget.style()
+            style.unpolish(widget)
+            style.polish(widget)
+            widget.update()
+
+    @contextlib.contextmanager
+    def batch(self):
+        """Defer installing the stylesheet until the outermost batch ends."""
+        self._batch += 1
+        try:
+            yield self
+        finally:
+            self._batch -= 1
+            if not self._batch:
+                self.install()
+
+    def install(self) -> bool:
+        """Put the sheet on the application; return True if it was replaced."""
+        if not self._dirty and self._installed:
+            return False
+        app = QApplication.instance()
+        if app is None:
+            return False
+        sheet = self.stylesheet()
+        self._dirty = False
+        if sheet == self._installed:
+            return False
+        self._installed = sheet
+        app.setStyleSheet(sheet)
+        return True
+
+
+STYLES = StyleRegistry()
+
+
+_RGBA_RE = re.compile(r"rgba?\(\s*([^)]*)\)", re.IGNORECASE)
+
+
+def css_color(value: str) -> Tuple[int, int, int, int]:
+    """Parse ``#rrggbb``/``#rgb``/``rgb()``/``rgba()`` into an RGBA tuple (alpha 0-255)."""
+    value = (value or "").strip()
+    match = _RGBA_RE.fullmatch(value)
+    if match:
+        parts = [part.strip() for part in match.group(1).split(",")]
+        try:
+            r, g, b = (max(0, min(255, int(float(part)))) for part in parts[:3])
+            alpha = float(parts[3]) if len(parts) > 3 else 1.0
+        except (ValueError, IndexError):
+            return 0, 0, 0, 255
+        if alpha <= 1.0:
+            alpha *= 255
+        return r, g, b, max(0, min(255, round(alpha)))
+    if value.startswith("#"):
+        digits = value[1:]
+        if len(digits) == 3:
+            digits = "".join(ch * 2 for ch in digits)
+        if len(digits) == 6:
+            try:
+                return int(digits[0:2], 16), int(digits[2:4], 16), int(digits[4:6], 16), 255
+            except ValueError:
+                pass
+    return 0, 0, 0, 255
+
+
+# (radius, blur, color, dpr) -> (nine-patch pixmap, corner size in logical px)
+_SHADOW_PATCHES: Dict[Tuple[int, int, str, float], Tuple[QPixmap, int]] = {}
+
+
+def shadow_patch(radius: int, blur: int, color: str, device_pixel_ratio: float = 1.0) -> Tuple[QPixmap, int]:
+    """Return the cached nine-patch for a rounded-rect shadow and its corner size.
+
+    The patch is the blurred silhouette a ``QGraphicsDropShadowEffect`` would
+    draw, rendered once; painting it afterwards is nine blits.
+    """
+    key = (radius, blur, color, round(device_pixel_ratio, 2))
+    cached = _SHADOW_PATCHES.get(key)
+    if cached is not None:
+        return cached
+    margin = blur
+    corner = radius + 2 * margin
+    side = 2 * corner + 2
+    body = QPainterPath()
+    body.addRoundedRect(QRectF(margin, margin, side - 2 * margin, side - 2 * margin), radius, radius)
+
+    scene = QGraphicsScene(0, 0, side, side)
+    item = QGraphicsPathItem(body)
+    item.setPen(Qt.NoPen)
+    item.setBrush(QColor(*css_color(color)))
+    effect = QGraphicsBlurEffect()
+    effect.setBlurRadius(blur)
+    effect.setBlurHints(QGraphicsBlurEffect.QualityHint)
+    item.setGraphicsEffect(effect)
+    scene.addItem(item)
+
+    size = round(side * device_pixel_ratio)
+    image = QImage(size, size, QImage.Format_ARGB32_Premultiplied)
+    image.fill(Qt.transparent)
+    painter = QPainter(image)
+    painter.setRenderHint(QPainter.Antialiasing, True)
+    scene.render(painter, QRectF(0, 0, image.width(), image.height()), QRectF(0, 0, side, side))
+    painter.end()
+
+    pixmap = QPixmap.fromImage(image)
+    pixmap.setDevicePixelRatio(device_pixel_ratio)
+    _SHADOW_PATCHES[key] = (pixmap, corner)
+    return pixmap, corner
+
+
+# (width, height, radius, blur, color, dpr) -> composed shadow, padded by blur on every side
+_SHADOW_PIXMAPS: "OrderedDict[tuple, QPixmap]" = OrderedDict()
+_SHADOW_PIXMAP_LIMIT = 64
+
+
+def shadow_pixmap(
+    width: int, height: int, *, radius: int, blur: int, color: str, device_pixel_ratio: float = 1.0
+) -> QPixmap:
+    """Return the whole shadow for a ``width`` x ``height`` rounded rect.
+
+    It is stretched from the nine-patch once per size; tiles share a size, so
+    painting a shadow is usually a single unscaled blit.
+    """
+    key = (width, height, radius, blur, color, round(device_pixel_ratio, 2))
+    cached = _SHADOW_PIXMAPS.get(key)
+    if cached is not None:
+        _SHADOW_PIXMAPS.move_to_end(key)
+        return cached
+    patch, corner = shadow_patch(radius, blur, color, device_pixel_ratio)
+    out_w, out_h = width + 2 * blur, height + 2 * blur
+    pixmap = QPixmap(max(1, round(out_w * device_pixel_ratio)), max(1, round(out_h * device_pixel_ratio)))
+    pixmap.setDevicePixelRatio(device_pixel_ratio)
+    pixmap.fill(Qt.transparent)
+
+    dpr = patch.devicePixelRatio()
+    side = patch.width() / dpr
+    src = (0, corner, side - corner, side)
+    fit = max(0, min(corner, out_w // 2, out_h // 2))
+    dst_x = (0, fit, out_w - fit, out_w)
+    dst_y = (0, fit, out_h - fit, out_h)
+    painter = QPainter(pixmap)
+    painter.setRenderHint(QPainter.SmoothPixmapTransform, True)
+    for row in range(3):
+        for col in range(3):
+            dst = QRectF(dst_x[col], dst_y[row], dst_x[col + 1] - dst_x[col], dst_y[row + 1] - dst_y[row])
+            if dst.isEmpty():
+                continue
+            source = QRectF(
+                src[col] * dpr,
+                src[row] * dpr,
+                (src[col + 1] - src[col]) * dpr,
+                (src[row + 1] - src[row]) * dpr,
+            )
+            painter.drawPixmap(dst, patch, source)
+    painter.end()
+
+    _SHADOW_PIXMAPS[key] = pixmap
+    while len(_SHADOW_PIXMAPS) > _SHADOW_PIXMAP_LIMIT:
+        _SHADOW_PIXMAPS.popitem(last=False)
+    return pixmap
+
+
+def paint_shadow(
+    painter: QPainter,
+    rect: QRect,
+    *,
+    radius: int = 14,
+    blur: int = 22,
+    x: int = 0,
+    y: int = 8,
+    color: str = "rgba(0,0,0,0.12)",
+) -> None:
+    """Paint the shadow of the rounded rect *rect* from the cache."""
+    pixmap = shadow_pixmap(
+        rect.width(),
+        rect.height(),
+        radius=radius,
+        blur=blur,
+        color=color,
+        device_pixel_ratio=painter.device().devicePixelRatioF(),
+    )
+    painter.drawPixmap(rect.left() + x - blur, rect.top() + y - blur, pixmap)
+
+
+class _ShadowLayer(QWidget):
+    """Child stacked below its siblings that paints their shadows.
+
+    All shadows are composed into one pixmap when the parent lays out its
+    children, so a repaint under a hovered or pressed tile is a single
+    clipped blit.
+    """
+
+    def __init__(self, parent: QWidget) -> None:
+        super().__init__(parent)
+        self._targets: Dict[int, Tuple[QWidget, dict]] = {}
+        self._canvas: QPixmap | None = None
+        self.setAttribute(Qt.WA_TransparentForMouseEvents, True)
+        self.setAttribute(Qt.WA_NoSystemBackground, True)
+        self.setFocusPolicy(Qt.NoFocus)
+        parent.installEventFilter(self)
+        self.setGeometry(parent.rect())
+        self.lower()
+        self.show()
+
+    @classmethod
+    def of(cls, parent: QWidget) -> "_ShadowLayer":
+        layer = parent.findChild(cls, None, Qt.FindDirectChildrenOnly)
+        return layer if layer is not None else cls(parent)
+
+    def add(self, target: QWidget, spec: dict) -> None:
+        if id(target) not in self._targets:
+            target.destroyed.connect(lambda *_args, key=id(target): self._forget(key))
+        self._targets[id(target)] = (target, spec)
+        self.invalidate()
+
+    def _forget(self, key: int) -> None:
+        if self._targets.pop(key, None) is None:
+            return
+        try:
+            self.invalidate()
+        except RuntimeError:
+            # Deleting the parent may destroy the layer before its targets.
+            pass
+
+    def invalidate(self) -> None:
+        self._canvas = None
+        self.update()
+
+    def _render(self) -> QPixmap:
+        dpr = self.devicePixelRatioF()
+        canvas = QPixmap(max(1, round(self.width() * dpr)), max(1, round(self.height() * dpr)))
+        canvas.setDevicePixelRatio(dpr)
+        canvas.fill(Qt.transparent)
+        parent = self.parentWidget()
+        painter = QPainter(canvas)
+        for target, spec in self._targets.values():
+            if target.parentWidget() is not parent or not target.isVisibleTo(parent):
+                continue
+            paint_shadow(painter, target.geometry(), **spec)
+        painter.end()
+        return canvas
+
+    def eventFilter(self, obj: QObject, event: QEvent) -> bool:  # type: ignore[override]
+        # Children of a laid-out parent only move when it is resized or
+        # processes a layout request, so those two events cover tile moves,
+        # resizes, shows and hides.
+        kind = event.type()
+        if kind == QEvent.Resize:
+            self.setGeometry(self.parentWidget().rect())
+            self.invalidate()
+        elif kind == QEvent.LayoutRequest:
+            self.invalidate()
+        return False
+
+    def paintEvent(self, event) -> None:  # type: ignore[override]
+        if self._canvas is None:
+            self._canvas = self._render()
+        painter = QPainter(self)
+        painter.drawPixmap(0, 0, self._canvas)
+        painter.end()
+
+
+class _ShadowTracker(QObject):
+    """Hands a shadowed widget to its parent's layer once it gets a parent."""
+
+    def eventFilter(self, obj: QObject, event: QEvent) -> bool:  # type: ignore[override]
+        if event.type() == QEvent.ParentChange and obj.parentWidget() is not None:
+            obj.removeEventFilter(self)
+            _ShadowLayer.of(obj.parentWidget()).add(obj, obj._shadow_spec)
+        return False
+
+
+_TRACKER: _ShadowTracker | None = None
+
+
 def add_shadow(
     widget: QWidget,
     *,
+    radius: int = 14,
     blur: int = 22,
     x: int = 0,
     y: int = 8,
     color: str = "rgba(0,0,0,0.12)",
 ) -> None:
-    """Attach a drop shadow effect to *widget* with consistent defaults."""
-    effect = QGraphicsDropShadowEffect()
-    effect.setBlurRadius(blur)
-    effect.setXOffset(x)
-    effect.setYOffset(y)
-    effect.setColor(QColor(color))
-    widget.setGraphicsEffect(effect)
+    """Give *widget* a rounded drop shadow painted from a cache.
+
+    The shadow is drawn by a layer in the parent widget, so unlike
+    ``QGraphicsDropShadowEffect`` repainting the widget (hover, press, text
+    changes) does not render it offscreen and blur it again. The widget is
+    expected to be placed by its parent's layout; a widget created without a
+    parent gets its shadow when it is first added to one.
+    """
+    global _TRACKER
+    widget._shadow_spec = {"radius": radius, "blur": blur, "x": x, "y": y, "color": color}
+    parent = widget.parentWidget()
+    if parent is not None:
+        _ShadowLayer.of(parent).add(widget, widget._shadow_spec)
+        return
+    if _TRACKER is None:
+        _TRACKER = _ShadowTracker()
+    widget.installEventFilter(_TRACKER)
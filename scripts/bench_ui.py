@@ -0,0 +1,1009 @@
+"""Offscreen micro-benchmarks for the kiosk UI.
+
+Usage::
+
+    python scripts/bench_ui.py            # run every scenario
+    python scripts/bench_ui.py decode     # run selected scenarios
+
+The numbers are meant for before/after comparisons on the same machine.
+"""
+
+from __future__ import annotations
+
+import argparse
+import functools
+import http.server
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from typing import Callable, Dict, List
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from PySide6.QtCore import QElapsedTimer, QEvent, Qt, QTimer  # noqa: E402
+from PySide6.QtGui import QColor, QImage, QLinearGradient, QPainter  # noqa: E402
+from PySide6.QtWidgets import QApplication, QWidget  # noqa: E402
+
+SCENARIOS: Dict[str, Callable[[], None]] = {}
+
+
+def scenario(func: Callable[[], None]) -> Callable[[], None]:
+    SCENARIOS[func.__name__.replace("bench_", "")] = func
+    return func
+
+
+class FrameProbe:
+    """Heartbeat timer that records the gaps between GUI event-loop turns."""
+
+    def __init__(self, interval_ms: int = 16) -> None:
+        self.gaps: List[float] = []
+        self._clock = QElapsedTimer()
+        self._timer = QTimer()
+        self._timer.setInterval(interval_ms)
+        self._timer.timeout.connect(self._tick)
+
+    def start(self) -> None:
+        self.gaps.clear()
+        self._clock.start()
+        self._timer.start()
+
+    def stop(self) -> None:
+        self._timer.stop()
+
+    def _tick(self) -> None:
+        self.gaps.append(self._clock.restart())
+
+    def report(self) -> str:
+        if not self.gaps:
+            return "no frames"
+        ordered = sorted(self.gaps)
+        p95 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]
+        return f"frames={len(ordered)} max={ordered[-1]:.0f}ms p95={p95:.0f}ms"
+
+
+def run_loop(app: QApplication, until: Callable[[], bool], timeout_s: float = 30.0) -> None:
+    deadline = time.perf_counter() + timeout_s
+    while not until() and time.perf_counter() < deadline:
+        app.processEvents()
+        # deleteLater() is only honoured by a running event loop otherwise
+        app.sendPostedEvents(None, QEvent.DeferredDelete)
+        time.sleep(0.001)
+
+
+def make_photo(path: str, width: int = 6000, height: int = 4000) -> str:
+    if os.path.exists(path):
+        return path
+    image = QImage(width, height, QImage.Format_RGB32)
+    painter = QPainter(image)
+    gradient = QLinearGradient(0, 0, width, height)
+    gradient.setColorAt(0.0, QColor("#2563eb"))
+    gradient.setColorAt(1.0, QColor("#f97316"))
+    painter.fillRect(image.rect(), gradient)
+    painter.end()
+    image.save(path, "JPEG", 90)
+    return path
+
+
+def photo_set(count: int = 4) -> List[str]:
+    folder = os.path.join(tempfile.gettempdir(), "kiosk_bench")
+    os.makedirs(folder, exist_ok=True)
+    return [make_photo(os.path.join(folder, f"photo_{idx}.jpg")) for idx in range(count)]
+
+
+class _SlowHandler(http.server.SimpleHTTPRequestHandler):
+    """Static file handler that trickles bodies out at ``rate`` bytes/s."""
+
+    rate = 40 * 1024 * 1024
+
+    def log_message(self, *args) -> None:
+        pass
+
+    def copyfile(self, source, outputfile) -> None:
+        chunk = 256 * 1024
+        while True:
+            data = source.read(chunk)
+            if not data:
+                return
+            outputfile.write(data)
+            time.sleep(len(data) / self.rate)
+
+
+def serve_folder(folder: str) -> http.server.ThreadingHTTPServer:
+    handler = functools.partial(_SlowHandler, directory=folder)
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    server.url = f"http://127.0.0.1:{server.server_address[1]}"  # type: ignore[attr-defined]
+    return server
+
+
+@scenario
+def bench_decode() -> None:
+    """GUI stalls while four 24 MP photos are loaded for a 1100 px page."""
+    from PySide6.QtGui import QPixmap
+
+    from kiosk_app.backend.decode import decode_image
+    from kiosk_app.backend.media import MediaClient, PixmapCache
+
+    app = QApplication.instance()
+    photos = photo_set()
+
+    media = MediaClient("http://127.0.0.1:9", pixmaps=PixmapCache())
+    probe = FrameProbe()
+    probe.start()
+    started = time.perf_counter()
+    for path in photos:
+        QPixmap.fromImage(decode_image(media.local_image(path), 1100))
+        app.processEvents()
+    elapsed = time.perf_counter() - started
+    probe.stop()
+    print(f"  GUI-thread decode : {elapsed * 1000:.0f}ms total, {probe.report()}")
+
+    media = MediaClient("http://127.0.0.1:9", pixmaps=PixmapCache())
+    done: List[object] = []
+    probe.start()
+    started = time.perf_counter()
+    for path in photos:
+        media.request_pixmap(path, done.append, width=1100)
+    run_loop(app, lambda: len(done) == len(photos))
+    elapsed = time.perf_counter() - started
+    probe.stop()
+    print(f"  decode service    : {elapsed * 1000:.0f}ms total, {probe.report()}")
+
+
+@scenario
+def bench_video_start() -> None:
+    """Time until a 64 MB uncached video can be handed to QMediaPlayer (40 MB/s link)."""
+    from kiosk_app.backend.cache import DiskCache
+    from PySide6.QtCore import QUrl
+
+    from kiosk_app.backend.media import MediaClient
+
+    folder = tempfile.mkdtemp(prefix="kiosk_bench_video_")
+    os.makedirs(os.path.join(folder, "media"))
+    with open(os.path.join(folder, "media", "promo.mp4"), "wb") as handle:
+        handle.write(os.urandom(64 * 1024 * 1024))
+    server = serve_folder(folder)
+    try:
+        started = time.perf_counter()
+        QUrl.fromLocalFile(DiskCache(os.path.join(folder, "sync")).fetch(f"{server.url}/media/promo.mp4"))
+        print(f"  blocking download : {(time.perf_counter() - started) * 1000:.0f}ms to source")
+
+        media = MediaClient(server.url, cache=DiskCache(os.path.join(folder, "stream")))
+        started = time.perf_counter()
+        first = media.video_url("/media/promo.mp4")
+        elapsed = time.perf_counter() - started
+        download = media.downloads.submit(media.resolve("/media/promo.mp4"))
+        download.result()
+        cached = media.video_url("/media/promo.mp4")
+        print(
+            f"  streaming + tee   : {elapsed * 1000:.1f}ms to source ({first.scheme()}), "
+            f"cached after {(time.perf_counter() - started) * 1000:.0f}ms, next play {cached.scheme()}"
+        )
+    finally:
+        server.shutdown()
+        server.server_close()
+        shutil.rmtree(folder, ignore_errors=True)
+
+
+def make_menu(count: int) -> List[dict]:
+    """Return *count* top-level nodes, every fifth one a group of four buttons."""
+    nodes: List[dict] = []
+    for idx in range(count):
+        if idx % 5 == 4:
+            items = [
+                {"id": idx * 10 + sub, "title": f"Пункт {sub}", "target_slug": f"p{idx}-{sub}", "order_index": sub}
+                for sub in range(4)
+            ]
+            nodes.append({"kind": "group", "id": idx, "title": f"Группа {idx}", "order_index": idx, "items": items})
+        else:
+            nodes.append(
+                {"kind": "button", "id": idx, "title": f"Кнопка {idx}", "target_slug": f"p{idx}", "order_index": idx}
+            )
+    return nodes
+
+
+@scenario
+def bench_home_grid() -> None:
+    """HomePage build, rebuild, resize and column-change cost for 10-500 menu items."""
+    from kiosk_app.theme import THEME_DEFAULT
+    from kiosk_app.ui.home import HomePage
+
+    app = QApplication.instance()
+
+    def timed(action: Callable[[], None]) -> float:
+        started = time.perf_counter()
+        action()
+        app.processEvents()
+        return (time.perf_counter() - started) * 1000
+
+    for count in (10, 50, 200, 500):
+        menu = make_menu(count)
+        page = HomePage(THEME_DEFAULT.copy(), lambda slug: None)
+        page.resize(1400, 900)
+        page.show()
+        app.processEvents()
+        build = timed(lambda: page.build(menu))
+        rebuild = timed(lambda: page.build([dict(node) for node in menu]))
+        resize = sum(timed(lambda w=w: page.resize(w, 900)) for w in (1402, 1404, 1406, 1408, 1410)) / 5
+        columns = timed(lambda: page.resize(700, 900))
+        print(
+            f"  {count:>3} items: build {build:7.1f}ms  rebuild {rebuild:7.1f}ms  "
+            f"resize {resize:6.1f}ms  column change {columns:7.1f}ms"
+        )
+        page.close()
+        page.deleteLater()
+        app.processEvents()
+
+
+@scenario
+def bench_virtual_grid() -> None:
+    """Widget-per-tile HomePage vs delegate-painted VirtualHomePage: build, paint, widgets."""
+    from kiosk_app.theme import THEME_DEFAULT
+    from kiosk_app.ui.home import HomePage
+    from kiosk_app.ui.home_grid import VirtualHomePage
+
+    app = QApplication.instance()
+
+    def timed(action: Callable[[], None]) -> float:
+        started = time.perf_counter()
+        action()
+        app.processEvents()
+        return (time.perf_counter() - started) * 1000
+
+    for count in (100, 500, 2000):
+        menu = make_menu(count)
+        for label, factory in (("widgets", HomePage), ("virtual", VirtualHomePage)):
+            page = factory(THEME_DEFAULT.copy(), lambda slug: None)
+            page.resize(1400, 900)
+            page.show()
+            app.processEvents()
+            build = timed(lambda: page.build(menu))
+            paint = timed(lambda: page.grab())
+            widgets = len(page.findChildren(QWidget))
+            line = f"  {count:>4} items {label:<7}: build {build:7.1f}ms  paint {paint:7.1f}ms  widgets {widgets:>5}"
+            if isinstance(page, VirtualHomePage):
+                bar = page.view.verticalScrollBar()
+                scroll = sum(
+                    timed(lambda v=v: (bar.setValue(v), page.view.viewport().repaint())) for v in range(40, 440, 40)
+                ) / 10
+                line += f"  scroll step {scroll:5.2f}ms"
+            print(line)
+            page.close()
+            page.deleteLater()
+            app.processEvents()
+
+
+@scenario
+def bench_shadow_paint() -> None:
+    """Paint cost of 40 home tiles with QGraphicsDropShadowEffect vs the cached shadow layer."""
+    from PySide6.QtWidgets import QGraphicsDropShadowEffect
+
+    from kiosk_app.theme import THEME_DEFAULT
+    from kiosk_app.ui import home
+    from kiosk_app.ui.styles import add_shadow, css_color
+
+    app = QApplication.instance()
+
+    def effect_shadow(widget, *, radius=14, blur=22, x=0, y=8, color="rgba(0,0,0,0.12)") -> None:
+        # parented: PySide6 does not keep an unowned effect alive after setGraphicsEffect
+        effect = QGraphicsDropShadowEffect(widget)
+        effect.setBlurRadius(blur)
+        effect.setOffset(x, y)
+        effect.setColor(QColor(*css_color(color)))
+        widget.setGraphicsEffect(effect)
+
+    def timed(action: Callable[[], None], repeat: int) -> float:
+        started = time.perf_counter()
+        for _ in range(repeat):
+            action()
+        app.processEvents()
+        return (time.perf_counter() - started) * 1000 / repeat
+
+    for label, shadow in (("effect", effect_shadow), ("cached", add_shadow)):
+        home.add_shadow = shadow
+        page = home.HomePage(THEME_DEFAULT.copy(), lambda slug: None)
+        page.resize(1400, 900)
+        page.build(make_menu(40))
+        page.show()
+        app.processEvents()
+        tiles = page._tiles.widgets()
+        full = timed(lambda: page.repaint(), 20)
+        hover = timed(lambda: [tile.repaint() for tile in tiles], 10) / len(tiles)
+        press = timed(lambda: [(tile.setDown(True), tile.repaint(), tile.setDown(False)) for tile in tiles], 10)
+        print(
+            f"  {label:<6}: full page repaint {full:6.2f}ms  single tile repaint {hover:5.3f}ms  "
+            f"press {press / len(tiles):5.3f}ms"
+        )
+        page.close()
+        page.deleteLater()
+        app.processEvents()
+    home.add_shadow = add_shadow
+
+
+@scenario
+def bench_tile_styles() -> None:
+    """HomePage build and theme restyle cost for 200/1000 tiles in six colours."""
+    from kiosk_app.theme import THEME_DEFAULT
+    from kiosk_app.ui.home import HomePage
+
+    app = QApplication.instance()
+    palette = ("#2563eb", "#16a34a", "#dc2626", "#9333ea", "#ea580c", "#0891b2")
+
+    def timed(action: Callable[[], None]) -> float:
+        started = time.perf_counter()
+        action()
+        app.processEvents()
+        return (time.perf_counter() - started) * 1000
+
+    for count in (200, 1000):
+        menu = make_menu(count)
+        for idx, node in enumerate(menu):
+            node["bg_color"] = palette[idx % len(palette)] if idx % 3 else None
+        page = HomePage(THEME_DEFAULT.copy(), lambda slug: None)
+        page.resize(1400, 900)
+        page.show()
+        app.processEvents()
+        build = timed(lambda: page.build(menu))
+        restyle = timed(lambda: page.apply_theme(dict(THEME_DEFAULT, primary="#0f766e")))
+        recolor = timed(lambda: page.build([dict(node, bg_color=palette[0]) for node in menu]))
+        print(f"  {count:>4} tiles: build {build:7.1f}ms  theme restyle {restyle:7.1f}ms  recolor all {recolor:7.1f}ms")
+        page.close()
+        page.deleteLater()
+        app.processEvents()
+
+
+def bench_backend(config: dict, menu: List[dict], pages: Dict[str, dict] | None = None):
+    """Return a BackendAPI serving *config*, *menu* and *pages* from memory."""
+    from kiosk_app.backend.api import BackendAPI
+
+    class _MemoryBackend(BackendAPI):
+        def fetch_config(self) -> dict:
+            return config
+
+        def fetch_menu(self) -> List[dict]:
+            return menu
+
+        def fetch_page(self, slug: str) -> dict:
+            return (pages or {}).get(slug) or {"blocks": [{"kind": "text", "content": {"html": f"<p>{slug}</p>"}}]}
+
+        def fetch_weather(self) -> None:
+            return None
+
+        def cached_config(self) -> dict:
+            return config
+
+        def cached_menu(self) -> List[dict]:
+            return menu
+
+        def iter_events(self):
+            while True:
+                time.sleep(3600)
+                yield {}
+
+    return _MemoryBackend("http://127.0.0.1:9")
+
+
+@scenario
+def bench_route_paint() -> None:
+    """Tap-to-paint latency of home <-> page navigation with a 24 MP home background."""
+    from kiosk_app.app import App
+
+    app = QApplication.instance()
+    config = {
+        "org_name": "Bench",
+        "footer_clock_format": "%H:%M",
+        "theme": {"primary": "#2563eb", "bg_image_path": photo_set(1)[0]},
+    }
+    window = App(bench_backend(config, make_menu(40)))
+    window.resize(1280, 800)
+    window.show()
+    run_loop(app, lambda: False, 0.5)
+
+    def tap(slug: str) -> float:
+        started = time.perf_counter()
+        window.route(slug)
+        window.repaint()
+        app.processEvents()
+        return (time.perf_counter() - started) * 1000
+
+    to_page: List[float] = []
+    to_home: List[float] = []
+    for idx in range(10):
+        to_page.append(tap(f"p{idx}"))
+        to_home.append(tap("home"))
+    print(
+        f"  home -> page: median {sorted(to_page)[5]:6.1f}ms max {max(to_page):6.1f}ms   "
+        f"page -> home: median {sorted(to_home)[5]:6.1f}ms max {max(to_home):6.1f}ms"
+    )
+    window.close()
+    window.deleteLater()
+    app.processEvents()
+
+
+@scenario
+def bench_back_navigation() -> None:
+    """Flip between three 12-block pages and home 10 times: rebuild every visit vs back-stack cache."""
+    from kiosk_app.app import App
+
+    app = QApplication.instance()
+    photos = photo_set(4)
+    blocks = []
+    for idx in range(12):
+        if idx % 3 == 0:
+            blocks.append({"kind": "image", "content": {"path": photos[idx % len(photos)]}})
+        else:
+            blocks.append({"kind": "text", "content": {"html": f"<h2>Раздел {idx}</h2><p>{'Текст. ' * 80}</p>"}})
+    pages = {slug: {"blocks": blocks} for slug in ("a", "b", "c")}
+    config = {"org_name": "Bench", "footer_clock_format": "%H:%M", "theme": {}}
+    for label, max_pages in (("rebuild", 0), ("cached", 4)):
+        window = App(bench_backend(config, make_menu(40), pages))
+        window.pages.max_pages = max_pages
+        window.resize(1280, 800)
+        window.show()
+        run_loop(app, lambda: False, 0.3)
+        timings: List[float] = []
+        for _ in range(10):
+            for slug in ("a", "b", "c", "home"):
+                started = time.perf_counter()
+                window.route(slug)
+                window.repaint()
+                app.processEvents()
+                timings.append((time.perf_counter() - started) * 1000)
+        ordered = sorted(timings)
+        print(
+            f"  {label:<8}: tap-to-paint median {ordered[len(ordered) // 2]:5.1f}ms "
+            f"p95 {ordered[int(len(ordered) * 0.95)]:5.1f}ms, pages alive {len(window.pages)}"
+        )
+        window.close()
+        window.deleteLater()
+        app.processEvents()
+
+
+@scenario
+def bench_idle_ticks() -> None:
+    """Timer events and CPU over 10 s idle: per-widget 1 s clock timers vs the tick scheduler."""
+    from PySide6.QtCore import QEventLoop, QObject
+
+    from kiosk_app.backend.media import MediaClient, PixmapCache
+    from kiosk_app.scheduler import TickScheduler
+    from kiosk_app.theme import THEME_DEFAULT
+    from kiosk_app.ui.footer import Footer
+    from kiosk_app.ui.header import Header
+
+    app = QApplication.instance()
+
+    class _TimerCounter(QObject):
+        count = 0
+
+        def eventFilter(self, obj, event):  # type: ignore[override]
+            if event.type() == QEvent.Timer:
+                self.count += 1
+            return False
+
+    def legacy_tick(label) -> None:
+        from datetime import datetime
+
+        now = datetime.now()
+        months = ["января", "февраля", "марта", "апреля", "мая", "июня", "июля",
+                  "августа", "сентября", "октября", "ноября", "декабря"]
+        label.setText(f"{now.strftime('%H:%M')}  •  {now.day} {months[now.month - 1]}")
+
+    for label in ("legacy", "scheduler"):
+        host = QWidget()
+        counter = _TimerCounter()
+        ticks = TickScheduler(host)
+        media = MediaClient("http://127.0.0.1:9", pixmaps=PixmapCache())
+        header = Header(dict(THEME_DEFAULT), "Bench", media, ticks=ticks)
+        footer = Footer(dict(THEME_DEFAULT), ticks=ticks)
+        timers = []
+        if label == "legacy":
+            ticks.cancel("header-clock", "footer-clock")
+            for interval, target in ((1000, header.time_label), (1000, footer.clock), (5000, None)):
+                timer = QTimer(host)
+                timer.timeout.connect(lambda target=target: target is not None and legacy_tick(target))
+                timer.start(interval)
+                timers.append(timer)
+        else:
+            ticks.every("config-poll", 5000, lambda: None)
+        app.processEvents()
+        app.installEventFilter(counter)
+        loop = QEventLoop()
+        QTimer.singleShot(10000, loop.quit)
+        cpu = time.process_time()
+        loop.exec()
+        cpu = (time.process_time() - cpu) * 1000
+        app.removeEventFilter(counter)
+        extra = ""
+        if label == "scheduler":
+            runs = ", ".join(f"{name} {stat.runs}x {stat.total_ms:.2f}ms" for name, stat in ticks.stats().items())
+            extra = f", jobs: {runs}"
+        print(f"  {label:<9}: timer events {counter.count:3d}, process CPU {cpu:5.0f}ms{extra}")
+        for timer in timers:
+            timer.stop()
+        ticks.cancel(*ticks.jobs())
+        header.deleteLater()
+        footer.deleteLater()
+        host.deleteLater()
+        app.processEvents()
+
+
+@scenario
+def bench_idle_mode() -> None:
+    """10 s under a photo screensaver over the home grid (clock with seconds): idle mode off vs on."""
+    from PySide6.QtCore import QEventLoop, QObject
+
+    from kiosk_app.app import App
+
+    app = QApplication.instance()
+
+    class _EventCounter(QObject):
+        def __init__(self) -> None:
+            super().__init__()
+            self.counts = {QEvent.Paint: 0, QEvent.Timer: 0}
+
+        def eventFilter(self, obj, event):  # type: ignore[override]
+            if event.type() in self.counts:
+                self.counts[event.type()] += 1
+            return False
+
+    config = {
+        "org_name": "Bench",
+        "footer_clock_format": "%H:%M:%S",
+        "theme": {},
+        "screensaver": {"path": photo_set(1)[0], "timeout": 1},
+    }
+    for label, enabled in (("off", False), ("on", True)):
+        window = App(bench_backend(config, make_menu(40)))
+        window.idle.enabled = enabled
+        window.resize(1280, 800)
+        window.show()
+        run_loop(app, lambda: window._screensaver_layer.isVisible(), 10)
+        run_loop(app, lambda: False, 0.5)
+        counter = _EventCounter()
+        app.installEventFilter(counter)
+        loop = QEventLoop()
+        QTimer.singleShot(10000, loop.quit)
+        cpu = time.process_time()
+        loop.exec()
+        cpu = (time.process_time() - cpu) * 1000
+        app.removeEventFilter(counter)
+        started = time.perf_counter()
+        window._handle_user_activity()
+        window.repaint()
+        wake = (time.perf_counter() - started) * 1000
+        print(
+            f"  idle mode {label:<3}: paints {counter.counts[QEvent.Paint]:4d}, "
+            f"timer events {counter.counts[QEvent.Timer]:3d}, CPU {cpu:4.0f}ms, "
+            f"touch to full UI {wake:5.1f}ms"
+        )
+        window.close()
+        window.deleteLater()
+        run_loop(app, lambda: False, 0.2)
+
+
+@scenario
+def bench_input_filter() -> None:
+    """Python filter callbacks per second over 10 s of hovering and taps: app-wide filter vs InputMonitor."""
+    from PySide6.QtCore import QEventLoop, QObject, QPoint
+    from PySide6.QtTest import QTest
+
+    from kiosk_app.app import App
+
+    app = QApplication.instance()
+
+    class _LegacyFilter(QObject):
+        """The application-wide filter App used to install."""
+
+        def __init__(self, window) -> None:
+            super().__init__()
+            self.window = window
+            self.callbacks = 0
+
+        def eventFilter(self, obj, event):  # type: ignore[override]
+            self.callbacks += 1
+            if event.type() == QEvent.ContextMenu:
+                return True
+            if event.type() in (
+                QEvent.MouseButtonPress,
+                QEvent.KeyPress,
+                QEvent.TouchBegin,
+                QEvent.TouchUpdate,
+                QEvent.TouchEnd,
+            ):
+                self.window._handle_user_activity()
+            return False
+
+    config = {
+        "org_name": "Bench",
+        "footer_clock_format": "%H:%M:%S",
+        "theme": {},
+        "screensaver": {"path": photo_set(1)[0], "timeout": 60},
+    }
+    pages = {f"p{idx}": {"blocks": [{"kind": "text", "content": {"html": "<p>Текст</p>" * 40}}]} for idx in range(40)}
+    for label in ("app-wide", "monitor"):
+        window = App(bench_backend(config, make_menu(40), pages))
+        window.resize(1280, 800)
+        window.show()
+        run_loop(app, lambda: False, 0.5)
+        handle = window.windowHandle()
+        legacy = _LegacyFilter(window)
+        if label == "app-wide":
+            handle.removeEventFilter(window.input)
+            app.installEventFilter(legacy)
+        before = window.input.callbacks
+        taps = [0]
+        steps = [0]
+
+        def drive() -> None:
+            steps[0] += 1
+            QTest.mouseMove(handle, QPoint(200 + steps[0] % 600, 300 + steps[0] % 300))
+            if steps[0] % 10:
+                return
+            if window.stack.currentWidget() is window.home:
+                tile = window.home._tiles.widgets()[1]
+                center = tile.mapTo(window, tile.rect().center())
+                QTest.mouseClick(handle, Qt.LeftButton, Qt.NoModifier, center)
+            else:
+                window.route("home")
+            taps[0] += 1
+
+        driver = QTimer()
+        driver.timeout.connect(drive)
+        driver.start(20)
+        loop = QEventLoop()
+        QTimer.singleShot(10000, loop.quit)
+        cpu = time.process_time()
+        loop.exec()
+        cpu = (time.process_time() - cpu) * 1000
+        driver.stop()
+        app.removeEventFilter(legacy)
+        callbacks = legacy.callbacks if label == "app-wide" else window.input.callbacks - before
+        print(
+            f"  {label:<8}: {callbacks / 10:7.0f} filter callbacks/s over {taps[0]} taps, "
+            f"CPU {cpu:5.0f}ms, screensaver armed {window.ticks.schedule.has('screensaver-idle')}"
+        )
+        window.close()
+        window.deleteLater()
+        run_loop(app, lambda: False, 0.2)
+
+
+@scenario
+def bench_background() -> None:
+    """24 MP home background: QSS background-image vs BackgroundLayer (load stall, repaint)."""
+    from kiosk_app.backend.media import MediaClient, PixmapCache
+    from kiosk_app.ui.background import BackgroundLayer
+
+    app = QApplication.instance()
+    photo = photo_set(1)[0]
+
+    def repaint_ms(widget: QWidget) -> float:
+        samples = []
+        for _ in range(20):
+            started = time.perf_counter()
+            widget.repaint()
+            samples.append((time.perf_counter() - started) * 1000)
+        return sorted(samples)[10]
+
+    host = QWidget()
+    host.resize(1280, 800)
+    host.setAttribute(Qt.WA_StyledBackground, True)
+    host.show()
+    run_loop(app, lambda: False, 0.2)
+    started = time.perf_counter()
+    host.setStyleSheet(f"background-image: url({photo}); background-position: center;")
+    host.repaint()
+    first = (time.perf_counter() - started) * 1000
+    print(f"  QSS image       : first paint {first:6.0f}ms, repaint median {repaint_ms(host):6.2f}ms")
+    host.close()
+
+    host = QWidget()
+    host.resize(1280, 800)
+    layer = BackgroundLayer(host, MediaClient("http://127.0.0.1:9", pixmaps=PixmapCache()))
+    layer.show()
+    host.show()
+    run_loop(app, lambda: False, 0.2)
+    probe = FrameProbe()
+    probe.start()
+    started = time.perf_counter()
+    layer.set_image(photo)
+    blocked = (time.perf_counter() - started) * 1000
+    run_loop(app, lambda: layer._pixmap is not None)
+    ready = (time.perf_counter() - started) * 1000
+    probe.stop()
+    print(
+        f"  BackgroundLayer : GUI blocked {blocked:6.1f}ms, ready after {ready:4.0f}ms, "
+        f"repaint median {repaint_ms(layer):6.2f}ms, {probe.report()}"
+    )
+    host.resize(1920, 1080)
+    started = time.perf_counter()
+    run_loop(app, lambda: layer._pixmap.width() == round(1920 * layer.devicePixelRatioF()))
+    print(
+        f"  resize 1920x1080: rescaled after {(time.perf_counter() - started) * 1000:4.0f}ms, "
+        f"repaint median {repaint_ms(layer):6.2f}ms"
+    )
+    host.close()
+
+
+def make_pdf(path: str, pages: int = 20) -> str:
+    if os.path.exists(path):
+        return path
+    from PySide6.QtGui import QPageSize, QPdfWriter
+
+    writer = QPdfWriter(path)
+    writer.setPageSize(QPageSize(QPageSize.A4))
+    painter = QPainter(writer)
+    for idx in range(pages):
+        if idx:
+            writer.newPage()
+        painter.drawText(200, 400, f"Страница {idx + 1}")
+    painter.end()
+    return path
+
+
+@scenario
+def bench_page_blocks() -> None:
+    """Open a 40-block page (12 photos, 4 PDFs): time to first paint, heavy widgets alive."""
+    from PySide6.QtWidgets import QLabel, QScrollArea
+
+    from kiosk_app.backend.media import MediaClient, PixmapCache
+    from kiosk_app.theme import THEME_DEFAULT
+    from kiosk_app.ui.page import PageView
+
+    app = QApplication.instance()
+    photos = photo_set()
+    pdf = make_pdf(os.path.join(tempfile.gettempdir(), "kiosk_bench", "doc.pdf"))
+    blocks: List[dict] = []
+    for idx in range(40):
+        if idx % 10 == 9:
+            blocks.append({"kind": "pdf", "content": {"path": pdf}})
+        elif idx % 3 == 1:
+            blocks.append({"kind": "image", "content": {"path": photos[idx % len(photos)]}})
+        else:
+            blocks.append({"kind": "text", "content": {"html": f"<p>Абзац {idx} " + "текст " * 60 + "</p>"}})
+
+    page = PageView(dict(THEME_DEFAULT), lambda _slug: None, MediaClient("http://127.0.0.1:9", pixmaps=PixmapCache()))
+    page.resize(1280, 800)
+    page.show()
+    run_loop(app, lambda: False, 0.2)
+
+    def heavy() -> int:
+        from PySide6.QtPdfWidgets import QPdfView
+
+        images = [label for label in page.findChildren(QLabel) if label.pixmap() and not label.pixmap().isNull()]
+        return len(images) + len(page.findChildren(QPdfView))
+
+    started = time.perf_counter()
+    page.render_blocks(blocks)
+    page.repaint()
+    first = (time.perf_counter() - started) * 1000
+    run_loop(app, lambda: False, 3.0)
+    print(f"  open page   : first paint {first:6.0f}ms, heavy widgets after 3s {heavy()}")
+    scroll = page.findChild(QScrollArea).verticalScrollBar()
+    probe = FrameProbe()
+    probe.start()
+    while scroll.value() < scroll.maximum():
+        scroll.setValue(scroll.value() + 120)
+        run_loop(app, lambda: False, 0.016)
+    probe.stop()
+    print(f"  scroll down : {probe.report()}, heavy widgets at bottom {heavy()}")
+    page.close()
+    page.deleteLater()
+    app.processEvents()
+
+
+@scenario
+def bench_page_edit() -> None:
+    """Apply a one-paragraph edit to a 40-block page scrolled halfway: full rebuild vs reconcile."""
+    from PySide6.QtWidgets import QLabel
+
+    from kiosk_app.backend.media import MediaClient, PixmapCache
+    from kiosk_app.theme import THEME_DEFAULT
+    from kiosk_app.ui.page import PageView
+
+    app = QApplication.instance()
+    photos = photo_set()
+    blocks: List[dict] = []
+    for idx in range(40):
+        if idx % 3 == 1:
+            blocks.append({"id": idx, "kind": "image", "content": {"path": photos[idx % len(photos)]}})
+        else:
+            blocks.append({"id": idx, "kind": "text", "content": {"html": f"<p>Абзац {idx} " + "текст " * 60 + "</p>"}})
+    edited = [dict(block) for block in blocks]
+    edited[20] = {"id": 20, "kind": "text", "content": {"html": "<p>Исправленный абзац</p>"}}
+
+    for label in ("rebuild", "reconcile"):
+        page = PageView(dict(THEME_DEFAULT), lambda _slug: None, MediaClient("http://127.0.0.1:9", pixmaps=PixmapCache()))
+        page.resize(1280, 800)
+        page.show()
+        page.render_blocks(blocks)
+        run_loop(app, lambda: False, 1.0)
+        scroll = page.scroll.verticalScrollBar()
+        scroll.setValue(scroll.maximum() // 2)
+        run_loop(app, lambda: False, 1.0)
+        before = scroll.value()
+        labels = set(page.findChildren(QLabel))
+        started = time.perf_counter()
+        if label == "rebuild":
+            page.render_blocks([])
+        page.render_blocks(edited)
+        page.repaint()
+        elapsed = (time.perf_counter() - started) * 1000
+        app.processEvents()
+        created = len(set(page.findChildren(QLabel)) - labels)
+        print(
+            f"  {label:<9}: {elapsed:5.1f}ms, new labels {created:2d}, "
+            f"scroll {before} -> {scroll.value()}"
+        )
+        page.close()
+        page.deleteLater()
+        app.processEvents()
+
+
+@scenario
+def bench_screensaver_show() -> None:
+    """Idle timeout to first screensaver frame for a 24 MP photo: cold vs prepared."""
+    from kiosk_app.backend.media import MediaClient, PixmapCache
+    from kiosk_app.ui.screensaver import ScreensaverLayer
+
+    app = QApplication.instance()
+    photo = photo_set(1)[0]
+    host = QWidget()
+    host.resize(1280, 800)
+    host.show()
+    for label, warm in (("cold", False), ("prepared", True)):
+        saver = ScreensaverLayer(MediaClient("http://127.0.0.1:9", pixmaps=PixmapCache()), parent=host)
+        saver.setGeometry(host.rect())
+        if warm:
+            saver.prepare(photo)
+            run_loop(app, lambda: saver._current.ready)
+        started = time.perf_counter()
+        saver.show_media(photo)
+        saver.repaint()
+        shown = (time.perf_counter() - started) * 1000
+        run_loop(app, lambda: saver._current.ready)
+        saver.repaint()
+        framed = (time.perf_counter() - started) * 1000
+        print(f"  {label:<8}: visible after {shown:5.1f}ms, first frame after {framed:5.0f}ms")
+        saver.hide_media()
+        saver.deleteLater()
+    host.close()
+
+
+@scenario
+def bench_screensaver_playlist() -> None:
+    """Blank time per transition over 12 rotations of four 24 MP photos: path swap vs playlist."""
+    from kiosk_app.backend.media import MediaClient, PixmapCache
+    from kiosk_app.ui.screensaver import ScreensaverLayer
+
+    app = QApplication.instance()
+    photos = photo_set(4)
+    host = QWidget()
+    host.resize(1280, 800)
+    host.show()
+    for label in ("swap", "playlist"):
+        # a small memory tier, so the swap variant cannot lean on it
+        saver = ScreensaverLayer(MediaClient("http://127.0.0.1:9", pixmaps=PixmapCache(max_bytes=1)), parent=host)
+        saver.setGeometry(host.rect())
+        if label == "playlist":
+            saver.set_playlist([(photo, 5) for photo in photos])
+            saver.show_media()
+        blanks: List[float] = []
+        probe = FrameProbe()
+        probe.start()
+        for turn in range(12):
+            if label == "swap":
+                started = time.perf_counter()
+                saver.show_media(photos[turn % len(photos)])
+            else:
+                run_loop(app, lambda: saver._next is not None and saver._next.ready)
+                started = time.perf_counter()
+                saver._advance()
+            run_loop(app, lambda: saver._current.ready)
+            saver.repaint()
+            blanks.append((time.perf_counter() - started) * 1000)
+        probe.stop()
+        print(f"  {label:<8}: blank max {max(blanks):5.1f}ms avg {sum(blanks) / len(blanks):5.1f}ms, {probe.report()}")
+        saver.hide_media()
+        saver.deleteLater()
+    host.close()
+
+
+@scenario
+def bench_player_churn() -> None:
+    """RSS and open file handles over 200 video page visits and screensaver cycles."""
+    try:
+        import resource
+        from PySide6.QtMultimedia import QMediaPlayer  # noqa: F401
+    except ImportError as exc:
+        print(f"  skipped: {exc}")
+        return
+    from kiosk_app.backend.media import MediaClient, PixmapCache
+    from kiosk_app.theme import THEME_DEFAULT
+    from kiosk_app.ui.page import PageView
+    from kiosk_app.ui.players import PlayerPool
+    from kiosk_app.ui.screensaver import ScreensaverLayer
+
+    app = QApplication.instance()
+    media = MediaClient("http://127.0.0.1:9", pixmaps=PixmapCache())
+    players = PlayerPool()
+    page = PageView(dict(THEME_DEFAULT), lambda _slug: None, media, players)
+    page.resize(1280, 800)
+    page.show()
+    saver = ScreensaverLayer(media, parent=page, players=players)
+    video = os.path.join(tempfile.gettempdir(), "kiosk_bench", "missing.mp4")
+    blocks = [{"kind": "video", "content": {"path": video}}] * 2
+
+    def handles() -> int:
+        return len(os.listdir("/proc/self/fd")) if os.path.isdir("/proc/self/fd") else -1
+
+    for cycle in range(201):
+        page.render_blocks(blocks)
+        run_loop(app, lambda: False, 0.02)
+        saver.show_media(video)
+        run_loop(app, lambda: False, 0.02)
+        saver.hide_media()
+        if cycle % 50 == 0:
+            rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+            print(f"  cycle {cycle:3d}: peak RSS {rss:5.0f} MB, fds {handles()}, pooled players {players.size}")
+    page.render_blocks([])
+    page.close()
+    page.deleteLater()
+    app.processEvents()
+
+
+_RSS_PROBE = """
+import resource, sys, time
+sys.path.insert(0, {root!r})
+from PySide6.QtGui import QImageReader
+from kiosk_app.backend.decode import decode_image, scale_image
+started = time.perf_counter()
+for path in {photos!r}:
+    if {mode!r} == "full":
+        image = scale_image(QImageReader(path).read(), 1100)
+    else:
+        image = decode_image(path, 1100)
+elapsed = time.perf_counter() - started
+print(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss, elapsed)
+"""
+
+
+@scenario
+def bench_scaled_decode() -> None:
+    """Peak RSS and CPU time of preparing four 24 MP photos for an 1100 px label."""
+    try:
+        import resource  # noqa: F401
+    except ImportError:
+        print("  skipped: peak RSS needs the resource module (POSIX)")
+        return
+    photos = photo_set()
+    for mode, label in (("full", "full decode + scale"), ("scaled", "QImageReader scaled")):
+        code = _RSS_PROBE.format(root=ROOT, photos=photos, mode=mode)
+        out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+        rss_kb, elapsed = out.stdout.split()
+        print(f"  {label:<20}: peak RSS {int(rss_kb) / 1024:.0f} MB, {float(elapsed) * 1000:.0f}ms")
+
+
+def main(argv: List[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("scenarios", nargs="*", help=", ".join(sorted(SCENARIOS)))
+    args = parser.parse_args(argv)
+    unknown = sorted(set(args.scenarios) - set(SCENARIOS))
+    if unknown:
+        parser.error(f"unknown scenario(s): {', '.join(unknown)}")
+    app = QApplication.instance() or QApplication(sys.argv[:1])  # noqa: F841
+    for name in args.scenarios or sorted(SCENARIOS):
+        print(f"[{name}] {SCENARIOS[name].__doc__}")
+        SCENARIOS[name]()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
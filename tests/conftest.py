@@ -0,0 +1,209 @@
+import functools
+import http.server
+import sys
+import threading
+import time
+import types
+from pathlib import Path
+from urllib.parse import parse_qs, urlsplit
+
+import pytest
+
+
+def _install_qt_stubs():
+    """Provide minimal PySide6 stubs so helper modules can be imported without Qt."""
+    if "PySide6" in sys.modules:
+        return
+
+    def _dummy_class(name, **attrs):
+        def __init__(self, *args, **kwargs):
+            pass
+
+        namespace = {"__init__": __init__, "__module__": name}
+        namespace.update(attrs)
+        return type(name, (), namespace)
+
+    class _FakeQColor:
+        def __init__(self, *args):
+            if len(args) == 1 and isinstance(args[0], str):
+                value = args[0]
+                if value.startswith("#") and len(value) == 7:
+                    self._r = int(value[1:3], 16)
+                    self._g = int(value[3:5], 16)
+                    self._b = int(value[5:7], 16)
+                else:
+                    self._r = self._g = self._b = 0
+            elif len(args) == 3:
+                self._r, self._g, self._b = [int(a) for a in args]
+            else:
+                self._r = self._g = self._b = 0
+
+        def red(self):
+            return self._r
+
+        def green(self):
+            return self._g
+
+        def blue(self):
+            return self._b
+
+        def name(self):
+            return f"#{self._r:02x}{self._g:02x}{self._b:02x}"
+
+    qtwidgets = types.ModuleType("PySide6.QtWidgets")
+    for cls_name in [
+        "QApplication",
+        "QWidget",
+        "QVBoxLayout",
+        "QHBoxLayout",
+        "QLabel",
+        "QPushButton",
+        "QStackedWidget",
+        "QGridLayout",
+        "QSizePolicy",
+        "QFrame",
+        "QScrollArea",
+        "QSpacerItem",
+        "QMenu",
+        "QGraphicsDropShadowEffect",
+        "QInputDialog",
+        "QLineEdit",
+        "QDialog",
+        "QDialogButtonBox",
+        "QCheckBox",
+        "QMessageBox",
+        "QGraphicsBlurEffect",
+        "QGraphicsPathItem",
+        "QGraphicsScene",
+        "QAbstractItemView",
+        "QListView",
+        "QScroller",
+        "QStyle",
+        "QStyledItemDelegate",
+        "QStyleOptionViewItem",
+        "QStackedLayout",
+    ]:
+        setattr(qtwidgets, cls_name, _dummy_class(cls_name))
+    qtwidgets.QDialogButtonBox.Ok = 1
+    qtwidgets.QDialogButtonBox.Cancel = 2
+    qtwidgets.QLineEdit.Normal = 0
+    qtwidgets.QLineEdit.Password = 1
+
+    def _warning_stub(*args, **kwargs):
+        return None
+
+    qtwidgets.QMessageBox.warning = staticmethod(_warning_stub)
+
+    qtcore = types.ModuleType("PySide6.QtCore")
+    qtcore.Qt = types.SimpleNamespace(
+        AlignVCenter=0,
+        AlignCenter=0,
+        AlignRight=0,
+        AlignTop=0,
+        SmoothTransformation=0,
+        KeepAspectRatio=0,
+        PointingHandCursor=0,
+        WA_StyledBackground=0,
+        RichText=0,
+        ScrollBarAlwaysOff=0,
+        DisplayRole=0,
+        UserRole=256,
+    )
+    qtcore.QTimer = _dummy_class("QTimer")
+    qtcore.QSize = _dummy_class("QSize")
+    qtcore.QUrl = _dummy_class("QUrl")
+    qtcore.QEvent = _dummy_class("QEvent")
+    qtcore.QObject = _dummy_class("QObject")
+    qtcore.Signal = _dummy_class("Signal")
+    qtcore.QRect = _dummy_class("QRect")
+    qtcore.QRunnable = _dummy_class("QRunnable")
+    qtcore.QThreadPool = _dummy_class("QThreadPool")
+    qtcore.QRectF = _dummy_class("QRectF")
+    qtcore.QAbstractListModel = _dummy_class("QAbstractListModel")
+    qtcore.QModelIndex = _dummy_class("QModelIndex")
+    qtcore.QPoint = _dummy_class("QPoint")
+
+    qtgui = types.ModuleType("PySide6.QtGui")
+    class _FakeQPixmap:
+        def __init__(self, *args, **kwargs):
+            pass
+
+        @staticmethod
+        def fromImage(image):
+            return _FakeQPixmap()
+
+        def scaled(self, *args, **kwargs):
+            return self
+
+        def scaledToHeight(self, *args, **kwargs):
+            return self
+
+        def scaledToWidth(self, *args, **kwargs):
+            return self
+
+        def isNull(self):
+            return False
+
+    qtgui.QPixmap = _FakeQPixmap
+    qtgui.QColor = _FakeQColor
+    qtgui.QFont = _dummy_class("QFont")
+    qtgui.QImage = _dummy_class("QImage")
+    qtgui.QGuiApplication = _dummy_class("QGuiApplication")
+    qtgui.QDesktopServices = _dummy_class("QDesktopServices")
+    qtgui.QAction = _dummy_class("QAction")
+    qtgui.QMovie = _dummy_class("QMovie")
+    qtgui.QImageIOHandler = _dummy_class("QImageIOHandler")
+    qtgui.QImageReader = _dummy_class("QImageReader")
+    qtgui.QPainter = _dummy_class("QPainter")
+    qtgui.QPainterPath = _dummy_class("QPainterPath")
+
+    qtweb = types.ModuleType("PySide6.QtWebEngineWidgets")
+    qtweb.QWebEngineView = _dummy_class("QWebEngineView")
+
+    sys.modules["PySide6"] = types.ModuleType("PySide6")
+    sys.modules["PySide6.QtWidgets"] = qtwidgets
+    sys.modules["PySide6.QtCore"] = qtcore
+    sys.modules["PySide6.QtGui"] = qtgui
+    sys.modules["PySide6.QtWebEngineWidgets"] = qtweb
+
+
+_install_qt_stubs()
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+
+class _MediaHandler(http.server.SimpleHTTPRequestHandler):
+    requests_seen = []
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        type(self).requests_seen.append((self.path, self.headers.get("If-Modified-Since")))
+        delay = parse_qs(urlsplit(self.path).query).get("delay")
+        if delay:
+            time.sleep(float(delay[0]))
+        super().do_GET()
+
+
+@pytest.fixture()
+def media_server(tmp_path):
+    """Serve ``a.jpg``/``b.jpg``/``c.jpg`` (1000 bytes each); ``?delay=s`` slows a reply."""
+    root = tmp_path / "srv"
+    root.mkdir()
+    (root / "a.jpg").write_bytes(b"a" * 1000)
+    (root / "b.jpg").write_bytes(b"b" * 1000)
+    (root / "c.jpg").write_bytes(b"c" * 1000)
+    _MediaHandler.requests_seen = []
+    handler = functools.partial(_MediaHandler, directory=str(root))
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    server.url = f"http://127.0.0.1:{server.server_address[1]}"
+    server.root = root
+    server.requests_seen = _MediaHandler.requests_seen
+    yield server
+    server.shutdown()
+    server.server_close()
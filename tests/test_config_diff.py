@@ -0,0 +1,67 @@
+import copy
+
+from kiosk_app.config_diff import (
+    BACKGROUND,
+    COLORS,
+    FULL,
+    LOGO,
+    ORG_NAME,
+    SCREENSAVER,
+    WEATHER,
+    config_changes,
+    screensaver_playlist,
+)
+
+BASE = {
+    "org_name": "Музей",
+    "footer_qr_text": "https://example.org",
+    "footer_clock_format": "%H:%M",
+    "theme": {"id": 1, "name": "default", "primary": "#2563eb", "bg": "#f5f7fb", "text": "#0f1419"},
+    "screensaver": {"path": "/media/promo.mp4", "timeout": 60},
+    "show_weather": True,
+    "weather_city": "Минск",
+}
+
+
+def _changed(**updates):
+    cfg = copy.deepcopy(BASE)
+    for key, value in updates.items():
+        if key.startswith("theme_"):
+            cfg["theme"][key[len("theme_"):]] = value
+        else:
+            cfg[key] = value
+    return cfg
+
+
+def test_first_config_and_unknown_fields_need_full_build():
+    assert config_changes(None, BASE) == {FULL}
+    assert config_changes(BASE, _changed(new_feature=True)) == {FULL}
+    assert config_changes(BASE, _changed(theme_radius=20)) == {FULL}
+
+
+def test_identical_configs_have_no_changes():
+    assert config_changes(BASE, copy.deepcopy(BASE)) == set()
+
+
+def test_each_field_maps_to_its_aspect():
+    assert config_changes(BASE, _changed(theme_primary="#ff0000")) == {COLORS}
+    assert config_changes(BASE, _changed(theme_bg_image_path="/media/bg.jpg")) == {BACKGROUND}
+    assert config_changes(BASE, _changed(theme_bg_image_fit="contain")) == {BACKGROUND}
+    assert config_changes(BASE, _changed(theme_bg_image_fit="cover")) == set()
+    assert config_changes(BASE, _changed(theme_logo_path="/media/logo.png")) == {LOGO}
+    assert config_changes(BASE, _changed(org_name="Библиотека", weather_city="Гродно")) == {ORG_NAME, WEATHER}
+    assert config_changes(BASE, _changed(screensaver={"path": "/media/promo.mp4", "timeout": "60"})) == set()
+    assert config_changes(BASE, _changed(screensaver={"path": None, "timeout": 60})) == {SCREENSAVER}
+    playlist = {"path": None, "timeout": 60, "items": [{"path": "/media/promo.mp4", "duration": 0}]}
+    assert config_changes(BASE, _changed(screensaver=playlist)) == set()
+    playlist["items"].append({"path": "/media/poster.jpg", "duration": 8})
+    assert config_changes(BASE, _changed(screensaver=playlist)) == {SCREENSAVER}
+
+
+def test_screensaver_playlist_prefers_items_over_legacy_path():
+    assert screensaver_playlist({"path": "/media/promo.mp4"}) == [("/media/promo.mp4", 0)]
+    data = {
+        "path": "/media/promo.mp4",
+        "items": [{"path": "/media/a.jpg", "duration": "8"}, {"path": ""}, {"path": "/media/b.mp4", "duration": -1}],
+    }
+    assert screensaver_playlist(data) == [("/media/a.jpg", 8), ("/media/b.mp4", 0)]
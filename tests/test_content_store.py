@@ -0,0 +1,68 @@
+import requests
+
+from kiosk_app.backend.api import DEFAULT_CONFIG, BackendAPI
+from kiosk_app.backend.store import ContentStore
+
+
+class _FakeResponse:
+    def __init__(self, payload, status=200):
+        self._payload = payload
+        self.ok = status < 400
+        self.status_code = status
+
+    def json(self):
+        return self._payload
+
+
+def test_put_reports_revision_changes(tmp_path):
+    store = ContentStore(str(tmp_path / "content.sqlite3"))
+    assert store.put("config", "", {"org_name": "A"}) is True
+    first = store.revision("config")
+    assert store.put("config", "", {"org_name": "A"}) is False
+    assert store.revision("config") == first
+    assert store.put("config", "", {"org_name": "B"}) is True
+    assert store.get("config") == ({"org_name": "B"}, store.revision("config"))
+    assert store.revision("config") != first
+
+
+def test_store_survives_reopen(tmp_path):
+    path = str(tmp_path / "content.sqlite3")
+    store = ContentStore(path)
+    store.put("page", "about", {"slug": "about", "blocks": []})
+    store.close()
+    assert ContentStore(path).get("page", "about")[0] == {"slug": "about", "blocks": []}
+
+
+def test_backend_falls_back_to_store_when_offline(tmp_path, monkeypatch):
+    api = BackendAPI(store=ContentStore(str(tmp_path / "content.sqlite3")))
+    online = {"org_name": "Музей", "theme": {}}
+    monkeypatch.setattr(requests, "get", lambda *a, **k: _FakeResponse(online))
+    assert api.fetch_config() == online
+
+    def _offline(*args, **kwargs):
+        raise requests.ConnectionError("down")
+
+    monkeypatch.setattr(requests, "get", _offline)
+    assert api.fetch_config() == online
+    assert api.fetch_page("missing") == {"blocks": []}
+
+
+def test_error_responses_are_not_stored(tmp_path, monkeypatch):
+    api = BackendAPI(store=ContentStore(str(tmp_path / "content.sqlite3")))
+    monkeypatch.setattr(requests, "get", lambda *a, **k: _FakeResponse({"detail": "boom"}, status=500))
+    assert api.fetch_config() == DEFAULT_CONFIG
+    assert api.cached_config() is None
+
+
+def test_deleted_page_is_dropped_from_store(tmp_path, monkeypatch):
+    api = BackendAPI(store=ContentStore(str(tmp_path / "content.sqlite3")))
+    page = {"slug": "about", "blocks": [{"kind": "text", "content": {"html": "<p>A</p>"}}]}
+    monkeypatch.setattr(requests, "get", lambda *a, **k: _FakeResponse(page))
+    assert api.fetch_page("about") == page
+
+    monkeypatch.setattr(requests, "get", lambda *a, **k: _FakeResponse({"detail": "boom"}, status=503))
+    assert api.fetch_page("about") == page
+
+    monkeypatch.setattr(requests, "get", lambda *a, **k: _FakeResponse({"detail": "Not found"}, status=404))
+    assert api.fetch_page("about") == {"blocks": []}
+    assert api.cached_page("about") is None
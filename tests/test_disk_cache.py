@@ -0,0 +1,60 @@
+import os
+
+from kiosk_app.backend.cache import DiskCache
+
+
+def test_fetch_commits_complete_files_only(tmp_path, media_server):
+    cache = DiskCache(str(tmp_path / "cache"))
+    path = cache.fetch(f"{media_server.url}/a.jpg")
+    assert path and open(path, "rb").read() == b"a" * 1000
+    assert cache.fetch(f"{media_server.url}/b.jpg", limit_bytes=500) is None
+    assert cache.lookup(f"{media_server.url}/b.jpg") is None
+    assert not [name for name in os.listdir(cache.root) if name.endswith(".part")]
+    assert cache.verify(f"{media_server.url}/a.jpg")
+
+
+def test_lru_eviction_keeps_budget(tmp_path, media_server):
+    cache = DiskCache(str(tmp_path / "cache"), max_bytes=2500)
+    cache.fetch(f"{media_server.url}/a.jpg")
+    cache.fetch(f"{media_server.url}/b.jpg")
+    cache.fetch(f"{media_server.url}/c.jpg")
+    assert cache.total_bytes() <= 2500
+    assert cache.lookup(f"{media_server.url}/a.jpg") is None
+    assert cache.lookup(f"{media_server.url}/c.jpg")
+
+
+def test_stale_entries_are_revalidated_and_served_offline(tmp_path, media_server):
+    cache = DiskCache(str(tmp_path / "cache"), revalidate_after=0)
+    url = f"{media_server.url}/a.jpg"
+    first = cache.fetch(url)
+    assert cache.fetch(url) == first
+    assert media_server.requests_seen[-1][1] is not None
+
+    media_server.shutdown()
+    media_server.server_close()
+    assert cache.fetch(url, timeout=1) == first
+
+
+def test_file_that_cannot_be_removed_keeps_counting_until_it_is_gone(tmp_path, media_server, monkeypatch):
+    cache = DiskCache(str(tmp_path / "cache"), max_bytes=2500)
+    url = f"{media_server.url}/a.jpg"
+    path = cache.fetch(url)
+    real_remove = os.remove
+
+    def locked(target):
+        if target == path:
+            raise PermissionError("in use")
+        real_remove(target)
+
+    monkeypatch.setattr(os, "remove", locked)
+    cache.fetch(f"{media_server.url}/b.jpg")
+    cache.fetch(f"{media_server.url}/c.jpg")
+    # the locked file still takes its share, so b is evicted in its place
+    assert os.path.exists(path) and cache.lookup(url) is None
+    assert cache.lookup(f"{media_server.url}/b.jpg") is None
+    assert cache.total_bytes() == 2000
+
+    monkeypatch.setattr(os, "remove", real_remove)
+    reopened = DiskCache(cache.root, max_bytes=2500)
+    assert not os.path.exists(path)
+    assert reopened.total_bytes() == 1000
@@ -0,0 +1,82 @@
+import threading
+import time
+
+from kiosk_app.backend.cache import DiskCache
+from kiosk_app.backend.downloads import (
+    PRIORITY_PAGE,
+    PRIORITY_PREFETCH,
+    PRIORITY_SCREENSAVER,
+    PRIORITY_VISIBLE,
+    DownloadManager,
+)
+
+
+def _wait_started(job, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not job.started and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert job.started
+
+
+def test_concurrent_requests_share_one_download(tmp_path, media_server):
+    manager = DownloadManager(DiskCache(str(tmp_path / "cache")))
+    url = f"{media_server.url}/a.jpg?delay=0.3"
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(manager.fetch(url))) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(5)
+    assert len(set(results)) == 1 and results[0]
+    assert [path for path, _ in media_server.requests_seen].count("/a.jpg?delay=0.3") == 1
+
+
+def test_queue_is_served_by_priority(tmp_path, media_server):
+    manager = DownloadManager(DiskCache(str(tmp_path / "cache")), max_workers=1)
+    blocker = manager.submit(f"{media_server.url}/a.jpg?delay=0.3", priority=PRIORITY_PAGE)
+    _wait_started(blocker)
+    jobs = [
+        manager.submit(f"{media_server.url}/a.jpg?n=screensaver", priority=PRIORITY_SCREENSAVER),
+        manager.submit(f"{media_server.url}/b.jpg?n=prefetch", priority=PRIORITY_PREFETCH),
+        manager.submit(f"{media_server.url}/c.jpg?n=visible", priority=PRIORITY_VISIBLE),
+    ]
+    for job in jobs:
+        assert job.result(5)
+    order = [path.split("=")[-1] for path, _ in media_server.requests_seen[1:]]
+    assert order == ["visible", "prefetch", "screensaver"]
+
+
+def test_background_downloads_are_throttled(tmp_path, media_server):
+    (media_server.root / "big.bin").write_bytes(b"x" * 60_000)
+    manager = DownloadManager(DiskCache(str(tmp_path / "cache")), background_rate=40_000)
+    progress = []
+
+    started = time.monotonic()
+    path = manager.fetch(f"{media_server.url}/big.bin?1", priority=PRIORITY_VISIBLE)
+    assert path and time.monotonic() - started < 0.4
+
+    started = time.monotonic()
+    job = manager.submit(
+        f"{media_server.url}/big.bin?2",
+        priority=PRIORITY_PREFETCH,
+        on_progress=lambda received, total: progress.append((received, total)),
+    )
+    assert job.result(5)
+    assert time.monotonic() - started >= 0.4
+    assert progress[-1] == (60_000, 60_000)
+
+
+def test_visible_download_starts_while_background_jobs_saturate_the_host(tmp_path, media_server):
+    manager = DownloadManager(DiskCache(str(tmp_path / "cache")), per_host=2)
+    background = [
+        manager.submit(f"{media_server.url}/a.jpg?delay=1&n={idx}", priority=PRIORITY_PREFETCH)
+        for idx in range(3)
+    ]
+    _wait_started(background[0])
+
+    started = time.monotonic()
+    visible = manager.fetch(f"{media_server.url}/b.jpg?n=visible", priority=PRIORITY_VISIBLE)
+    assert visible and time.monotonic() - started < 0.8
+    assert sum(job.started for job in background) == 1
+    for job in background:
+        assert job.result(10)
@@ -0,0 +1,60 @@
+from kiosk_app.idle_mode import IdleMode
+
+
+class _FakeTicks:
+    def __init__(self):
+        self.paused = set()
+        self.intervals = {"poll": 5000}
+
+    def pause(self, *names):
+        self.paused.update(names)
+
+    def resume(self, *names):
+        self.paused.difference_update(names)
+
+    def set_interval(self, name, interval):
+        self.intervals[name] = interval
+
+
+class _FakeWidget:
+    def __init__(self, hidden=False):
+        self.hidden = hidden
+
+    def isHidden(self):
+        return self.hidden
+
+    def hide(self):
+        self.hidden = True
+
+    def show(self):
+        self.hidden = False
+
+
+def test_enter_suspends_visible_widgets_and_jobs_and_exit_restores_them():
+    ticks = _FakeTicks()
+    header, stack = _FakeWidget(), _FakeWidget()
+    widgets = [header, stack]
+    idle = IdleMode(ticks, lambda: widgets, paused=("clock",), slowed={"poll": (5000, 60000)})
+
+    idle.enter()
+    assert idle.active and header.hidden and stack.hidden
+    assert ticks.paused == {"clock"} and ticks.intervals["poll"] == 60000
+
+    rebuilt = _FakeWidget()
+    widgets[0] = rebuilt
+    idle.refresh()
+    assert rebuilt.hidden
+
+    idle.exit()
+    assert not idle.active and idle.entries == 1
+    assert not rebuilt.hidden and not stack.hidden
+    assert ticks.paused == set() and ticks.intervals["poll"] == 5000
+
+
+def test_disabled_idle_mode_does_nothing():
+    ticks = _FakeTicks()
+    widget = _FakeWidget()
+    idle = IdleMode(ticks, lambda: [widget], paused=("clock",))
+    idle.enabled = False
+    idle.enter()
+    assert not idle.active and not widget.hidden and not ticks.paused
@@ -0,0 +1,64 @@
+from PySide6.QtCore import QEvent
+
+from kiosk_app.input_monitor import InputMonitor
+
+
+class _FakeEvent:
+    def __init__(self, kind, pos=None):
+        self.kind = kind
+        self.pos = pos
+
+    def type(self):
+        return self.kind
+
+    def globalPos(self):
+        return self.pos
+
+
+class _FakeWindow:
+    def __init__(self):
+        self.filters = []
+
+    def installEventFilter(self, obj):
+        self.filters.append(obj)
+
+
+def _monitor(monkeypatch, now):
+    for name in ("MouseButtonPress", "KeyPress", "TouchBegin", "TouchUpdate", "TouchEnd", "ContextMenu", "Paint"):
+        monkeypatch.setattr(QEvent, name, name, raising=False)
+    calls = {"input": 0, "menus": []}
+
+    def on_input():
+        calls["input"] += 1
+
+    monitor = InputMonitor(on_input, calls["menus"].append, clock=lambda: now[0])
+    return monitor, calls
+
+
+def test_input_stamps_activity_and_other_events_pass_through(monkeypatch):
+    now = [100.0]
+    monitor, calls = _monitor(monkeypatch, now)
+
+    now[0] = 130.0
+    assert monitor.eventFilter(None, _FakeEvent("Paint")) is False
+    assert monitor.idle_ms() == 30000 and monitor.remaining_ms(60000) == 30000
+
+    assert monitor.eventFilter(None, _FakeEvent("TouchBegin")) is False
+    assert calls["input"] == 1 and monitor.remaining_ms(60000) == 60000
+
+    now[0] = 200.0
+    assert monitor.remaining_ms(60000) == 0
+    assert monitor.callbacks == 2
+
+
+def test_context_menu_is_consumed_and_windows_are_filtered_once(monkeypatch):
+    monitor, calls = _monitor(monkeypatch, [0.0])
+
+    assert monitor.eventFilter(None, _FakeEvent("ContextMenu", pos=(10, 20))) is True
+    assert calls["menus"] == [(10, 20)] and calls["input"] == 0
+
+    window = _FakeWindow()
+    monitor.watch(window)
+    monitor.watch(window)
+    monitor.watch(None)
+    assert window.filters == [monitor]
@@ -0,0 +1,68 @@
+from kiosk_app.ui.page_cache import PageCache
+
+
+class _FakeStack:
+    def __init__(self):
+        self.widgets = []
+
+    def indexOf(self, widget):
+        return self.widgets.index(widget) if widget in self.widgets else -1
+
+    def addWidget(self, widget):
+        self.widgets.append(widget)
+
+    def removeWidget(self, widget):
+        self.widgets.remove(widget)
+
+
+class _FakeView:
+    def __init__(self, cost=0):
+        self.heavy_cost = cost
+        self.released = False
+        self.deleted = False
+
+    def render_blocks(self, blocks):
+        self.released = blocks == []
+
+    def deleteLater(self):
+        self.deleted = True
+
+
+def test_revisit_returns_same_view_until_revision_changes():
+    stack = _FakeStack()
+    cache = PageCache(stack)
+    view = _FakeView()
+    cache.put("about", "r1", view)
+    assert cache.get("about", "r1") is view
+    assert cache.get("about", "r2") is None
+    assert view.released and view.deleted
+    assert stack.widgets == []
+
+
+def test_trim_evicts_least_recent_pages_but_keeps_current():
+    stack = _FakeStack()
+    cache = PageCache(stack, max_pages=2, budget_bytes=100)
+    views = {slug: _FakeView() for slug in ("a", "b", "c")}
+    for slug, view in views.items():
+        cache.put(slug, "r", view)
+    cache.get("a")
+    cache.trim(keep=views["a"])
+    assert cache.get("b") is None and views["b"].deleted
+    assert cache.views() == [views["c"], views["a"]]
+
+    views["a"].heavy_cost = 150
+    cache.trim(keep=views["a"])
+    assert cache.views() == [views["a"]]
+    assert stack.widgets == [views["a"]]
+
+
+def test_full_cache_recycles_its_oldest_page_but_not_the_current_one():
+    stack = _FakeStack()
+    cache = PageCache(stack, max_pages=2)
+    first, second = _FakeView(), _FakeView()
+    cache.put("a", "r", first)
+    assert cache.recycle() is None
+    cache.put("b", "r", second)
+    assert cache.recycle(keep=first) is second
+    assert second.released and not second.deleted
+    assert second in stack.widgets and cache.views() == [first]
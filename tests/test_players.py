@@ -0,0 +1,92 @@
+from kiosk_app.ui.players import PlayerPool
+
+
+class _FakeQtObject:
+    def __init__(self):
+        self.alive = True
+        self.deleted = False
+        self.calls = []
+
+    def objectName(self):
+        if not self.alive:
+            raise RuntimeError("Internal C++ object already deleted.")
+        return ""
+
+    def deleteLater(self):
+        self.deleted = True
+
+    def __getattr__(self, name):
+        return lambda *args: self.calls.append((name, args))
+
+
+class _FakeSignal:
+    def __init__(self):
+        self.handlers = []
+
+    def connect(self, handler):
+        self.handlers.append(handler)
+
+    def disconnect(self, handler):
+        self.handlers.remove(handler)
+
+
+def _factory(created):
+    def make():
+        players = (_FakeQtObject(), _FakeQtObject(), _FakeQtObject())
+        created.append(players)
+        return players
+
+    return make
+
+
+def test_pool_reuses_released_players_and_stays_bounded():
+    created = []
+    pool = PlayerPool(max_size=2, factory=_factory(created))
+    for _ in range(50):
+        first = pool.acquire()
+        second = pool.acquire()
+        assert pool.acquire() is None
+        first.release()
+        second.release()
+    assert len(created) == 2
+    assert pool.size == 2
+    assert ("setParent", (None,)) in created[0][2].calls
+
+
+def test_release_disconnects_handlers_and_steal_revokes_oldest():
+    pool = PlayerPool(max_size=1, factory=_factory([]))
+    revoked = []
+    lease = pool.acquire(on_revoke=lambda: revoked.append(True))
+    signal = _FakeSignal()
+    lease.connect(signal, lambda *_: None)
+
+    stolen = pool.acquire(steal=True)
+    assert revoked == [True]
+    assert signal.handlers == []
+    assert stolen.player is lease.player
+    assert pool.acquire(steal=True) is None
+
+
+def test_players_whose_widget_died_with_its_page_are_replaced():
+    created = []
+    pool = PlayerPool(max_size=1, factory=_factory(created))
+    lease = pool.acquire()
+    lease.widget.alive = False
+
+    replacement = pool.acquire()
+    assert replacement is not None and len(created) == 2
+    assert created[0][0].deleted and created[0][1].deleted
+
+
+def test_steal_prefers_hidden_widgets_and_can_spare_visible_ones():
+    pool = PlayerPool(max_size=2, factory=_factory([]))
+    revoked = []
+    visible = pool.acquire(on_revoke=lambda: revoked.append("visible"))
+    hidden = pool.acquire(on_revoke=lambda: revoked.append("hidden"))
+    visible.widget.isVisible = lambda: True
+    hidden.widget.isVisible = lambda: False
+
+    assert pool.acquire(steal=True, steal_visible=False) is not None
+    assert revoked == ["hidden"]
+    assert pool.acquire(steal=True, steal_visible=False) is None
+    assert revoked == ["hidden"]
@@ -0,0 +1,44 @@
+from kiosk_app.ui.reconcile import Reconciler
+
+
+def _reconciler(log):
+    return Reconciler(
+        lambda item: item["id"],
+        lambda item: log.append(("create", item["id"])) or {"item": item},
+        lambda widget, item: log.append(("update", item["id"])) or widget.update(item=item),
+        lambda widget: log.append(("remove", widget["item"]["id"])),
+    )
+
+
+def test_only_changed_items_touch_their_widgets():
+    log = []
+    rec = _reconciler(log)
+    rec.reconcile([{"id": 1, "t": "a"}, {"id": 2, "t": "b"}, {"id": 3, "t": "c"}])
+    first = rec.widgets()
+    log.clear()
+
+    patch = rec.reconcile([{"id": 1, "t": "a"}, {"id": 2, "t": "B"}, {"id": 3, "t": "c"}])
+    assert log == [("update", 2)]
+    assert (patch.created, patch.updated, patch.removed, patch.moved) == (0, 1, 0, False)
+    assert all(a is b for a, b in zip(first, rec.widgets()))
+
+
+def test_reorder_insert_and_remove_report_minimal_patch():
+    log = []
+    rec = _reconciler(log)
+    rec.reconcile([{"id": 1}, {"id": 2}, {"id": 3}])
+    log.clear()
+
+    patch = rec.reconcile([{"id": 4}, {"id": 1}, {"id": 2}])
+    assert sorted(log) == [("create", 4), ("remove", 3)]
+    assert not patch.moved
+    assert rec.reconcile([{"id": 2}, {"id": 4}, {"id": 1}]).moved
+    assert [widget["item"]["id"] for widget in rec.widgets()] == [2, 4, 1]
+
+
+def test_repeated_keys_each_get_a_widget():
+    rec = _reconciler([])
+    rec.reconcile([{"id": None}, {"id": None}])
+    assert len(rec.widgets()) == 2
+    rec.clear()
+    assert rec.widgets() == [] and len(rec) == 0
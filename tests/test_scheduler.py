@@ -0,0 +1,85 @@
+from datetime import datetime, timedelta
+
+from kiosk_app.scheduler import TickSchedule, clock_resolution, next_change
+
+
+class _Clock:
+    def __init__(self):
+        self.ms = 0.0
+        self.start = datetime(2024, 5, 1, 12, 30, 15)
+
+    def monotonic(self):
+        return self.ms / 1000
+
+    def wall(self):
+        return self.start + timedelta(milliseconds=self.ms)
+
+    def advance_to(self, schedule, ms):
+        while True:
+            due = schedule.next_due()
+            if due is None or due > ms:
+                break
+            self.ms = due
+            schedule.run_due()
+        self.ms = ms
+
+
+def test_clock_resolution_follows_the_finest_directive():
+    assert clock_resolution("%H:%M") == 60
+    assert clock_resolution("%H:%M:%S") == 1
+    assert clock_resolution("%d.%m.%Y") == 86400
+    assert clock_resolution("%I %p") == 3600
+    assert next_change(datetime(2024, 5, 1, 12, 30, 15), 60) == datetime(2024, 5, 1, 12, 31)
+
+
+def test_minute_clock_wakes_once_per_minute_at_the_boundary():
+    clock = _Clock()
+    schedule = TickSchedule(clock.monotonic, clock.wall)
+    shown = []
+    schedule.clock("clock", "%H:%M", lambda now: shown.append(now.strftime("%H:%M")))
+    clock.advance_to(schedule, 10 * 60 * 1000)
+    assert shown == ["12:30"] + [f"12:{minute}" for minute in range(31, 41)]
+    assert schedule.stats()["clock"].runs == 11
+
+
+def test_periodic_jobs_join_a_close_wakeup_and_pause():
+    clock = _Clock()
+    schedule = TickSchedule(clock.monotonic, clock.wall)
+    runs = []
+    schedule.every("poll", 5000, lambda: runs.append(("poll", clock.ms)))
+    schedule.once("idle", 4700, lambda: runs.append(("idle", clock.ms)))
+    clock.advance_to(schedule, 4700)
+    assert sorted(runs) == [("idle", 4700), ("poll", 4700)]
+    assert not schedule.has("idle")
+
+    schedule.pause("poll")
+    clock.advance_to(schedule, 60000)
+    assert len(runs) == 2
+    schedule.resume("poll")
+    assert schedule.next_due() <= 65000
+
+
+def test_failing_job_keeps_running_unless_its_owner_is_gone(monkeypatch):
+    from kiosk_app import scheduler
+
+    clock = _Clock()
+    schedule = TickSchedule(clock.monotonic, clock.wall)
+    runs = []
+
+    class _Owner:
+        deleted = False
+
+        def poll(self):
+            runs.append("poll")
+            raise RuntimeError("backend hiccup")
+
+    owner = _Owner()
+    monkeypatch.setattr(scheduler, "_owner_deleted", lambda callback: callback.__self__.deleted)
+    schedule.every("poll", 1000, owner.poll)
+    clock.advance_to(schedule, 3000)
+    assert runs == ["poll"] * 3 and schedule.has("poll")
+    assert schedule.stats()["poll"].errors == 3
+
+    owner.deleted = True
+    clock.advance_to(schedule, 4000)
+    assert not schedule.has("poll")
@@ -0,0 +1,118 @@
+from kiosk_app.ui.players import PlayerPool
+from kiosk_app.ui.screensaver import DEFAULT_SLIDE_SECONDS, ScreensaverLayer, _Slide
+
+
+class _FakeSignal:
+    def __init__(self):
+        self.handlers = []
+
+    def connect(self, handler):
+        self.handlers.append(handler)
+
+    def disconnect(self, handler):
+        self.handlers.remove(handler)
+
+    def emit(self, *args):
+        for handler in list(self.handlers):
+            handler(*args)
+
+
+class _FakePlayer:
+    class MediaStatus:
+        LoadedMedia = "loaded"
+        EndOfMedia = "end"
+        InvalidMedia = "invalid"
+
+    def __init__(self, status="loaded"):
+        self.status = status
+        self.mediaStatusChanged = _FakeSignal()
+        self.errorOccurred = _FakeSignal()
+
+    def mediaStatus(self):
+        return self.status
+
+    def objectName(self):
+        return ""
+
+    def __getattr__(self, name):
+        return lambda *args: None
+
+
+class _FakeTimer:
+    def __init__(self):
+        self.started = []
+
+    def start(self, ms):
+        self.started.append(ms)
+
+    def stop(self):
+        pass
+
+
+def _rotation(player):
+    """A screensaver playing *player* as a video item without a duration in a two-item playlist."""
+    layer = object.__new__(ScreensaverLayer)
+    layer._playlist = [("/media/broken.mp4", 0), ("/media/next.jpg", 0)]
+    layer._advance_timer = _FakeTimer()
+    layer.advanced = 0
+
+    def _advance():
+        layer.advanced += 1
+        layer._current = None
+
+    layer._advance = _advance
+    pool = PlayerPool(max_size=1, factory=lambda: (player, _FakePlayer(), _FakePlayer()))
+    slide = _Slide("/media/broken.mp4", 0, None)
+    slide.video = True
+    slide.lease = pool.acquire()
+    layer._current = slide
+    layer._arm(slide)
+    return layer, slide
+
+
+def test_failing_video_moves_the_rotation_on():
+    player = _FakePlayer()
+    layer, _ = _rotation(player)
+    assert layer._advance_timer.started == []
+    player.errorOccurred.emit("ResourceError", "404")
+    assert layer.advanced == 1
+    # the status change that follows the error is for a slide no longer shown
+    player.mediaStatusChanged.emit(_FakePlayer.MediaStatus.InvalidMedia)
+    assert layer.advanced == 1
+
+    player = _FakePlayer()
+    layer, _ = _rotation(player)
+    player.mediaStatusChanged.emit(_FakePlayer.MediaStatus.InvalidMedia)
+    assert layer.advanced == 1
+
+
+def test_video_already_invalid_when_shown_falls_back_to_the_slide_timer():
+    layer, slide = _rotation(_FakePlayer(status="invalid"))
+    assert layer._advance_timer.started == [DEFAULT_SLIDE_SECONDS * 1000]
+    assert slide.lease.player.errorOccurred.handlers == []
+
+
+class _FakeWidget:
+    def layout(self):
+        return self
+
+    def __getattr__(self, name):
+        return lambda *args: None
+
+
+def test_unprepare_gives_a_hidden_pre_roll_back_to_the_pool():
+    pool = PlayerPool(max_size=1, factory=lambda: (_FakePlayer(), _FakePlayer(), _FakePlayer()))
+    layer = object.__new__(ScreensaverLayer)
+    layer._advance_timer = _FakeTimer()
+    layer._stack = _FakeWidget()
+    layer._next = None
+    layer._index = 1
+    layer.isVisible = lambda: False
+    slide = _Slide("/media/intro.mp4", 0, _FakeWidget())
+    slide.lease = pool.acquire()
+    layer._current = slide
+    assert layer.prepared and pool.acquire() is None
+
+    layer.unprepare()
+    assert not layer.prepared and layer._index == 0
+    assert pool.acquire() is not None
@@ -0,0 +1,40 @@
+from kiosk_app.ui.styles import StyleRegistry, button_shades, qss_value
+
+
+def test_register_adds_rules_once_per_colour():
+    registry = StyleRegistry()
+
+    assert registry.register(bg="#2563EB", fg="#ffffff") is True
+    assert registry.register(bg="#2563eb", fg="#ffffff") is False
+
+    sheet = registry.stylesheet()
+    hover, pressed = button_shades("#2563eb")
+    assert 'QPushButton[tileVariant][bgColor="#2563eb"] { background: #2563eb; }' in sheet
+    assert f'QPushButton[tileVariant][bgColor="#2563eb"]:hover {{ background: {hover}; }}' in sheet
+    assert f'QPushButton[tileVariant][bgColor="#2563eb"]:pressed {{ background: {pressed}; }}' in sheet
+    assert '*[fgColor="#ffffff"] { color: #ffffff; }' in sheet
+    assert sheet.count('bgColor="#2563eb"]') == 3
+
+
+def test_variants_share_one_sheet():
+    registry = StyleRegistry()
+    registry.register(bg="#16a34a")
+
+    sheet = registry.stylesheet()
+    assert 'QPushButton[tileVariant="tile"]' in sheet
+    assert 'QPushButton[tileVariant="drop"]' in sheet
+    assert sheet.index('bgColor="#16a34a"') < sheet.index(":disabled")
+
+
+def test_qss_value_cannot_break_out_of_selector():
+    assert qss_value('#FFF"] * { color: red; }') == "#fff]*color:red"
+    assert qss_value("rgba(0, 0, 0, 0.5)") == "rgba(0,0,0,0.5)"
+
+
+def test_button_shades_are_memoized():
+    button_shades.cache_clear()
+    first = button_shades("#dc2626")
+    second = button_shades("#dc2626")
+
+    assert first is second
+    assert button_shades.cache_info().hits == 1
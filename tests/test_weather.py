@@ -0,0 +1,73 @@
+import threading
+import time
+
+from kiosk_app.backend.store import ContentStore
+from kiosk_app.backend.weather import WeatherReading, WeatherService
+
+
+def _collect(service):
+    readings = []
+    event = threading.Event()
+
+    def _listener(reading):
+        readings.append(reading)
+        event.set()
+
+    service.add_listener(_listener)
+    return readings, event
+
+
+class _FakeFetcher:
+    def __init__(self):
+        self.calls = []
+        self.fail = False
+
+    def __call__(self, city):
+        self.calls.append(city)
+        if self.fail:
+            raise ConnectionError("backend unreachable")
+        return WeatherReading("Минск", 3.4, 3, time.time())
+
+
+def test_reading_is_persisted_and_served_after_restart(tmp_path):
+    store = ContentStore(str(tmp_path / "content.sqlite3"))
+    fetcher = _FakeFetcher()
+    service = WeatherService(store, fetcher=fetcher)
+    readings, event = _collect(service)
+    service.set_city("Minsk")
+    assert event.wait(5)
+    service.stop()
+    assert readings[-1].city == "Минск" and readings[-1].temperature == 3.4
+    assert fetcher.calls == ["Minsk"]
+
+    restarted = WeatherService(store, fetcher=fetcher)
+    readings, _ = _collect(restarted)
+    restarted.set_city("Minsk")
+    # served from the store before the worker asks the backend again
+    assert readings and readings[0].temperature == 3.4
+    restarted.refresh_now()
+    deadline = time.monotonic() + 5
+    while len(fetcher.calls) < 2 and time.monotonic() < deadline:
+        time.sleep(0.02)
+    restarted.stop()
+    assert fetcher.calls == ["Minsk", "Minsk"]
+
+
+def test_failures_back_off_and_keep_last_reading(tmp_path):
+    fetcher = _FakeFetcher()
+    service = WeatherService(
+        ContentStore(str(tmp_path / "content.sqlite3")), fetcher=fetcher, retry_after=0.1
+    )
+    readings, event = _collect(service)
+    service.set_city("Minsk")
+    assert event.wait(5)
+    fetcher.fail = True
+    started = time.monotonic()
+    service.refresh_now()
+    while service.failures < 3 and time.monotonic() - started < 5:
+        time.sleep(0.01)
+    elapsed = time.monotonic() - started
+    service.stop()
+    assert service.failures == 3
+    assert elapsed >= 0.3  # waited 0.1s, then 0.2s between the three attempts
+    assert readings[-1] is not None and readings[-1].temperature == 3.4